@@ -0,0 +1,62 @@
+"""Measure import and first-use times of the package in fresh interpreters.
+
+Run from the project root: `python -m scripts.bench_import [runs]`
+"""
+
+import subprocess
+import sys
+
+SEGMENT = (
+    "import json\n"
+    "with open('scripts/test_segment.geojson', encoding='utf-8') as f:\n"
+    "    props = json.load(f)['features'][0]['properties']\n"
+)
+
+CASES = {
+    "import overturetoosm": ("", "import src.overturetoosm"),
+    "process_address": ("", "from src.overturetoosm import process_address"),
+    "import segments": (
+        "import src.overturetoosm.objects",
+        "import src.overturetoosm.segments",
+    ),
+    "segments + validate": (
+        "import src.overturetoosm.objects\n" + SEGMENT,
+        "from src.overturetoosm.segments import SegmentProperties\n"
+        "SegmentProperties(**props)",
+    ),
+}
+"""Each case is timed after its untimed setup code, which imports pydantic and the
+shared models so the numbers isolate the code being measured."""
+
+TIMER = """
+import time
+{setup}
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(setup: str, code: str, runs: int) -> float:
+    """Return the fastest time in milliseconds to run `code` in a new interpreter."""
+    times = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(setup=setup, code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        times.append(float(out.stdout) * 1000)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for label, (setup, code) in CASES.items():
+        print(f"{label:>22}: {measure(setup, code, runs):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
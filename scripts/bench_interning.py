@@ -0,0 +1,114 @@
+"""Measure the memory saved by pooling converted tag strings.
+
+Run from the project root: `python -m scripts.bench_interning [features]`
+"""
+
+import random
+import sys
+import tracemalloc
+from copy import deepcopy
+
+from src.overturetoosm import process_building, process_geojson, process_place
+from src.overturetoosm.interning import tag_pool
+
+CATEGORIES = ["restaurant", "cafe", "bar", "pharmacy", "bank", "dentist", "hotel"]
+DATASETS = ["meta", "Microsoft", "OpenStreetMap"]
+CITIES = [f"City {i}" for i in range(50)]
+
+
+def make_places(count: int) -> dict:
+    """Build a synthetic `place` feature collection."""
+    rand = random.Random(0)
+    features = []
+    for i in range(count):
+        props = {
+            "id": f"{i:032x}",
+            "version": 1,
+            "update_time": "2024-01-01T00:00:00Z",
+            "sources": [
+                {"property": "", "dataset": rand.choice(DATASETS), "confidence": 0.9}
+            ],
+            "names": {"primary": f"Place {i}", "common": None, "rules": None},
+            "categories": {"main": rand.choice(CATEGORIES), "alternate": None},
+            "confidence": 0.9,
+            "phones": [f"+1555{i:07d}"],
+            "addresses": [
+                {
+                    "freeform": f"{i} Main St",
+                    "locality": rand.choice(CITIES),
+                    "postcode": f"{rand.randrange(100):05d}",
+                    "region": "CA",
+                    "country": "US",
+                }
+            ],
+        }
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [0, 0]},
+                "properties": props,
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def make_buildings(count: int) -> dict:
+    """Build a synthetic `building` feature collection."""
+    rand = random.Random(0)
+    features = []
+    for _ in range(count):
+        props = {
+            "version": 1,
+            "has_parts": False,
+            "class": rand.choice(["house", "garage", "apartments", None]),
+            "roof_shape": rand.choice(["flat", "gabled", None]),
+            "sources": [
+                {"property": "", "dataset": rand.choice(DATASETS), "confidence": 0.9}
+            ],
+        }
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [0, 0]},
+                "properties": props,
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def measure(geojson: dict, fx, max_size: int) -> int:
+    """Return the bytes retained by the converted properties."""
+    tag_pool.max_size = max_size
+    data = deepcopy(geojson)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    out = process_geojson(data, fx)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    del out
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    default_size = tag_pool.max_size
+    for label, geojson, fx in [
+        ("place", make_places(count), process_place),
+        ("building", make_buildings(count), process_building),
+    ]:
+        without = measure(geojson, fx, 0)
+        with_pool = measure(geojson, fx, default_size)
+        saved = without - with_pool
+        print(
+            f"{label:>9}: {count} features, {without / 1e6:.2f} MB without pool, "
+            f"{with_pool / 1e6:.2f} MB with pool, saved {saved / 1e6:.2f} MB "
+            f"({saved / without:.0%}), pool size {len(tag_pool)}"
+        )
+    tag_pool.max_size = default_size
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-r"""Convert Overture's `places`, `buildings`, and `addresses` features to OSM tags.
+r"""Convert Overture's `places`, `buildings`, `addresses`, and `segments` to OSM tags.
 
 `overturetoosm` is a Python package to convert objects tagged in the
 Overture schema for use in OSM. Only Overture's `places`, `buildings`,
-and `addresses` layers are currently supported.
+`addresses`, and transportation `segments` layers are currently supported.
 
 Links:
 * [Project GitHub](https://github.com/whubsch/overturetoosm)
@@ -20,16 +20,49 @@ $ python -m overturetoosm place -i boston.geojson --in-place --confidence 0.9
 ```
 """
 
-from . import addresses, buildings, objects, places, resources, segments, utils
-from .addresses import process_address
-from .buildings import process_building
-from .places import process_place
-from .utils import process_geojson
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from . import (
+        access,
+        addresses,
+        buildings,
+        cache,
+        categories,
+        conflate,
+        dedupe,
+        diff,
+        geometry,
+        graph,
+        interning,
+        join,
+        linear,
+        merge,
+        objects,
+        parts,
+        places,
+        resources,
+        restrictions,
+        routes,
+        segments,
+        spatial,
+        tiles,
+        units,
+        utils,
+    )
+    from .addresses import process_address
+    from .buildings import process_building, process_building_part
+    from .places import process_place
+    from .segments import process_segment
+    from .utils import process_geojson
 
 __all__ = [
     "process_place",
     "process_building",
+    "process_building_part",
     "process_address",
+    "process_segment",
     "process_geojson",
     "places",
     "buildings",
@@ -38,4 +71,53 @@ __all__ = [
     "segments",
     "utils",
     "resources",
+    "categories",
+    "cache",
+    "interning",
+    "linear",
+    "graph",
+    "restrictions",
+    "routes",
+    "merge",
+    "access",
+    "units",
+    "geometry",
+    "spatial",
+    "conflate",
+    "join",
+    "tiles",
+    "parts",
+    "dedupe",
+    "diff",
 ]
+
+_FUNCTIONS = {
+    "process_place": "places",
+    "process_building": "buildings",
+    "process_building_part": "buildings",
+    "process_address": "addresses",
+    "process_segment": "segments",
+    "process_geojson": "utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and their functions on first use.
+
+    Importing the package stays cheap, so a worker that only needs
+    `process_address` never builds the `segments` models.
+    """
+    if name in _FUNCTIONS:
+        module = importlib.import_module(f".{_FUNCTIONS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in __all__:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the package's attributes, including those not imported yet."""
+    return sorted({*globals(), *__all__})
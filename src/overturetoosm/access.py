@@ -0,0 +1,123 @@
+"""Translate the access restrictions of transportation segments to OSM tags.
+
+Each Overture access rule is an access type scoped by a `when` condition: travel
+modes, heading, purpose of use, recognized status, vehicle dimensions, and times.
+The same few rules repeat across huge numbers of segments, so each rule is
+reduced to a hashable key and translated once, through a bounded cache.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from .resources import (
+    access_values,
+    purpose_values,
+    recognized_values,
+    travel_mode_keys,
+    vehicle_dimension_keys,
+)
+from .units import normalise_dimension
+
+if TYPE_CHECKING:
+    from .segments import When
+
+VehicleKey = Tuple[str, str, float, Optional[str]]
+WhenKey = Tuple[
+    Optional[str],
+    Tuple[str, ...],
+    Tuple[str, ...],
+    Tuple[str, ...],
+    Tuple[VehicleKey, ...],
+    Optional[str],
+]
+"""The heading, travel modes, purposes of use, recognized statuses, vehicle
+dimensions, and time range of a `when` condition."""
+
+
+def when_key(when: Optional["When"]) -> Optional[WhenKey]:
+    """Return the canonical key of a `when` condition.
+
+    Lists are sorted, so conditions that only differ in order share a key. Returns
+    `None` for times that aren't given as an opening hours string.
+    """
+    if when is None:
+        return (None, (), (), (), (), None)
+    if when.during is not None and not isinstance(when.during, str):
+        return None
+    return (
+        when.heading.value if when.heading else None,
+        tuple(sorted({mode.value for mode in when.mode or []})),
+        tuple(sorted({use.value for use in when.using or []})),
+        tuple(sorted({status.value for status in when.recognized or []})),
+        tuple(
+            sorted(
+                (
+                    item.dimension.value,
+                    item.comparison.value,
+                    item.value,
+                    item.unit.root.value if item.unit else None,
+                )
+                for item in when.vehicle or []
+            )
+        ),
+        when.during,
+    )
+
+
+@lru_cache(maxsize=1024)
+def access_tags(access_type: str, key: WhenKey) -> Tuple[Tuple[str, str], ...]:
+    """Return the OSM tags of an access rule as a tuple of key-value pairs.
+
+    Rules OSM can't express, like access denied for a purpose of use, give no tags.
+    Use `access_tags.cache_info()` to see how often rules were served from the cache.
+
+    Args:
+        access_type (str): The Overture access type.
+        key (WhenKey): The canonical key of the rule's `when` condition, from
+            `when_key`.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: The OSM tags of the rule.
+    """
+    heading, modes, using, recognized, vehicle, during = key
+    value = access_values[access_type]
+    for scope, values in ((using, purpose_values), (recognized, recognized_values)):
+        if scope:
+            if access_type == "denied" or len(scope) > 1 or scope[0] not in values:
+                return ()
+            value = values[scope[0]]
+    if using and recognized:
+        return ()
+
+    mode_keys = [travel_mode_keys[mode] for mode in modes]
+    keys = mode_keys or ["access"]
+    if vehicle:
+        if len(vehicle) > 1 or during or using or recognized:
+            return ()
+        dimension, comparison, amount, unit = vehicle[0]
+        limit = "greater" if access_type == "denied" else "less"
+        if not comparison.startswith(limit):
+            return ()
+        base = vehicle_dimension_keys[dimension]
+        keys = [f"{base}:{mode}" for mode in mode_keys] or [base]
+        value = normalise_dimension(dimension, amount, unit)
+    elif heading and not modes and access_type == "denied" and not during:
+        return (("oneway", "yes" if heading == "backward" else "-1"),)
+
+    suffix = f":{heading}" if heading else ""
+    if during:
+        return tuple(
+            (f"{k}{suffix}:conditional", f"{value} @ ({during})") for k in keys
+        )
+    return tuple((f"{k}{suffix}", value) for k in keys)
+
+
+def add_access_tags(
+    tags: Dict[str, str], new_tags: Tuple[Tuple[str, str], ...]
+) -> None:
+    """Add the tags of an access rule, combining conditional values."""
+    for key, value in new_tags:
+        if key.endswith(":conditional") and key in tags:
+            tags[key] = f"{tags[key]}; {value}"
+        else:
+            tags[key] = value
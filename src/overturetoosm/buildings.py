@@ -2,7 +2,7 @@
 
 from typing import Dict
 
-from .objects import BuildingProps
+from .objects import BuildingPartProps, BuildingProps
 
 
 def process_building(props: dict, confidence: float = 0.0) -> Dict[str, str]:
@@ -21,3 +21,23 @@ def process_building(props: dict, confidence: float = 0.0) -> Dict[str, str]:
             above a feature's confidence.
     """
     return BuildingProps(**props).to_osm(confidence)
+
+
+def process_building_part(props: dict, confidence: float = 0.0) -> Dict[str, str]:
+    """Convert Overture's building part properties to OSM `building:part` tags.
+
+    Use `overturetoosm.parts.PartIndex` to relate the parts to their building.
+
+    Args:
+        props (dict): The feature properties from the Overture GeoJSON.
+        confidence (float, optional): The minimum confidence level. Defaults to 0.0.
+
+    Returns:
+        Dict[str, str]: The reshaped and converted properties in OSM's flat
+            str:str schema.
+
+    Raises:
+        `overturetoosm.objects.ConfidenceError`: Raised if the confidence level is set
+            above a feature's confidence.
+    """
+    return BuildingPartProps(**props).to_osm(confidence)
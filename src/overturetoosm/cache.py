@@ -0,0 +1,257 @@
+"""A persistent on-disk cache of converted features.
+
+Only a small share of features change between Overture releases. Caching the
+converted tags by GERS id and version lets `overturetoosm.process_geojson` skip the
+validation and conversion of every feature that didn't change.
+"""
+
+# ruff: noqa: D415
+
+import hashlib
+import json
+import sqlite3
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from . import resources
+from .__about__ import __version__
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS conversions (
+    id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    options TEXT NOT NULL,
+    tags TEXT,
+    size INTEGER NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (id, version, options)
+);
+CREATE INDEX IF NOT EXISTS conversions_used ON conversions (used);
+"""
+
+
+def _plain(value: Any) -> Any:
+    """Return a JSON-serializable copy of a table in `overturetoosm.resources`."""
+    fingerprint = getattr(value, "fingerprint", None)
+    if fingerprint is not None:
+        return fingerprint
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return value
+
+
+def mapping_hash() -> str:
+    """Return a hash of the package version and every tag mapping.
+
+    The mappings are the public tables of `overturetoosm.resources`, so a cache
+    written with a different hash is discarded when it is opened, and edits to
+    any of them never serve stale tags.
+    """
+    tables = {
+        name: _plain(value)
+        for name, value in vars(resources).items()
+        if not name.startswith("_") and isinstance(value, (Mapping, set, frozenset))
+    }
+    blob = json.dumps([__version__, tables], sort_keys=True)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def _stable(obj: Any) -> Any:
+    """Return a JSON-serializable stand-in for an option value."""
+    fingerprint = getattr(obj, "fingerprint", None)
+    if fingerprint is not None:
+        return fingerprint
+    return repr(obj)
+
+
+def options_key(
+    fx: Callable, confidence: Optional[float] = None, options: Optional[dict] = None
+) -> str:
+    """Return a hash of the converter and its options.
+
+    Option values that aren't JSON serializable are hashed through their
+    `fingerprint` attribute, or their `repr` if they have none.
+    """
+    blob = json.dumps(
+        [f"{fx.__module__}.{fx.__qualname__}", confidence, options or {}],
+        sort_keys=True,
+        default=_stable,
+    )
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+class ConversionCache:
+    """A SQLite-backed cache of converted tags.
+
+    Entries are keyed by the feature's GERS id, its version, and an `options_key`
+    hash of the converter and its options. Features that the converter rejected
+    with a `ConfidenceError` or `UnmatchedError` are cached too, so they are
+    skipped without validation.
+
+    When the stored tags grow past `max_bytes`, the least recently used entries are
+    evicted. Use the cache as a context manager, or call `close`, to save it.
+
+    Example usage:
+    ```python
+    from overturetoosm import process_geojson, process_place
+    from overturetoosm.cache import ConversionCache
+
+    with ConversionCache("places.sqlite") as cache:
+        geojson = process_geojson(contents, process_place, cache=cache)
+    ```
+    Args:
+        path (str): The path to the cache file. It is created if it doesn't exist.
+        max_bytes (int, optional): The maximum size of the stored tags in bytes.
+            Defaults to 1 GB.
+        commit_every (int, optional): How many writes to batch in a transaction.
+            Defaults to 10,000.
+
+    Attributes:
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups not answered from the cache.
+    """
+
+    def __init__(
+        self, path: str, max_bytes: int = 1_000_000_000, commit_every: int = 10_000
+    ) -> None:
+        """@private"""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._pending = 0
+        self._used: List[Tuple[int, str, int, str]] = []
+        self._clock = self._conn.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM conversions"
+        ).fetchone()[0]
+        self._bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM conversions"
+        ).fetchone()[0]
+
+        current = mapping_hash()
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'mapping'"
+        ).fetchone()
+        if row is None or row[0] != current:
+            self.invalidate()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('mapping', ?)", (current,)
+            )
+            self._conn.commit()
+
+    def __enter__(self) -> "ConversionCache":
+        """@private"""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """@private"""
+        self.close()
+
+    def __len__(self) -> int:
+        """@private"""
+        return self._conn.execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
+
+    def get(
+        self, feature_id: str, version: int, key: str
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Look up the converted tags of a feature.
+
+        Args:
+            feature_id (str): The feature's GERS id.
+            version (int): The feature's version.
+            key (str): The `options_key` of the conversion.
+
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]]]: Whether the feature was found,
+                and its tags, which are `None` if the converter rejected it.
+        """
+        row = self._conn.execute(
+            "SELECT tags FROM conversions WHERE id = ? AND version = ? AND options = ?",
+            (feature_id, version, key),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._clock += 1
+        self._used.append((self._clock, feature_id, version, key))
+        self._tick()
+        return True, None if row[0] is None else json.loads(row[0])
+
+    def put(
+        self, feature_id: str, version: int, key: str, tags: Optional[Dict[str, Any]]
+    ) -> None:
+        """Store the converted tags of a feature, or `None` if it was rejected."""
+        blob = None if tags is None else json.dumps(tags, separators=(",", ":"))
+        size = len(feature_id) + len(blob or "")
+        old = self._conn.execute(
+            "SELECT size FROM conversions WHERE id = ? AND version = ? AND options = ?",
+            (feature_id, version, key),
+        ).fetchone()
+        self._clock += 1
+        self._conn.execute(
+            "INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?, ?)",
+            (feature_id, version, key, blob, size, self._clock),
+        )
+        self._bytes += size - (old[0] if old else 0)
+        if self._bytes > self.max_bytes:
+            self._evict()
+        self._tick()
+
+    def _tick(self) -> None:
+        """Commit once enough writes are pending."""
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is 10% under its limit."""
+        self._flush_used()
+        target = self.max_bytes * 0.9
+        while self._bytes > target:
+            rows = self._conn.execute(
+                "SELECT rowid, size FROM conversions ORDER BY used LIMIT 1000"
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                break
+            drop = []
+            for rowid, size in rows:
+                drop.append((rowid,))
+                self._bytes -= size
+                if self._bytes <= target:
+                    break
+            self._conn.executemany("DELETE FROM conversions WHERE rowid = ?", drop)
+
+    def _flush_used(self) -> None:
+        """Write the batched access times of cache hits."""
+        if self._used:
+            self._conn.executemany(
+                "UPDATE conversions SET used = ? "
+                "WHERE id = ? AND version = ? AND options = ?",
+                self._used,
+            )
+            self._used = []
+
+    def commit(self) -> None:
+        """Save pending writes to disk."""
+        self._flush_used()
+        self._conn.commit()
+        self._pending = 0
+
+    def invalidate(self) -> None:
+        """Remove every entry from the cache."""
+        self._used = []
+        self._conn.execute("DELETE FROM conversions")
+        self._conn.commit()
+        self._bytes = 0
+
+    def close(self) -> None:
+        """Save pending writes and close the cache file."""
+        self.commit()
+        self._conn.close()
@@ -0,0 +1,142 @@
+"""Resolve Overture categories to OSM tags through the Overture taxonomy."""
+
+# ruff: noqa: D415
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from .resources import places_tags
+
+
+def parse_taxonomy(lines: Iterable[str]) -> Dict[str, str]:
+    """Parse Overture's category taxonomy into a child to parent mapping.
+
+    Each line follows the format of Overture's `overture_categories.csv`, a category
+    code and its path from the root of the taxonomy, separated by a semicolon:
+    `afghan_restaurant; [eat_and_drink,restaurant,afghan_restaurant]`. Lines that
+    don't follow this format, like the header, are skipped.
+
+    Args:
+        lines (Iterable[str]): The lines of the taxonomy file.
+
+    Returns:
+        Dict[str, str]: A mapping of each category to its parent category.
+    """
+    parents = {}
+    for line in lines:
+        _, sep, path = line.partition(";")
+        path = path.strip()
+        if not sep or not path.startswith("[") or not path.endswith("]"):
+            continue
+        nodes = [node.strip() for node in path[1:-1].split(",") if node.strip()]
+        for parent, child in zip(nodes, nodes[1:]):
+            parents[child] = parent
+    return parents
+
+
+def load_taxonomy(path: str) -> Dict[str, str]:
+    """Load Overture's `overture_categories.csv` file with `parse_taxonomy`."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_taxonomy(f)
+
+
+class CategoryIndex:
+    """A precomputed index from Overture categories to their OSM tags.
+
+    Every category in the tag table or the taxonomy is resolved once, when the index
+    is built, to itself if it has OSM tags or to its nearest ancestor that does.
+    Lookups afterwards are a single dictionary access.
+
+    Args:
+        tags (Mapping[str, Mapping[str, str]]): A mapping of Overture categories to
+            OSM tags, like `overturetoosm.resources.places_tags`.
+        parents (Mapping[str, str], optional): A mapping of each category to its
+            parent category in the Overture taxonomy. See `load_taxonomy`.
+    """
+
+    def __init__(
+        self,
+        tags: Mapping[str, Mapping[str, str]],
+        parents: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """@private"""
+        self.tags = tags
+        self.parents = dict(parents or {})
+        self._nearest: Dict[str, Optional[str]] = {}
+        self._fingerprint: Optional[str] = None
+        for category in self.parents:
+            self._resolve(category)
+
+    @property
+    def fingerprint(self) -> str:
+        """A hash of the tag table and taxonomy, used by `overturetoosm.cache`."""
+        if self._fingerprint is None:
+            table = getattr(self.tags, "fingerprint", None)
+            if table is None:
+                table = {k: dict(v) for k, v in self.tags.items()}
+            blob = json.dumps([table, self.parents], sort_keys=True)
+            self._fingerprint = hashlib.sha1(blob.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def _resolve(self, category: str) -> Optional[str]:
+        """Walk up the taxonomy, memoising every category on the way."""
+        path: List[str] = []
+        nearest: Optional[str] = None
+        node: Optional[str] = category
+        while node is not None:
+            if node in self._nearest:
+                nearest = self._nearest[node]
+                break
+            if node in self.tags:
+                nearest = node
+                break
+            if node in path:
+                break
+            path.append(node)
+            node = self.parents.get(node)
+        for node in path:
+            self._nearest[node] = nearest
+        return nearest
+
+    def nearest(self, category: str) -> Optional[str]:
+        """Return the category itself or its nearest ancestor with OSM tags."""
+        if category in self.tags:
+            return category
+        return self._nearest.get(category)
+
+    def resolve(
+        self, main: str, alternate: Optional[List[str]] = None
+    ) -> Optional[Mapping[str, str]]:
+        """Return the OSM tags for a feature's categories.
+
+        Exact matches are preferred over ancestors, and the main category is
+        preferred over the alternate categories.
+
+        Args:
+            main (str): The main Overture category.
+            alternate (List[str], optional): The alternate Overture categories.
+
+        Returns:
+            Optional[Mapping[str, str]]: The shared, read-only OSM tags, or `None`
+                if neither the categories nor their ancestors have OSM tags.
+        """
+        candidates = [main, *(alternate or [])]
+        for category in candidates:
+            if category in self.tags:
+                return self.tags[category]
+        for category in candidates:
+            nearest = self._nearest.get(category)
+            if nearest:
+                return self.tags[nearest]
+        return None
+
+
+@lru_cache(maxsize=1)
+def default_index() -> CategoryIndex:
+    """Return the index over `overturetoosm.resources.places_tags`.
+
+    It is built on first use and shared for the rest of the run.
+    """
+    return CategoryIndex(places_tags)
@@ -2,11 +2,68 @@
 
 import argparse
 import json
+import os
+import re
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-from . import process_address, process_building, process_geojson, process_place
+from . import process_geojson
 
+if TYPE_CHECKING:
+    from .cache import ConversionCache
+    from .diff import ReleaseDiff
+    from .parts import PartIndex
+    from .spatial import Envelope, PreparedPolygon
 
-def main():
+
+def print_stats(cache: "Optional[ConversionCache]") -> None:
+    """Print the hit rates of the caches used during conversion to stderr."""
+    from .access import access_tags
+    from .interning import tag_pool
+    from .segments import segment_tags
+
+    counts = [("string pool", tag_pool.hits, tag_pool.misses)]
+    if cache is not None:
+        counts.append(("conversion cache", cache.hits, cache.misses))
+    for name, fx in (("segment tags", segment_tags), ("access rules", access_tags)):
+        info = fx.cache_info()
+        counts.append((name, info.hits, info.misses))
+    for name, hits, misses in counts:
+        rate = hits / (hits + misses) if hits + misses else 0.0
+        print(f"{name}: {hits} hits, {misses} misses ({rate:.0%})", file=sys.stderr)
+
+
+def file_key(path: Optional[str]) -> Optional[list]:
+    """Return the path, size, and modification time of a file, to detect edits."""
+    if not path:
+        return None
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+
+def parse_bbox(value: str) -> "Envelope":
+    """Parse a `west,south,east,north` bounding box argument."""
+    try:
+        west, south, east, north = (float(part) for part in value.split(","))
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(
+            f"expected `west,south,east,north`, got {value!r}"
+        ) from err
+    return west, south, east, north
+
+
+def _write_json(path: str, contents: dict, indent: Optional[int] = 4) -> None:
+    """Write a dictionary to a JSON file."""
+    with open(path, "w+", encoding="utf-8") as f:
+        json.dump(contents, f, indent=indent)
+
+
+def _stem(path: str) -> str:
+    """Return a path without its `.json` or `.geojson` extension."""
+    return re.sub(r"\.(geo)?json$", "", path)
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """Configure the argument parser for the CLI."""
     parent = argparse.ArgumentParser(add_help=False)
     parent.add_argument(
@@ -20,6 +77,65 @@ def main():
         action="store_true",
         help="Convert the input file in place (overwrites the input file)",
     )
+    parent.add_argument(
+        "--cache",
+        help="Path to a cache file of converted features, reused across runs to "
+        "skip features whose id and version haven't changed",
+    )
+    parent.add_argument(
+        "--cache-size",
+        type=int,
+        default=1000,
+        help="The maximum size of the cache file's contents in MB. Default: 1000",
+    )
+    parent.add_argument(
+        "--bbox",
+        type=parse_bbox,
+        help="Only convert features overlapping a bounding box, given as "
+        "`west,south,east,north`",
+    )
+    parent.add_argument(
+        "--clip",
+        help="Path to a GeoJSON file of polygons. Only features in them are converted",
+    )
+    parent.add_argument(
+        "--precision",
+        type=int,
+        default=7,
+        help="The number of decimal places to round coordinates to, or a negative "
+        "number to keep them unchanged. Default: 7, the precision of OSM",
+    )
+    parent.add_argument(
+        "--tile-zoom",
+        type=int,
+        metavar="Z",
+        help="Write one GeoJSON file per web map tile at this zoom level, with a "
+        "manifest of the tiles, to the directory given by --output",
+    )
+    parent.add_argument(
+        "--tile-naming",
+        choices=["xyz", "quadkey"],
+        default="xyz",
+        help="Whether to name tile files `{z}/{x}/{y}.geojson` or "
+        "`{quadkey}.geojson`. Default: xyz",
+    )
+    parent.add_argument(
+        "--diff",
+        metavar="INDEX",
+        help="Path to the release index of a previous run. Only the features "
+        "created, modified, or deleted since are written, to three files named "
+        "after --output, and features with an unchanged version aren't converted",
+    )
+    parent.add_argument(
+        "--write-index",
+        metavar="INDEX",
+        help="Path to write the release index of this run to, for a later --diff",
+    )
+    parent.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print the hit rates of the conversion caches to stderr",
+    )
 
     parser = argparse.ArgumentParser(
         description="Convert Overture data to the OSM schema in the GeoJSON format."
@@ -46,6 +162,65 @@ def main():
         default="ignore",
         help="How to handle unmatched Overture categories. Default: ignore",
     )
+    place_parser.add_argument(
+        "-t",
+        "--taxonomy",
+        help="Path to Overture's `overture_categories.csv` file, used to fall back "
+        "to the nearest parent category that has OSM tags",
+    )
+    place_parser.add_argument(
+        "--dedupe",
+        nargs="?",
+        type=float,
+        const=50.0,
+        metavar="RADIUS",
+        help="Remove places with a matching name within a radius in meters of a "
+        "place with a higher confidence, before converting them. Default: 50",
+    )
+    place_parser.add_argument(
+        "--dedupe-merge",
+        action="store_true",
+        help="Fill the missing properties of the places kept by --dedupe from the "
+        "duplicates removed",
+    )
+    place_parser.add_argument(
+        "--conflate",
+        help="Path to an OSM extract (GeoJSON, OSM XML, or PBF with `osmium` "
+        "installed) to look for places that already exist in",
+    )
+    place_parser.add_argument(
+        "--conflate-radius",
+        type=float,
+        default=100.0,
+        help="The distance in meters to look for existing places within. Default: 100",
+    )
+    place_parser.add_argument(
+        "--duplicates",
+        choices=["flag", "drop"],
+        default="flag",
+        help="Whether to add a `fixme` tag to places that already exist in the OSM "
+        "extract, or leave them out. Default: flag",
+    )
+    place_parser.add_argument(
+        "--buildings",
+        help="Path to a GeoJSON file of converted buildings to join places to the "
+        "building they are in",
+    )
+    place_parser.add_argument(
+        "--join",
+        choices=["merge", "relation"],
+        default="merge",
+        help="Whether to merge the tags of the only place in a building onto the "
+        "building, or relate each building to the places in it with a `type=site` "
+        "relation. Default: merge",
+    )
+    place_parser.add_argument(
+        "--join-output",
+        help="Path to write the joined buildings to, or with `--join relation`, the "
+        "relations in the OSM JSON format, with the buildings and the way ids they "
+        "refer to written next to them to `{stem}.buildings.geojson`. Required "
+        "with --buildings",
+    )
 
     building_parser = subs.add_parser(
         "building", help="Convert building data", parents=[parent]
@@ -57,6 +232,37 @@ def main():
         default=0.0,
         help="The minimum confidence level. Default: 0.0",
     )
+    building_parser.add_argument(
+        "--clean",
+        nargs="?",
+        type=float,
+        const=0.1,
+        metavar="TOLERANCE",
+        help="Remove duplicate and collinear vertices within a tolerance in meters "
+        "from footprints, and report how many were removed. Default: 0.1",
+    )
+    building_parser.add_argument(
+        "--parts",
+        help="Path to a GeoJSON file of Overture building parts to convert and add "
+        "to the output",
+    )
+    building_parser.add_argument(
+        "--part-relations",
+        help="Path to write `type=building` relations joining each building to its "
+        "parts to, in the OSM JSON format. Requires --parts. Ways are given the ids "
+        "the relations refer to",
+    )
+
+    part_parser = subs.add_parser(
+        "building_part", help="Convert building part data", parents=[parent]
+    )
+    part_parser.add_argument(
+        "-c",
+        "--confidence",
+        type=float,
+        default=0.0,
+        help="The minimum confidence level. Default: 0.0",
+    )
 
     address_parser = subs.add_parser(
         "address", help="Convert address data", parents=[parent]
@@ -67,34 +273,383 @@ def main():
         default="US",
         help="How to handle the `address_levels` field. Default: US",
     )
+    address_parser.add_argument(
+        "--buildings",
+        help="Path to a GeoJSON file of converted buildings to move the tags of "
+        "addresses onto the building they are in",
+    )
+    address_parser.add_argument(
+        "--join-output",
+        help="Path to write the joined buildings to. Addresses that aren't the only "
+        "one in a building are kept in the output. Required with --buildings",
+    )
 
-    args = parser.parse_args()
+    segment_parser = subs.add_parser(
+        "segment", help="Convert transportation segment data", parents=[parent]
+    )
+    segment_parser.add_argument(
+        "--split",
+        action="store_true",
+        help="Split segments into separate ways where their attributes change",
+    )
+    segment_parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Join consecutive segments with the same tags into single ways",
+    )
+    segment_parser.add_argument(
+        "--restrictions",
+        help="Path to write turn restriction relations and their via nodes to, in "
+        "the OSM JSON format. Ways are given the ids the relations refer to",
+    )
+    segment_parser.add_argument(
+        "--routes",
+        help="Path to write route relations to, in the OSM JSON format. Ways are "
+        "given the ids the relations refer to",
+    )
 
-    with open(args.input, "r", encoding="utf-8") as f:
-        contents: dict = json.load(f)
-        geojson = {}
-        if args.fx_type == "place":
-            geojson = process_geojson(
-                contents,
-                process_place,
-                confidence=args.confidence,
-                options={"region_tag": args.region_tag, "unmatched": args.unmatched},
-            )
-        elif args.fx_type == "building":
-            geojson = process_geojson(
-                contents, process_building, confidence=args.confidence
-            )
-        elif args.fx_type == "address":
-            geojson = process_geojson(
-                contents, process_address, options={"style": args.style}
+    return parser
+
+
+def _validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exit with a usage error if the options given can't be combined."""
+    if args.tile_zoom is not None and (args.in_place or not 0 <= args.tile_zoom <= 30):
+        parser.error("--tile-zoom needs --output and a zoom level from 0 to 30")
+    if getattr(args, "part_relations", None) and not args.parts:
+        parser.error("--part-relations requires --parts")
+    if getattr(args, "buildings", None) and not args.join_output:
+        parser.error("--buildings requires --join-output")
+    if args.diff or args.write_index:
+        renumbered = [
+            option
+            for option in ("split", "merge", "restrictions", "routes", "part_relations")
+            if getattr(args, option, None)
+        ]
+        if getattr(args, "buildings", None) and args.join == "relation":
+            renumbered.append("join")
+        if renumbered:
+            option = renumbered[0].replace("_", "-")
+            parser.error(f"--{option} can't be combined with a release index")
+        if args.diff and (args.in_place or args.tile_zoom is not None):
+            parser.error("--diff needs --output and can't be combined with --tile-zoom")
+    if args.fx_type == "segment":
+        chosen = [
+            o for o in ("split", "merge", "restrictions", "routes") if getattr(args, o)
+        ]
+        if (args.split or args.merge) and len(chosen) > 1:
+            parser.error(f"--{chosen[1]} can't be combined with --{chosen[0]}")
+
+
+def _converter(
+    args: argparse.Namespace,
+) -> Tuple[Optional[Callable], Optional[float], dict]:
+    """Return the conversion function, minimum confidence, and options to use."""
+    from . import (
+        process_address,
+        process_building,
+        process_building_part,
+        process_place,
+        process_segment,
+    )
+
+    options: dict = {}
+    if args.fx_type == "place":
+        options = {"region_tag": args.region_tag, "unmatched": args.unmatched}
+        if args.taxonomy:
+            from .categories import CategoryIndex, load_taxonomy
+            from .resources import places_tags
+
+            options["category_index"] = CategoryIndex(
+                places_tags, load_taxonomy(args.taxonomy)
             )
+        return process_place, args.confidence, options
+    if args.fx_type == "building":
+        return process_building, args.confidence, options
+    if args.fx_type == "building_part":
+        return process_building_part, args.confidence, options
+    if args.fx_type == "address":
+        return process_address, None, {"style": args.style}
+    if args.fx_type == "segment":
+        return process_segment, None, options
+    return None, None, options
+
+
+def _load_geojson(
+    path: str, args: argparse.Namespace, clip: "Optional[PreparedPolygon]"
+) -> dict:
+    """Load a GeoJSON file, keeping only the features in `--bbox` and `--clip`."""
+    with open(path, "r", encoding="utf-8") as f:
+        contents: dict = json.load(f)
+    if args.bbox or clip:
+        from .spatial import filter_geojson
+
+        filter_geojson(contents, bbox=args.bbox, clip=clip)
+    return contents
+
+
+def _load_clip(args: argparse.Namespace) -> "Optional[PreparedPolygon]":
+    """Load the polygons given by `--clip`."""
+    if not args.clip:
+        return None
+    from .spatial import PreparedPolygon, clip_geometry
+
+    with open(args.clip, "r", encoding="utf-8") as f:
+        return PreparedPolygon(clip_geometry(json.load(f)))
+
+
+def _release_diff(
+    args: argparse.Namespace,
+    fx: Optional[Callable],
+    confidence: Optional[float],
+    options: dict,
+    precision: Optional[int],
+) -> "Optional[ReleaseDiff]":
+    """Start the diff against `--diff`, keyed on every option that changes output."""
+    if not (args.diff or args.write_index):
+        return None
+    from .cache import mapping_hash, options_key
+    from .diff import ReleaseDiff, ReleaseIndex
+
+    # Every option that changes a feature's output has to be in the key, or
+    # features skipped by version would keep the output of the previous run.
+    output_options = {
+        "options": options,
+        "precision": precision,
+        "clean": getattr(args, "clean", None),
+        "dedupe": getattr(args, "dedupe", None),
+        "dedupe_merge": getattr(args, "dedupe_merge", False),
+        "conflate": file_key(getattr(args, "conflate", None)),
+        "conflate_radius": getattr(args, "conflate_radius", None),
+        "duplicates": getattr(args, "duplicates", None),
+        "buildings": file_key(getattr(args, "buildings", None)),
+        "join": getattr(args, "join", None),
+    }
+    key = ":".join((mapping_hash(), options_key(fx, confidence, output_options)))
+    return ReleaseDiff(ReleaseIndex.load(args.diff) if args.diff else None, key)
+
+
+def _segment_relations(
+    args: argparse.Namespace, contents: dict, relations: Dict[str, list]
+) -> None:
+    """Number the segments' ways and build their restriction and route relations."""
+    from .restrictions import ElementIndex, process_restrictions, via_nodes
+    from .routes import RouteAggregator
+
+    index = ElementIndex.from_geojson(contents)
+    first_id = -1
+    if args.restrictions:
+        restrictions = process_restrictions(contents, index, unresolved="ignore")
+        nodes = via_nodes(contents, restrictions, index)
+        relations[args.restrictions] = nodes + restrictions
+        first_id -= len(restrictions)
+    routes = RouteAggregator()
+    for feature in contents["features"]:
+        way_id = index.way_id(feature["properties"]["id"])
+        if args.routes:
+            routes.add_properties(way_id, feature["properties"])
+        feature["id"] = way_id
+    if args.routes:
+        relations[args.routes] = list(routes.relations(first_id))
+
+
+def _building_parts(
+    contents: dict, parts: dict
+) -> "Tuple[PartIndex, List[Tuple[Optional[str], int]]]":
+    """Number the building and part ways and index the parts by building."""
+    from .parts import PartIndex
+
+    part_index = PartIndex()
+    building_ways = []
+    ways = contents["features"] + parts["features"]
+    for number, feature in enumerate(ways):
+        feature["id"] = -(number + 1)
+    for feature in contents["features"]:
+        building_ways.append((feature["properties"].get("id"), feature["id"]))
+    for feature in parts["features"]:
+        part_index.add_properties(feature["id"], feature["properties"])
+    return part_index, building_ways
+
+
+def _conflate(args: argparse.Namespace, geojson: dict) -> None:
+    """Flag or drop the places that already exist in the `--conflate` extract."""
+    from .conflate import OSMCandidates, conflate_features
+
+    candidates = OSMCandidates.load(args.conflate)
+    geojson["features"] = list(
+        conflate_features(
+            geojson["features"],
+            candidates,
+            radius=args.conflate_radius,
+            duplicates=args.duplicates,
+        )
+    )
+
+
+def _join_buildings(
+    args: argparse.Namespace, geojson: dict, relations: Dict[str, list]
+) -> None:
+    """Join the converted places or addresses to the buildings they are in."""
+    from .join import merge_addresses, merge_points, site_relations
+
+    with open(args.buildings, "r", encoding="utf-8") as f:
+        buildings: dict = json.load(f)
+    if args.fx_type == "address":
+        merged, shared, outside = merge_addresses(geojson, buildings)
+        print(
+            f"Merged {merged} addresses into buildings. Kept {shared} in buildings "
+            f"with a different address and {outside} outside any building.",
+            file=sys.stderr,
+        )
+    elif args.join == "merge":
+        merged = merge_points(geojson, buildings)
+        print(f"Merged {merged} places into buildings.", file=sys.stderr)
+    else:
+        relations[args.join_output] = site_relations(geojson, buildings)
+        _write_json(f"{_stem(args.join_output)}.buildings.geojson", buildings)
+        return
+    _write_json(args.join_output, buildings)
+
+
+def _clean_footprints(geojson: dict, tolerance: float) -> None:
+    """Remove duplicate and collinear vertices from the converted footprints."""
+    from .geometry import clean_geometry
+
+    removed = total = 0
+    for feature in geojson["features"]:
+        counts = clean_geometry(feature["geometry"], tolerance)
+        removed, total = removed + counts[0], total + counts[1]
+    print(f"Removed {removed} of {total} vertices.", file=sys.stderr)
+
+
+def _write_diff(
+    args: argparse.Namespace, diff: "ReleaseDiff", geojson: dict, skipped: int
+) -> bool:
+    """Write the release index and changes, returning whether the diff was written."""
+    changes = diff.compare(geojson)
+    if args.write_index:
+        diff.index.save(args.write_index)
+    if not args.diff:
+        return False
+    stem = _stem(args.output)
+    for change, features in changes.items():
+        collection = {"type": "FeatureCollection", "features": features}
+        _write_json(f"{stem}.{change}.geojson", collection, indent=None)
+    counts = ", ".join(f"{len(v)} {k}" for k, v in changes.items())
+    print(
+        f"Skipped {skipped} features with unchanged versions. Found {counts} features.",
+        file=sys.stderr,
+    )
+    return True
+
+
+def _write_output(args: argparse.Namespace, geojson: dict) -> None:
+    """Write the converted features to tiles, the output file, or the input file."""
+    if args.tile_zoom is not None:
+        from .tiles import TileWriter
+
+        with TileWriter(args.output, args.tile_zoom, args.tile_naming) as writer:
+            for feature in geojson["features"]:
+                writer.write(feature)
+        print(
+            f"Wrote {sum(writer.counts.values())} features to {len(writer.counts)} "
+            "tiles.",
+            file=sys.stderr,
+        )
+    else:
+        _write_json(args.input if args.in_place else args.output, geojson)
+
+
+def main():
+    """Run the CLI."""
+    from .interning import tag_pool
+
+    parser = _build_parser()
+    args = parser.parse_args()
+    _validate_args(parser, args)
+    tag_pool.clear()
+    fx, confidence, options = _converter(args)
+
+    cache = None
+    if args.cache:
+        from .cache import ConversionCache
+
+        cache = ConversionCache(args.cache, max_bytes=args.cache_size * 1_000_000)
+    clip = _load_clip(args)
+    contents = _load_geojson(args.input, args, clip)
+    if args.fx_type == "place" and args.dedupe is not None:
+        from .dedupe import dedupe_places
+
+        removed = dedupe_places(contents, radius=args.dedupe, merge=args.dedupe_merge)
+        print(f"Removed {removed} duplicate places.", file=sys.stderr)
+    precision = args.precision if args.precision >= 0 else None
+    diff = _release_diff(args, fx, confidence, options, precision)
+    skipped = diff.skip_unchanged(contents) if diff is not None else 0
+
+    geojson: dict = {}
+    relations: Dict[str, list] = {}
+    if args.fx_type == "segment" and (args.restrictions or args.routes):
+        _segment_relations(args, contents, relations)
+    parts: dict = {}
+    if args.fx_type == "building" and args.parts:
+        parts = _load_geojson(args.parts, args, clip)
+        if diff is not None:
+            skipped += diff.skip_unchanged(parts)
+        if args.part_relations:
+            part_index, building_ways = _building_parts(contents, parts)
+    if args.fx_type == "segment" and (args.split or args.merge):
+        from .utils import quantize_geometry
+
+        if args.split:
+            from .linear import split_geojson as rebuild
+        else:
+            from .merge import merge_geojson as rebuild
+        geojson = rebuild(contents)
+        if precision is not None:
+            for feature in geojson["features"]:
+                quantize_geometry(feature["geometry"], precision)
+    elif fx is not None:
+        geojson = process_geojson(
+            contents,
+            fx,
+            confidence=confidence,
+            options=options,
+            cache=cache,
+            precision=precision,
+        )
+    if parts:
+        from . import process_building_part
+
+        converted = process_geojson(
+            parts,
+            process_building_part,
+            confidence=confidence,
+            cache=cache,
+            precision=precision,
+        )
+        geojson["features"].extend(converted["features"])
+    if cache is not None:
+        cache.close()
+    if args.stats:
+        print_stats(cache)
 
     if not geojson:
         raise ValueError("No features found in the input file.")
 
-    if args.in_place:
-        with open(args.input, "w+", encoding="utf-8") as f:
-            json.dump(geojson, f, indent=4)
-    else:
-        with open(args.output, "w+", encoding="utf-8") as f:
-            json.dump(geojson, f, indent=4)
+    if args.fx_type == "place" and args.conflate:
+        _conflate(args, geojson)
+    if args.fx_type in ("place", "address") and args.buildings:
+        _join_buildings(args, geojson, relations)
+    if args.fx_type == "building" and args.part_relations:
+        kept = {feature["id"] for feature in geojson["features"]}
+        relations[args.part_relations] = list(
+            part_index.relations(building_ways, kept=kept)
+        )
+    if args.fx_type == "building" and args.clean is not None:
+        _clean_footprints(geojson, args.clean)
+
+    for path, elements in relations.items():
+        _write_json(path, {"elements": elements})
+
+    if diff is not None and _write_diff(args, diff, geojson, skipped):
+        return
+    _write_output(args, geojson)
@@ -0,0 +1,324 @@
+"""Find converted places that already exist in OSM.
+
+The OSM features near the area being converted are loaded from a local extract
+(GeoJSON, OSM XML, or, with `osmium` installed, PBF) into a `GridIndex`, keeping
+only their location, normalized names, brand, and kind. Each converted place is
+then compared with the OSM features near it, and likely duplicates are flagged
+for review or dropped.
+"""
+
+# ruff: noqa: D415
+
+import json
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from math import cos, hypot, radians
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+
+from .resources import feature_keys
+from .spatial import GridIndex, feature_envelope
+
+METERS_PER_DEGREE = 111_320
+"""float: The approximate length of a degree of latitude, in meters."""
+
+
+def normalize_name(name: str) -> str:
+    """Return a name in lowercase, without accents, punctuation, or extra spaces."""
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    kept = (
+        char if char.isalnum() else " "
+        for char in decomposed
+        if not unicodedata.combining(char)
+    )
+    return " ".join("".join(kept).split())
+
+
+def names_match(first: str, second: str) -> bool:
+    """Return whether two normalized names are likely the same place's name.
+
+    Names match when they are equal, when one contains the other as whole words,
+    or when most of their words are shared.
+    """
+    if first == second:
+        return True
+    words, other = set(first.split()), set(second.split())
+    if not words or not other:
+        return False
+    if words <= other or other <= words:
+        return True
+    return len(words & other) / len(words | other) >= 0.5
+
+
+def feature_kind(tags: Mapping[str, str]) -> Optional[str]:
+    """Return the main `key=value` tag saying what kind of feature a place is."""
+    for key in sorted(feature_keys & tags.keys()):
+        return f"{key}={tags[key]}"
+    return None
+
+
+class OSMCandidates:
+    """OSM features that converted places could be duplicates of.
+
+    Only features with a name, brand, or kind are kept. Strings are interned, so
+    the many features sharing a kind or brand share one string.
+
+    Args:
+        cell_size (float, optional): The size of the index's grid cells, in
+            degrees. Defaults to 0.001, about 100 meters.
+    """
+
+    def __init__(self, cell_size: float = 0.001) -> None:
+        """@private"""
+        self.index = GridIndex(cell_size)
+        self.ids: List[str] = []
+        self.names: List[Tuple[str, ...]] = []
+        self.kinds: List[Optional[str]] = []
+        self.wikidata: List[Optional[str]] = []
+
+    def add(self, osm_id: str, lon: float, lat: float, tags: Mapping[str, str]) -> None:
+        """Add an OSM feature at a location, if it has tags worth comparing.
+
+        Args:
+            osm_id (str): The OSM type and id, like `node/1`.
+            lon (float): The feature's longitude.
+            lat (float): The feature's latitude.
+            tags (Mapping[str, str]): The feature's OSM tags.
+        """
+        names = tuple(
+            sys.intern(normalize_name(tags[key]))
+            for key in ("name", "brand", "official_name", "alt_name")
+            if tags.get(key)
+        )
+        kind = feature_kind(tags)
+        wikidata = tags.get("brand:wikidata")
+        if not (names or kind or wikidata):
+            return
+        self.index.insert((lon, lat, lon, lat))
+        self.ids.append(osm_id)
+        self.names.append(names)
+        self.kinds.append(sys.intern(kind) if kind else None)
+        self.wikidata.append(sys.intern(wikidata) if wikidata else None)
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self.ids)
+
+    def match(
+        self, lon: float, lat: float, tags: Mapping[str, str], radius: float = 100.0
+    ) -> Optional[str]:
+        """Return the OSM feature a converted place most likely duplicates, if any.
+
+        A candidate within `radius` meters is a duplicate if it has the same brand
+        Wikidata item, or a matching name and either the same kind or a location
+        within a quarter of the radius. The closest duplicate is returned.
+
+        Args:
+            lon (float): The converted place's longitude.
+            lat (float): The converted place's latitude.
+            tags (Mapping[str, str]): The converted place's OSM tags.
+            radius (float, optional): The distance in meters to search within.
+                Defaults to 100.
+
+        Returns:
+            Optional[str]: The OSM type and id of the duplicate, or `None`.
+        """
+        scale = cos(radians(lat))
+        dy = radius / METERS_PER_DEGREE
+        dx = dy / max(scale, 0.01)
+        names = [
+            normalize_name(tags[key]) for key in ("name", "brand") if tags.get(key)
+        ]
+        kind = feature_kind(tags)
+        wikidata = tags.get("brand:wikidata")
+
+        best: Optional[Tuple[float, int]] = None
+        for item in self.index.query((lon - dx, lat - dy, lon + dx, lat + dy)):
+            x, y, _, _ = self.index.envelope(item)
+            distance = hypot((x - lon) * scale, y - lat) * METERS_PER_DEGREE
+            if distance > radius or (best is not None and distance >= best[0]):
+                continue
+            same_brand = wikidata is not None and self.wikidata[item] == wikidata
+            same_name = any(
+                names_match(name, other) for name in names for other in self.names[item]
+            )
+            near = distance <= radius / 4 or (kind and self.kinds[item] == kind)
+            if same_brand or (same_name and near):
+                best = (distance, item)
+        return None if best is None else self.ids[best[1]]
+
+    @classmethod
+    def from_geojson(cls, geojson: dict) -> "OSMCandidates":
+        """Load the candidates from a GeoJSON of OSM features.
+
+        Features are located at the center of their envelope. Their id is taken
+        from the feature's `id`, or the `@id` or `id` property.
+        """
+        candidates = cls()
+        for number, feature in enumerate(geojson["features"]):
+            envelope = feature_envelope(feature)
+            if envelope is None:
+                continue
+            props = feature.get("properties") or {}
+            osm_id = feature.get("id") or props.get("@id") or props.get("id") or number
+            tags = props.get("tags", props)
+            candidates.add(
+                str(osm_id),
+                (envelope[0] + envelope[2]) / 2,
+                (envelope[1] + envelope[3]) / 2,
+                {k: v for k, v in tags.items() if isinstance(v, str)},
+            )
+        return candidates
+
+    @classmethod
+    def from_xml(cls, path: str) -> "OSMCandidates":
+        """Load the candidates from an OSM XML file.
+
+        The file is parsed as a stream, and each element is dropped once it is
+        read, so memory doesn't grow with the size of the file. Node locations are
+        kept in sorted arrays so ways can be located at the average of their nodes.
+        """
+        candidates = cls()
+        node_ids, lons, lats = array("q"), array("d"), array("d")
+        ordered = True
+        tags: Dict[str, str] = {}
+        refs: List[int] = []
+        events = iterparse(path, events=("start", "end"))
+        _, root = next(events)
+        for event, element in events:
+            if event == "start":
+                continue
+            if element.tag == "tag":
+                tags[element.get("k", "")] = element.get("v", "")
+            elif element.tag == "nd":
+                refs.append(int(element.get("ref", 0)))
+            elif element.tag == "node":
+                node_id = int(element.get("id", 0))
+                lon, lat = float(element.get("lon", 0)), float(element.get("lat", 0))
+                ordered = ordered and (not node_ids or node_ids[-1] < node_id)
+                node_ids.append(node_id)
+                lons.append(lon)
+                lats.append(lat)
+                if tags:
+                    candidates.add(f"node/{node_id}", lon, lat, tags)
+            elif element.tag == "way":
+                if not ordered:
+                    node_ids, lons, lats = _sort_nodes(node_ids, lons, lats)
+                    ordered = True
+                located = []
+                for ref in refs:
+                    i = bisect_left(node_ids, ref)
+                    if i < len(node_ids) and node_ids[i] == ref:
+                        located.append(i)
+                if tags and located:
+                    candidates.add(
+                        f"way/{element.get('id')}",
+                        sum(lons[i] for i in located) / len(located),
+                        sum(lats[i] for i in located) / len(located),
+                        tags,
+                    )
+            if element.tag in ("node", "way", "relation"):
+                tags, refs = {}, []
+                # The root keeps every child it has parsed, so clear it too.
+                root.clear()
+        return candidates
+
+    @classmethod
+    def from_pbf(cls, path: str) -> "OSMCandidates":
+        """Load the candidates from an OSM PBF file. Requires `osmium`."""
+        try:
+            import osmium
+        except ImportError as err:
+            raise ImportError(
+                "Reading PBF files requires the `osmium` package. Install it with "
+                "`pip install osmium`, or convert the extract to OSM XML."
+            ) from err
+
+        candidates = cls()
+
+        class Handler(osmium.SimpleHandler):
+            def node(self, node: Any) -> None:
+                if len(node.tags):
+                    tags = {tag.k: tag.v for tag in node.tags}
+                    lon, lat = node.location.lon, node.location.lat
+                    candidates.add(f"node/{node.id}", lon, lat, tags)
+
+            def way(self, way: Any) -> None:
+                located = [n.location for n in way.nodes if n.location.valid()]
+                if len(way.tags) and located:
+                    candidates.add(
+                        f"way/{way.id}",
+                        sum(location.lon for location in located) / len(located),
+                        sum(location.lat for location in located) / len(located),
+                        {tag.k: tag.v for tag in way.tags},
+                    )
+
+        Handler().apply_file(path, locations=True)
+        return candidates
+
+    @classmethod
+    def load(cls, path: str) -> "OSMCandidates":
+        """Load the candidates from a file, choosing the reader by its extension."""
+        if path.endswith(".pbf"):
+            return cls.from_pbf(path)
+        if path.endswith((".osm", ".xml")):
+            return cls.from_xml(path)
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_geojson(json.load(f))
+
+
+def _sort_nodes(
+    node_ids: array, lons: array, lats: array
+) -> Tuple[array, array, array]:
+    """Sort node locations by node id."""
+    order = sorted(range(len(node_ids)), key=node_ids.__getitem__)
+    return (
+        array("q", (node_ids[i] for i in order)),
+        array("d", (lons[i] for i in order)),
+        array("d", (lats[i] for i in order)),
+    )
+
+
+def _location(feature: dict) -> Optional[Tuple[float, float]]:
+    """Return a feature's point, or the center of its envelope."""
+    geometry = feature.get("geometry") or {}
+    if geometry.get("type") == "Point":
+        return geometry["coordinates"][0], geometry["coordinates"][1]
+    envelope = feature_envelope(feature)
+    if envelope is None:
+        return None
+    return (envelope[0] + envelope[2]) / 2, (envelope[1] + envelope[3]) / 2
+
+
+def conflate_features(
+    features: List[dict],
+    candidates: OSMCandidates,
+    radius: float = 100.0,
+    duplicates: str = "flag",
+) -> Iterator[dict]:
+    """Compare converted features with OSM, flagging or dropping likely duplicates.
+
+    Args:
+        features (List[dict]): GeoJSON features with converted OSM tags.
+        candidates (OSMCandidates): The OSM features to compare with.
+        radius (float, optional): The distance in meters to search within.
+            Defaults to 100.
+        duplicates (str, optional): What to do with likely duplicates. The "flag"
+            option adds a `fixme` tag naming the OSM feature, and "drop" leaves
+            them out. Defaults to "flag".
+
+    Yields:
+        dict: The features to keep.
+    """
+    for feature in features:
+        location = _location(feature)
+        match = None
+        if location is not None:
+            match = candidates.match(*location, feature["properties"], radius=radius)
+        if match is None:
+            yield feature
+        elif duplicates == "flag":
+            feature["properties"]["fixme"] = f"possible duplicate of {match}"
+            yield feature
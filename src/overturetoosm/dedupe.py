@@ -0,0 +1,167 @@
+"""Remove near-duplicate Overture places before they are converted.
+
+Overture merges places from several sources, and the same business sometimes
+appears more than once with a slightly different name or location. Places are
+bucketed by the geohash cell they are in and a key taken from their name, so a
+place is only compared with the places in its bucket and the buckets of the
+neighbouring cells with the same key. The work grows linearly with the number of
+places, as long as the cells are small enough that buckets stay small.
+"""
+
+from array import array
+from math import cos, floor, hypot, radians
+from typing import Dict, List, Optional, Tuple
+
+from .conflate import METERS_PER_DEGREE, names_match, normalize_name
+
+ARTICLES = frozenset({"the", "a", "an", "la", "le", "les", "el", "los", "das", "der"})
+"""frozenset: Words skipped when choosing a name's key."""
+
+_FORWARD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def geohash_cell(lon: float, lat: float, precision: int = 7) -> Tuple[int, int]:
+    """Return the column and row of the geohash cell a location is in.
+
+    A geohash of `precision` characters has `5 * precision` bits, split between
+    longitude and latitude, so the cells form a grid of this many columns and rows.
+    """
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    col = floor((lon + 180) / 360 * (1 << lon_bits))
+    row = floor((lat + 90) / 180 * (1 << lat_bits))
+    return min(col, (1 << lon_bits) - 1), min(row, (1 << lat_bits) - 1)
+
+
+def bucket_precision(radius: float, latitude: float = 60.0) -> int:
+    """Return the finest geohash precision with cells at least `radius` meters wide.
+
+    Cells narrow toward the poles, so they are measured at `latitude`, which should
+    be the highest absolute latitude of the places compared.
+    """
+    for precision in range(9, 0, -1):
+        bits = 5 * precision
+        height = 180 / (1 << (bits // 2)) * METERS_PER_DEGREE
+        scale = cos(radians(min(abs(latitude), 90.0)))
+        width = 360 / (1 << ((bits + 1) // 2)) * METERS_PER_DEGREE * scale
+        if min(height, width) >= radius:
+            return precision
+    return 1
+
+
+def name_key(name: str) -> str:
+    """Return the first word of a normalized name that isn't an article."""
+    words = name.split()
+    for word in words:
+        if word not in ARTICLES:
+            return word
+    return words[0] if words else ""
+
+
+def merge_properties(kept: dict, other: dict) -> None:
+    """Fill a place's missing Overture properties from a duplicate, in place.
+
+    The duplicate's sources are added to the kept place's.
+    """
+    for key, value in other.items():
+        if key == "sources":
+            sources = kept.get("sources") or []
+            kept["sources"] = sources + [s for s in value or [] if s not in sources]
+        elif kept.get(key) in (None, [], {}, "") and value not in (None, [], {}, ""):
+            kept[key] = value
+
+
+def _find(parents: array, item: int) -> int:
+    """Return the root of an item's cluster, compressing the path to it."""
+    root = item
+    while parents[root] != root:
+        root = parents[root]
+    while parents[item] != root:
+        parents[item], item = root, parents[item]
+    return root
+
+
+def dedupe_places(
+    geojson: dict,
+    radius: float = 50.0,
+    precision: Optional[int] = None,
+    merge: bool = False,
+) -> int:
+    """Remove the near-duplicate places of an Overture `place` GeoJSON, in place.
+
+    Two places are duplicates when they are within `radius` meters and their
+    primary names match, as in `overturetoosm.conflate.names_match`. Of each group
+    of duplicates, the place with the highest `confidence` is kept.
+
+    Args:
+        geojson (dict): The dictionary representation of the Overture GeoJSON.
+        radius (float, optional): The distance in meters within which places can
+            be duplicates. Defaults to 50.
+        precision (int, optional): The geohash precision of the buckets. Cells
+            must be at least `radius` across. Defaults to `bucket_precision` at
+            the highest absolute latitude of the places.
+        merge (bool, optional): Whether to fill the kept place's missing
+            properties from its duplicates. Defaults to False.
+
+    Returns:
+        int: The number of places removed.
+    """
+    features = geojson["features"]
+    lons = array("d", bytes(8 * len(features)))
+    lats = array("d", lons)
+    names: List[str] = [""] * len(features)
+    points: List[int] = []
+    for number, feature in enumerate(features):
+        geometry = feature.get("geometry") or {}
+        primary = ((feature["properties"].get("names") or {}).get("primary")) or ""
+        name = normalize_name(primary)
+        if geometry.get("type") != "Point" or not name:
+            continue
+        lons[number], lats[number] = geometry["coordinates"][0:2]
+        names[number] = name
+        points.append(number)
+
+    if not precision:
+        highest = max((abs(lat) for lat in lats), default=0.0)
+        precision = bucket_precision(radius, highest)
+    buckets: Dict[Tuple[int, int, str], List[int]] = {}
+    for number in points:
+        name = names[number]
+        col, row = geohash_cell(lons[number], lats[number], precision)
+        buckets.setdefault((col, row, name_key(name)), []).append(number)
+
+    parents = array("I", range(len(features)))
+    for (col, row, key), bucket in buckets.items():
+        for dx, dy in _FORWARD:
+            others = buckets.get((col + dx, row + dy, key))
+            if not others:
+                continue
+            for i, first in enumerate(bucket):
+                lon, lat = lons[first], lats[first]
+                scale = cos(radians(lat))
+                for second in others[i + 1 :] if (dx, dy) == (0, 0) else others:
+                    dlon, dlat = (lons[second] - lon) * scale, lats[second] - lat
+                    distance = hypot(dlon, dlat) * METERS_PER_DEGREE
+                    if distance <= radius and names_match(names[first], names[second]):
+                        parents[_find(parents, second)] = _find(parents, first)
+
+    placed = [number for bucket in buckets.values() for number in bucket]
+    best: Dict[int, Tuple[float, int]] = {}
+    for number in sorted(placed):
+        root = _find(parents, number)
+        confidence = features[number]["properties"].get("confidence") or 0.0
+        if root not in best or confidence > best[root][0]:
+            best[root] = (confidence, number)
+    removed = set()
+    for number in sorted(placed):
+        kept = best[_find(parents, number)][1]
+        if kept != number:
+            removed.add(number)
+            if merge:
+                merge_properties(
+                    features[kept]["properties"], features[number]["properties"]
+                )
+    geojson["features"] = [
+        feature for number, feature in enumerate(features) if number not in removed
+    ]
+    return len(removed)
@@ -0,0 +1,219 @@
+"""Find what changed in the converted output between two Overture releases.
+
+A run writes a compact index of its output: each feature's GERS id and version,
+a hash of its converted tags and geometry, and its location. The next release is
+compared with it. Features whose id and version are in the index are skipped
+before they are validated. The others are converted, and their hashes decide
+whether they were created or modified. The ids missing from the new release
+were deleted. Only the changes have to be reviewed and imported.
+"""
+
+# ruff: noqa: D415
+
+import hashlib
+import json
+from array import array
+from typing import Dict, List, Optional
+
+from .graph import IdTable
+from .spatial import feature_envelope
+
+_FORMAT = 1
+
+
+def feature_digest(feature: dict) -> int:
+    """Return a 64-bit hash of a converted feature's tags and geometry."""
+    blob = json.dumps(
+        [feature.get("properties"), feature.get("geometry")], sort_keys=True
+    )
+    digest = hashlib.blake2b(blob.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class ReleaseIndex:
+    """The id, version, output hash, and location of each feature in a run.
+
+    Ids are packed by an `IdTable`, and the rest is kept in arrays, so an index of
+    tens of millions of features fits in memory.
+
+    Args:
+        key (str, optional): A hash of what else the output depends on, like
+            `overturetoosm.cache.mapping_hash` and the conversion options. Skipping
+            features by version is only safe with the same key. Defaults to "".
+    """
+
+    def __init__(self, key: str = "") -> None:
+        """@private"""
+        self.key = key
+        self.ids = IdTable()
+        self.versions = array("q")
+        self.digests = array("Q")
+        self.lons = array("d")
+        self.lats = array("d")
+
+    def add(
+        self, feature_id: str, version: int, digest: int, lon: float, lat: float
+    ) -> None:
+        """Add a feature to the index, replacing any entry with the same id."""
+        number = self.ids.intern(feature_id)
+        if number < len(self.versions):
+            self.versions[number], self.digests[number] = version, digest
+            self.lons[number], self.lats[number] = lon, lat
+            return
+        self.versions.append(version)
+        self.digests.append(digest)
+        self.lons.append(lon)
+        self.lats.append(lat)
+
+    def add_feature(self, feature_id: str, version: int, feature: dict) -> int:
+        """Add a converted feature to the index, and return its digest."""
+        digest = feature_digest(feature)
+        envelope = feature_envelope(feature) or (0.0, 0.0, 0.0, 0.0)
+        lon, lat = (envelope[0] + envelope[2]) / 2, (envelope[1] + envelope[3]) / 2
+        self.add(feature_id, version, digest, lon, lat)
+        return digest
+
+    def copy_entry(self, other: "ReleaseIndex", number: int) -> None:
+        """Copy an entry of another index into this one."""
+        self.add(
+            other.ids[number],
+            other.versions[number],
+            other.digests[number],
+            other.lons[number],
+            other.lats[number],
+        )
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self.versions)
+
+    def save(self, path: str) -> None:
+        """Write the index to a file: a JSON header, then a line per feature."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"format": _FORMAT, "key": self.key}) + "\n")
+            for number in range(len(self)):
+                f.write(
+                    f"{self.ids[number]}\t{self.versions[number]}\t"
+                    f"{self.digests[number]:016x}\t{self.lons[number]!r}\t"
+                    f"{self.lats[number]!r}\n"
+                )
+
+    @classmethod
+    def load(cls, path: str) -> "ReleaseIndex":
+        """Read an index written by `ReleaseIndex.save`."""
+        with open(path, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("format") != _FORMAT:
+                raise ValueError(f"{path} is not a release index this version reads.")
+            index = cls(header.get("key", ""))
+            for line in f:
+                feature_id, version, digest, lon, lat = line.rstrip("\n").split("\t")
+                index.add(
+                    feature_id, int(version), int(digest, 16), float(lon), float(lat)
+                )
+        return index
+
+
+class ReleaseDiff:
+    """Compare a new release with the index of a previous run.
+
+    Example usage:
+    ```python
+    from overturetoosm import process_geojson, process_place
+    from overturetoosm.diff import ReleaseDiff, ReleaseIndex
+
+    diff = ReleaseDiff(ReleaseIndex.load("previous.idx"))
+    diff.skip_unchanged(contents)
+    changes = diff.compare(process_geojson(contents, process_place))
+    diff.index.save("current.idx")
+    ```
+
+    Args:
+        previous (ReleaseIndex, optional): The index of the previous run. Defaults
+            to none, so every feature is created.
+        key (str, optional): The key of this run. See `ReleaseIndex`. Defaults to
+            "".
+    """
+
+    def __init__(self, previous: Optional[ReleaseIndex] = None, key: str = "") -> None:
+        """@private"""
+        self.previous = previous or ReleaseIndex(key)
+        self.index = ReleaseIndex(key)
+        self._versions: Dict[str, int] = {}
+
+    def skip_unchanged(self, geojson: dict) -> int:
+        """Remove the features whose id and version are in the previous index.
+
+        Their entries are copied to the new index. Each remaining feature's GERS id
+        is copied to its feature `id`, which conversion keeps, so `compare` can
+        match the converted features to their version. Nothing is skipped when the
+        previous index has a different key.
+
+        Args:
+            geojson (dict): The dictionary representation of the Overture GeoJSON,
+                before conversion.
+
+        Returns:
+            int: The number of features skipped.
+        """
+        skip = self.previous.key == self.index.key
+        features = []
+        for feature in geojson["features"]:
+            props = feature["properties"]
+            feature_id, version = props.get("id"), props.get("version")
+            if isinstance(feature_id, str) and isinstance(version, int):
+                number = self.previous.ids.get(feature_id) if skip else None
+                if number is not None and self.previous.versions[number] == version:
+                    self.index.copy_entry(self.previous, number)
+                    continue
+                feature["id"] = feature_id
+                self._versions[feature_id] = version
+            features.append(feature)
+        skipped = len(geojson["features"]) - len(features)
+        geojson["features"] = features
+        return skipped
+
+    def compare(self, geojson: dict) -> Dict[str, List[dict]]:
+        """Sort converted features into those created, modified, and deleted.
+
+        Converted features without a GERS id are always created. Deleted features
+        are points at their previous location with only their `id`.
+
+        Args:
+            geojson (dict): The converted features of the features left by
+                `skip_unchanged`.
+
+        Returns:
+            Dict[str, List[dict]]: The `created`, `modified`, and `deleted` features.
+        """
+        changes: Dict[str, List[dict]] = {"created": [], "modified": [], "deleted": []}
+        for feature in geojson["features"]:
+            feature_id = feature.get("id")
+            version = self._versions.get(feature_id) if feature_id else None
+            if version is None:
+                changes["created"].append(feature)
+                continue
+            digest = self.index.add_feature(feature_id, version, feature)
+            number = self.previous.ids.get(feature_id)
+            if number is None:
+                changes["created"].append(feature)
+            elif self.previous.digests[number] != digest:
+                changes["modified"].append(feature)
+        for number in range(len(self.previous)):
+            feature_id = self.previous.ids[number]
+            if feature_id not in self.index.ids:
+                changes["deleted"].append(
+                    {
+                        "type": "Feature",
+                        "id": feature_id,
+                        "geometry": {
+                            "type": "Point",
+                            "coordinates": [
+                                self.previous.lons[number],
+                                self.previous.lats[number],
+                            ],
+                        },
+                        "properties": {},
+                    }
+                )
+        return changes
@@ -0,0 +1,114 @@
+"""Clean up the rings of polygon geometries.
+
+Footprints extracted by machine learning often repeat vertices or have vertices
+that lie almost on the line between their neighbours. Neither changes the shape,
+but each becomes a node in OSM, so they are removed before output.
+"""
+
+from array import array
+from math import cos, hypot, radians
+from typing import List, Optional, Tuple
+
+Ring = List[List[float]]
+
+METERS_PER_DEGREE = 111_320
+"""float: The approximate length of a degree of latitude, in meters."""
+
+
+def _offset(xs: array, ys: array, i: int, j: int, k: int) -> float:
+    """Return the distance of point `j` from the segment from point `i` to `k`."""
+    dx, dy = xs[k] - xs[i], ys[k] - ys[i]
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else ((xs[j] - xs[i]) * dx + (ys[j] - ys[i]) * dy) / length
+    t = min(1.0, max(0.0, t))
+    return hypot(xs[j] - xs[i] - t * dx, ys[j] - ys[i] - t * dy)
+
+
+def _covers(xs: array, ys: array, i: int, k: int, tolerance: float) -> bool:
+    """Return whether the vertices between `i` and `k` are near the segment.
+
+    The vertices are those after `i` and before `k` going round the ring, so they
+    include the ones already dropped, and the error can't add up along a curve.
+    """
+    j = (i + 1) % len(xs)
+    while j != k:
+        if _offset(xs, ys, i, j, k) > tolerance:
+            return False
+        j = (j + 1) % len(xs)
+    return True
+
+
+def clean_ring(ring: Ring, tolerance: float = 0.1) -> Ring:
+    """Remove duplicate and collinear vertices from a closed ring.
+
+    The ring is projected to approximate meters once, as two arrays of x and y
+    values, and every vertex is checked in one pass over them: a vertex is dropped
+    when it is within `tolerance` of the last kept vertex, and the last kept vertex
+    is dropped when it and every vertex dropped since the one before it are within
+    `tolerance` of the segment from that one to this one. No vertex of the ring is
+    moved more than `tolerance` from the cleaned ring. Rings that would be left
+    with fewer than three distinct vertices are returned unchanged.
+
+    Args:
+        ring (Ring): The positions of a closed ring, with the first repeated last.
+        tolerance (float, optional): The distance in meters within which vertices
+            are removed. Defaults to 0.1.
+
+    Returns:
+        Ring: The cleaned ring, still closed.
+    """
+    points = ring[:-1] if len(ring) > 1 and ring[0] == ring[-1] else ring
+    if len(points) < 4:
+        return ring
+    scale = cos(radians(points[0][1])) * METERS_PER_DEGREE
+    xs = array("d", (point[0] * scale for point in points))
+    ys = array("d", (point[1] * METERS_PER_DEGREE for point in points))
+
+    kept = array("I")
+    for j in range(len(points)):
+        if kept and hypot(xs[j] - xs[kept[-1]], ys[j] - ys[kept[-1]]) <= tolerance:
+            continue
+        while len(kept) >= 2 and _covers(xs, ys, kept[-2], j, tolerance):
+            kept.pop()
+        kept.append(j)
+
+    # The pass can't look past the end of the ring, so check the vertices around
+    # where it closes: the last kept ones against the first, and the first one.
+    while len(kept) >= 3 and _covers(xs, ys, kept[-2], kept[0], tolerance):
+        kept.pop()
+    while len(kept) >= 3 and _covers(xs, ys, kept[-1], kept[1], tolerance):
+        kept.pop(0)
+
+    if len(kept) < 3:
+        return ring
+    cleaned = [points[i] for i in kept]
+    cleaned.append(cleaned[0])
+    return cleaned
+
+
+def clean_geometry(geometry: Optional[dict], tolerance: float = 0.1) -> Tuple[int, int]:
+    """Remove duplicate and collinear vertices from a polygon geometry in place.
+
+    Geometries other than `Polygon` and `MultiPolygon` are left unchanged.
+
+    Args:
+        geometry (dict, optional): A GeoJSON geometry.
+        tolerance (float, optional): The distance in meters within which vertices
+            are removed. Defaults to 0.1.
+
+    Returns:
+        Tuple[int, int]: The number of vertices removed, and the number there were.
+    """
+    if geometry is None or geometry.get("type") not in ("Polygon", "MultiPolygon"):
+        return 0, 0
+    polygons = geometry["coordinates"]
+    if geometry["type"] == "Polygon":
+        polygons = [polygons]
+    removed = total = 0
+    for polygon in polygons:
+        for i, ring in enumerate(polygon):
+            cleaned = clean_ring(ring, tolerance)
+            removed += len(ring) - len(cleaned)
+            total += len(ring)
+            polygon[i] = cleaned
+    return removed, total
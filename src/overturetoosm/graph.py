@@ -0,0 +1,278 @@
+"""Build the network of transportation segments and the connectors joining them.
+
+Each segment lists the connectors it passes through. At national scale there are
+tens of millions of both, so instead of dictionaries of id strings the graph
+interns every id to a dense integer and keeps adjacency in compact arrays, in the
+compressed sparse row (CSR) layout: one array of offsets and one of neighbours
+for each direction.
+"""
+
+# ruff: noqa: D415
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class IdTable:
+    """Intern Overture ids to dense integers, in order of first appearance.
+
+    GERS ids (32 lowercase hexadecimal characters) are packed into one
+    `bytearray`, 16 bytes each, and found through an open-addressing hash table of
+    their integers in an array, so each takes about 24 bytes. Any other id,
+    including one with uppercase digits that wouldn't come back unchanged, is
+    kept as given in a dictionary, with 16 unused bytes in the packed ids.
+    """
+
+    def __init__(self) -> None:
+        """@private"""
+        self._packed = bytearray()
+        self._slots = array("I", bytes(4 * 16))
+        self._used = 0
+        self._others: Dict[str, int] = {}
+        self._other_ids: Dict[int, str] = {}
+
+    @staticmethod
+    def _pack(id_: str) -> Optional[bytes]:
+        """Return the 16 bytes of a GERS id, or `None` for any other id."""
+        if len(id_) == 32:
+            try:
+                key = bytes.fromhex(id_)
+            except ValueError:
+                return None
+            if key.hex() == id_:
+                return key
+        return None
+
+    def _slot(self, key: bytes) -> int:
+        """Return the slot of a packed id, or the empty slot where it would go."""
+        mask = len(self._slots) - 1
+        slot = hash(key) & mask
+        while True:
+            number = self._slots[slot]
+            if not number or self._packed[16 * number - 16 : 16 * number] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow(self) -> None:
+        """Double the hash table, placing every packed id again."""
+        numbers = [number for number in self._slots if number]
+        self._slots = array("I", bytes(8 * len(self._slots)))
+        for number in numbers:
+            key = bytes(self._packed[16 * number - 16 : 16 * number])
+            self._slots[self._slot(key)] = number
+
+    def intern(self, id_: str) -> int:
+        """Return the integer for an id, assigning the next one if it is new."""
+        key = self._pack(id_)
+        if key is None:
+            index = self._others.get(id_)
+            if index is None:
+                index = self._others[id_] = len(self)
+                self._other_ids[index] = id_
+                self._packed.extend(bytes(16))
+            return index
+        slot = self._slot(key)
+        if self._slots[slot]:
+            return self._slots[slot] - 1
+        index = len(self)
+        self._packed.extend(key)
+        self._slots[slot] = index + 1
+        self._used += 1
+        if 2 * self._used > len(self._slots):
+            self._grow()
+        return index
+
+    def get(self, id_: str) -> Optional[int]:
+        """Return the integer for an id, or `None` if it was never interned."""
+        key = self._pack(id_)
+        if key is None:
+            return self._others.get(id_)
+        number = self._slots[self._slot(key)]
+        return number - 1 if number else None
+
+    def __getitem__(self, index: int) -> str:
+        """@private"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        other = self._other_ids.get(index)
+        if other is not None:
+            return other
+        return self._packed[16 * index : 16 * index + 16].hex()
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self._packed) // 16
+
+    def __contains__(self, id_: object) -> bool:
+        """@private"""
+        return isinstance(id_, str) and self.get(id_) is not None
+
+
+def _csr(rows: array, cols: array, size: int) -> Tuple[array, array]:
+    """Group column indices by row with a counting sort, keeping their order."""
+    offsets = array("I", bytes(4 * (size + 1)))
+    for row in rows:
+        offsets[row + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+    fill = array("I", offsets[:-1])
+    values = array("I", bytes(4 * len(cols)))
+    for row, col in zip(rows, cols):
+        values[fill[row]] = col
+        fill[row] += 1
+    return offsets, values
+
+
+class ConnectorGraph:
+    """The connections between transportation segments.
+
+    Build one with `ConnectorGraph.from_geojson` or `GraphBuilder`. Looking up the
+    segments at a connector, or the connectors and neighbours of a segment, costs
+    time proportional to its degree.
+
+    The integer-based methods (`segments_at_index` and `connectors_of_index`) avoid
+    converting ids back to strings, for callers that walk the graph.
+    """
+
+    def __init__(
+        self,
+        segments: IdTable,
+        connectors: IdTable,
+        segment_offsets: array,
+        segment_connectors: array,
+        positions: array,
+    ) -> None:
+        """@private"""
+        self.segments = segments
+        """IdTable: The interned segment ids."""
+        self.connectors = connectors
+        """IdTable: The interned connector ids."""
+        self._segment_offsets = segment_offsets
+        self._segment_connectors = segment_connectors
+        self._positions = positions
+        edge_segments = array("I")
+        for segment in range(len(segments)):
+            count = segment_offsets[segment + 1] - segment_offsets[segment]
+            edge_segments.extend([segment] * count)
+        self._connector_offsets, self._connector_segments = _csr(
+            segment_connectors, edge_segments, len(connectors)
+        )
+
+    @classmethod
+    def from_geojson(cls, geojson: dict) -> "ConnectorGraph":
+        """Build the graph of an Overture `segment` GeoJSON.
+
+        Properties are read directly, without validating the segments.
+        """
+        builder = GraphBuilder()
+        for feature in geojson["features"]:
+            builder.add_properties(feature["properties"])
+        return builder.build()
+
+    def connectors_of_index(self, segment: int) -> array:
+        """Return the connector indices of a segment index, in order along it."""
+        offsets = self._segment_offsets
+        return self._segment_connectors[offsets[segment] : offsets[segment + 1]]
+
+    def positions_of_index(self, segment: int) -> array:
+        """Return where each connector of a segment index lies along it."""
+        offsets = self._segment_offsets
+        return self._positions[offsets[segment] : offsets[segment + 1]]
+
+    def segments_at_index(self, connector: int) -> array:
+        """Return the segment indices at a connector index."""
+        offsets = self._connector_offsets
+        return self._connector_segments[offsets[connector] : offsets[connector + 1]]
+
+    def connectors_of(self, segment_id: str) -> List[str]:
+        """Return the ids of a segment's connectors, in order along it."""
+        segment = self.segments.get(segment_id)
+        if segment is None:
+            return []
+        return [self.connectors[i] for i in self.connectors_of_index(segment)]
+
+    def segments_at(self, connector_id: str) -> List[str]:
+        """Return the ids of the segments at a connector."""
+        connector = self.connectors.get(connector_id)
+        if connector is None:
+            return []
+        return [self.segments[i] for i in self.segments_at_index(connector)]
+
+    def neighbours_of_index(self, segment: int) -> Iterator[int]:
+        """Yield each segment index sharing a connector with a segment index once."""
+        seen = {segment}
+        for connector in self.connectors_of_index(segment):
+            for other in self.segments_at_index(connector):
+                if other not in seen:
+                    seen.add(other)
+                    yield other
+
+    def neighbours(self, segment_id: str) -> List[str]:
+        """Return the ids of the segments sharing a connector with a segment."""
+        segment = self.segments.get(segment_id)
+        if segment is None:
+            return []
+        return [self.segments[i] for i in self.neighbours_of_index(segment)]
+
+    def degree(self, connector_id: str) -> int:
+        """Return the number of segments at a connector."""
+        connector = self.connectors.get(connector_id)
+        if connector is None:
+            return 0
+        offsets = self._connector_offsets
+        return offsets[connector + 1] - offsets[connector]
+
+
+class GraphBuilder:
+    """Collect segments and their connectors, then build a `ConnectorGraph`."""
+
+    def __init__(self) -> None:
+        """@private"""
+        self.segments = IdTable()
+        self.connectors = IdTable()
+        self._edge_segments = array("I")
+        self._edge_connectors = array("I")
+        self._edge_positions = array("d")
+
+    def add(self, segment_id: str, connectors: Iterable[Tuple[str, float]]) -> None:
+        """Add a segment and the connectors it passes through.
+
+        Args:
+            segment_id (str): The segment's id.
+            connectors (Iterable[Tuple[str, float]]): Each connector's id and its
+                position along the segment, from 0 to 1.
+        """
+        segment = self.segments.intern(segment_id)
+        for connector_id, at in sorted(connectors, key=lambda item: item[1]):
+            self._edge_segments.append(segment)
+            self._edge_connectors.append(self.connectors.intern(connector_id))
+            self._edge_positions.append(at)
+
+    def add_properties(self, props: dict) -> None:
+        """Add a segment from its Overture properties.
+
+        Uses `connectors`, or the deprecated `connector_ids` (assumed to be evenly
+        spaced along the segment) when there are none.
+        """
+        connectors = props.get("connectors")
+        if connectors:
+            pairs = [(c["connector_id"], c["at"]) for c in connectors]
+        else:
+            ids = props.get("connector_ids") or []
+            last = max(len(ids) - 1, 1)
+            pairs = [(id_, i / last) for i, id_ in enumerate(ids)]
+        self.add(props["id"], pairs)
+
+    def build(self) -> ConnectorGraph:
+        """Return the graph of everything added so far."""
+        size = len(self.segments)
+        offsets, order = _csr(
+            self._edge_segments, array("I", range(len(self._edge_segments))), size
+        )
+        return ConnectorGraph(
+            self.segments,
+            self.connectors,
+            offsets,
+            array("I", (self._edge_connectors[i] for i in order)),
+            array("d", (self._edge_positions[i] for i in order)),
+        )
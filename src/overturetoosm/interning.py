@@ -0,0 +1,90 @@
+"""A bounded pool of shared strings for converted OSM tags."""
+
+# ruff: noqa: D415
+
+from typing import Any, Dict, FrozenSet
+
+HIGH_CARDINALITY_KEYS: FrozenSet[str] = frozenset(
+    {
+        "name",
+        "phone",
+        "website",
+        "email",
+        "addr:street_address",
+        "addr:housenumber",
+        "contact:facebook",
+        "contact:twitter",
+    }
+)
+"""FrozenSet[str]: OSM keys whose values are nearly always unique and are never
+pooled."""
+
+
+class StringPool:
+    """A size-limited pool of shared strings.
+
+    Converted features repeat the same keys (`addr:postcode`, `source`) and values
+    (`yes`, `restaurant`, the source statement) millions of times, but each feature
+    gets its own copy of every string built at runtime. The pool hands out the first
+    copy it has seen so that retained features share a single object.
+
+    Once the pool is full, unseen strings are returned unchanged rather than added,
+    so memory use is capped no matter how long the run.
+
+    Attributes:
+        max_size (int): The maximum number of strings to hold.
+        max_length (int): Strings longer than this are never pooled.
+        hits (int): The number of lookups answered from the pool.
+        misses (int): The number of lookups not answered from the pool.
+    """
+
+    def __init__(self, max_size: int = 65536, max_length: int = 128) -> None:
+        """@private"""
+        self.max_size = max_size
+        self.max_length = max_length
+        self.hits = 0
+        self.misses = 0
+        self._pool: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self._pool)
+
+    def intern(self, value: str) -> str:
+        """Return the pooled copy of a string, adding it if there is room."""
+        pooled = self._pool.get(value)
+        if pooled is not None:
+            self.hits += 1
+            return pooled
+        self.misses += 1
+        if len(self._pool) < self.max_size and len(value) <= self.max_length:
+            self._pool[value] = value
+        return value
+
+    def intern_tags(self, tags: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the tags with pooled keys and low-cardinality values.
+
+        Values of the keys in `HIGH_CARDINALITY_KEYS` and non-string values are
+        left as they are.
+        """
+        intern = self.intern
+        return {
+            intern(k): (
+                intern(v)
+                if isinstance(v, str) and k not in HIGH_CARDINALITY_KEYS
+                else v
+            )
+            for k, v in tags.items()
+        }
+
+    def clear(self) -> None:
+        """Empty the pool and reset its statistics."""
+        self._pool.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+tag_pool = StringPool()
+"""StringPool: The pool used by the `to_osm` methods and the relation builders. It
+is shared by every conversion in a process, so the features and relations of one
+run share strings, and is cleared at the start of a command line run."""
@@ -0,0 +1,264 @@
+"""Join converted points, like places and addresses, to the buildings they are in.
+
+Overture maps many businesses and addresses as points inside a building footprint,
+where OSM would often tag them on the building itself. The buildings' envelopes
+are put in a `GridIndex`, so each point is only tested against the few buildings
+whose envelope covers it, and the join is one pass over the points with no
+comparisons between every point and every building.
+"""
+
+# ruff: noqa: D415
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .spatial import Envelope, GridIndex, feature_envelope, ring_contains
+
+Ring = Sequence[Sequence[float]]
+
+
+class BuildingIndex:
+    """An index of building footprints for finding the building a point is in.
+
+    The envelope of each ring of a footprint is computed the first time a point is
+    tested against it and kept, so later tests skip the rings, like courtyards,
+    that can't contain the point without looking at their edges.
+
+    Args:
+        buildings (List[dict]): GeoJSON building features. Features without a
+            `Polygon` or `MultiPolygon` geometry are skipped.
+        cell_size (float, optional): The size of the index's grid cells, in
+            degrees. Defaults to 0.001, about 100 meters.
+    """
+
+    def __init__(self, buildings: List[dict], cell_size: float = 0.001) -> None:
+        """@private"""
+        self.buildings = buildings
+        self.index = GridIndex(cell_size)
+        self._numbers: List[int] = []
+        self._rings: Dict[int, List[List[Tuple[Envelope, Ring]]]] = {}
+        for number, feature in enumerate(buildings):
+            geometry = feature.get("geometry") or {}
+            if geometry.get("type") not in ("Polygon", "MultiPolygon"):
+                continue
+            envelope = feature_envelope(feature)
+            if envelope is None:
+                continue
+            self.index.insert(envelope)
+            self._numbers.append(number)
+
+    def _polygons(self, number: int) -> List[List[Tuple[Envelope, Ring]]]:
+        """Return the rings of a building's polygons with their envelopes."""
+        polygons = self._rings.get(number)
+        if polygons is None:
+            geometry = self.buildings[number]["geometry"]
+            coordinates = geometry["coordinates"]
+            if geometry["type"] == "Polygon":
+                coordinates = [coordinates]
+            polygons = self._rings[number] = [
+                [(_ring_envelope(ring), ring) for ring in polygon if ring]
+                for polygon in coordinates
+                if polygon
+            ]
+        return polygons
+
+    def contains(self, number: int, lon: float, lat: float) -> bool:
+        """Return whether a point is inside a building's footprint."""
+        for polygon in self._polygons(number):
+            envelope, outer = polygon[0]
+            if not _in_envelope(envelope, lon, lat):
+                continue
+            if ring_contains(outer, lon, lat) and not any(
+                _in_envelope(hole_envelope, lon, lat) and ring_contains(hole, lon, lat)
+                for hole_envelope, hole in polygon[1:]
+            ):
+                return True
+        return False
+
+    def building_at(self, lon: float, lat: float) -> Optional[int]:
+        """Return the number of the building a point is in, if any.
+
+        A point in more than one building, like one in a building within a
+        courtyard, is in the building with the smallest envelope.
+        """
+        best: Optional[Tuple[float, int]] = None
+        for item in self.index.query((lon, lat, lon, lat)):
+            number = self._numbers[item]
+            if not self.contains(number, lon, lat):
+                continue
+            xmin, ymin, xmax, ymax = self.index.envelope(item)
+            area = (xmax - xmin) * (ymax - ymin)
+            if best is None or area < best[0]:
+                best = (area, number)
+        return None if best is None else best[1]
+
+    def assign(self, points: List[dict]) -> Dict[int, List[int]]:
+        """Group point features by the building they are in.
+
+        Returns:
+            Dict[int, List[int]]: The numbers of the points in each building that
+                has any, by building number.
+        """
+        inside: Dict[int, List[int]] = {}
+        for number, feature in enumerate(points):
+            geometry = feature.get("geometry") or {}
+            if geometry.get("type") != "Point":
+                continue
+            lon, lat = geometry["coordinates"][0], geometry["coordinates"][1]
+            building = self.building_at(lon, lat)
+            if building is not None:
+                inside.setdefault(building, []).append(number)
+        return inside
+
+
+def _ring_envelope(ring: Ring) -> Envelope:
+    """Return the envelope of a ring."""
+    xs = [position[0] for position in ring]
+    ys = [position[1] for position in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _in_envelope(envelope: Envelope, x: float, y: float) -> bool:
+    """Return whether a point is in an envelope."""
+    return envelope[0] <= x <= envelope[2] and envelope[1] <= y <= envelope[3]
+
+
+def merge_tags(building: Dict[str, str], point: Dict[str, str]) -> Dict[str, str]:
+    """Return a building's tags with a point's tags added, keeping the building's."""
+    return {**building, **{k: v for k, v in point.items() if k not in building}}
+
+
+def merge_points(
+    points: dict, buildings: dict, index: Optional[BuildingIndex] = None
+) -> int:
+    """Move the tags of points onto the building they are in, in place.
+
+    Only a building with exactly one point in it gets that point's tags, and the
+    point is removed. Points in buildings with several points, or in none, are
+    kept as they are.
+
+    Args:
+        points (dict): A GeoJSON of converted point features, like places.
+        buildings (dict): A GeoJSON of converted buildings.
+        index (BuildingIndex, optional): An index of the buildings' features.
+            Defaults to a new index of `buildings`.
+
+    Returns:
+        int: The number of points merged into buildings.
+    """
+    index = index or BuildingIndex(buildings["features"])
+    merged = set()
+    for building, numbers in index.assign(points["features"]).items():
+        if len(numbers) != 1:
+            continue
+        feature = buildings["features"][building]
+        point = points["features"][numbers[0]]
+        feature["properties"] = merge_tags(feature["properties"], point["properties"])
+        merged.add(numbers[0])
+    points["features"] = [
+        feature
+        for number, feature in enumerate(points["features"])
+        if number not in merged
+    ]
+    return len(merged)
+
+
+def _address_key(tags: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+    """Return the sorted `addr:*` tags of a feature."""
+    return tuple(sorted((k, v) for k, v in tags.items() if k.startswith("addr:")))
+
+
+def merge_addresses(
+    addresses: dict, buildings: dict, index: Optional[BuildingIndex] = None
+) -> Tuple[int, int, int]:
+    """Move the `addr:*` tags of addresses onto the building they are in, in place.
+
+    A building gets an address when every address in it has the same `addr:*`
+    tags, which usually means there is only one, and none of them conflict with
+    an `addr:*` tag the building already has. Those addresses are removed. The
+    addresses in buildings with several different addresses, and those in no
+    building, are kept as nodes.
+
+    Args:
+        addresses (dict): A GeoJSON of converted addresses.
+        buildings (dict): A GeoJSON of converted buildings.
+        index (BuildingIndex, optional): An index of the buildings' features.
+            Defaults to a new index of `buildings`.
+
+    Returns:
+        Tuple[int, int, int]: The number of addresses merged into buildings, the
+            number kept because their building has a different address too, and
+            the number kept because they are in no building.
+    """
+    index = index or BuildingIndex(buildings["features"])
+    features = addresses["features"]
+    merged = set()
+    shared = 0
+    for building, numbers in index.assign(features).items():
+        tag_sets = {_address_key(features[number]["properties"]) for number in numbers}
+        feature = buildings["features"][building]
+        tags = dict(tag_sets.pop()) if len(tag_sets) == 1 else {}
+        if not tags or any(
+            feature["properties"].get(k, v) != v for k, v in tags.items()
+        ):
+            shared += len(numbers)
+            continue
+        feature["properties"] = merge_tags(feature["properties"], tags)
+        merged.update(numbers)
+    addresses["features"] = [
+        feature for number, feature in enumerate(features) if number not in merged
+    ]
+    return len(merged), shared, len(addresses["features"]) - shared
+
+
+def building_way_id(feature: dict, number: int) -> int:
+    """Return a building's OSM way id: its integer feature id, or `-(number + 1)`."""
+    feature_id = feature.get("id")
+    if isinstance(feature_id, int) and not isinstance(feature_id, bool):
+        return feature_id
+    return -(number + 1)
+
+
+def site_relations(
+    points: dict,
+    buildings: dict,
+    index: Optional[BuildingIndex] = None,
+    first_id: int = -1,
+) -> List[dict]:
+    """Build a `type=site` relation for each building with points in it.
+
+    Each point is given the node id `-(number + 1)` as its feature `id`, and each
+    building its `building_way_id`, so both can be written with the ids the
+    relations refer to.
+
+    Args:
+        points (dict): A GeoJSON of converted point features, like places.
+        buildings (dict): A GeoJSON of converted buildings.
+        index (BuildingIndex, optional): An index of the buildings' features.
+            Defaults to a new index of `buildings`.
+        first_id (int, optional): The id of the first relation. Later relations
+            count down from it. Defaults to -1.
+
+    Returns:
+        List[dict]: The relations in the OSM JSON format, in building order.
+    """
+    index = index or BuildingIndex(buildings["features"])
+    for number, feature in enumerate(points["features"]):
+        feature["id"] = -(number + 1)
+    for number, feature in enumerate(buildings["features"]):
+        feature["id"] = building_way_id(feature, number)
+    relations = []
+    for building, numbers in sorted(index.assign(points["features"]).items()):
+        way_id = buildings["features"][building]["id"]
+        members = [{"type": "way", "ref": way_id, "role": "perimeter"}]
+        members.extend(
+            {"type": "node", "ref": -(number + 1), "role": ""} for number in numbers
+        )
+        relations.append(
+            {
+                "type": "relation",
+                "id": first_id - len(relations),
+                "members": members,
+                "tags": {"type": "site"},
+            }
+        )
+    return relations
@@ -0,0 +1,191 @@
+"""Split transportation segments where their attributes change along the line.
+
+Overture scopes access rules, road surfaces, flags, levels, speed limits, and names
+to part of a segment with linearly referenced `between` ranges. OSM can only
+represent these by splitting the way, so each segment is cut at every range
+boundary and each piece gets the attributes that apply to it.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from math import cos, hypot, radians
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .segments import LinearlyReferencedRange, SegmentProperties
+
+Coordinates = List[List[float]]
+
+
+def cumulative_lengths(coords: Sequence[Sequence[float]]) -> array:
+    """Return the distance along a line at each vertex, in approximate meters.
+
+    Lengths use an equirectangular projection at each edge's mean latitude, which
+    is accurate to well under a percent at the length of a road segment.
+    """
+    lengths = array("d", [0.0])
+    total = 0.0
+    for (x1, y1, *_), (x2, y2, *_) in zip(coords, coords[1:]):
+        scale = cos(radians((y1 + y2) / 2))
+        total += hypot((x2 - x1) * scale, y2 - y1) * 111_320
+        lengths.append(total)
+    return lengths
+
+
+def split_positions(segment: SegmentProperties) -> List[float]:
+    """Return every position strictly inside the segment where an attribute changes.
+
+    Positions are fractions of the segment's length, sorted and deduplicated.
+    """
+    ranges: List[Optional[LinearlyReferencedRange]] = [
+        item.between
+        for items in (
+            segment.access_restrictions,
+            segment.road_surface,
+            segment.road_flags,
+            segment.level_rules,
+            segment.speed_limits,
+            segment.names.rules if segment.names else None,
+        )
+        for item in items or []
+    ]
+    return sorted(
+        {
+            position
+            for between in ranges
+            if between is not None
+            for position in between.root
+            if 0 < position < 1
+        }
+    )
+
+
+def interpolate(
+    coords: Sequence[Sequence[float]], lengths: array, position: float
+) -> List[float]:
+    """Return the point at a fraction of the line's length."""
+    target = position * lengths[-1]
+    index = min(bisect_right(lengths, target), len(lengths) - 1) - 1
+    start, end = coords[index], coords[index + 1]
+    span = lengths[index + 1] - lengths[index]
+    ratio = (target - lengths[index]) / span if span else 0.0
+    return [a + (b - a) * ratio for a, b in zip(start[:2], end[:2])]
+
+
+def cut(
+    coords: Sequence[Sequence[float]], lengths: array, start: float, end: float
+) -> Coordinates:
+    """Return the part of a line between two fractions of its length."""
+    total = lengths[-1]
+    first = bisect_right(lengths, start * total)
+    last = bisect_left(lengths, end * total, lo=first)
+    inner = [list(coord) for coord in coords[first:last]]
+    return [
+        interpolate(coords, lengths, start),
+        *inner,
+        interpolate(coords, lengths, end),
+    ]
+
+
+def _covers(between: Optional[LinearlyReferencedRange], position: float) -> bool:
+    """Return whether a `between` range applies at a position."""
+    return between is None or between.root[0] <= position <= between.root[1]
+
+
+def _scoped(items: Optional[List[Any]], position: float) -> Optional[List[Any]]:
+    """Return the items that apply at a position, rescoped to the whole piece."""
+    if items is None:
+        return None
+    return [
+        item.model_copy(update={"between": None})
+        for item in items
+        if _covers(item.between, position)
+    ]
+
+
+def piece_tags(segment: SegmentProperties, position: float) -> Dict[str, str]:
+    """Return the OSM tags of the piece of a segment around a position."""
+    update: Dict[str, Any] = {
+        "access_restrictions": _scoped(segment.access_restrictions, position),
+        "road_surface": _scoped(segment.road_surface, position),
+        "road_flags": _scoped(segment.road_flags, position),
+        "level_rules": _scoped(segment.level_rules, position),
+        "speed_limits": _scoped(segment.speed_limits, position),
+    }
+    if segment.names:
+        update["names"] = segment.names.model_copy(
+            update={"rules": _scoped(segment.names.rules, position)}
+        )
+    return segment.model_copy(update=update).to_osm()
+
+
+def split_segment(
+    segment: SegmentProperties, coords: Sequence[Sequence[float]]
+) -> List[Tuple[Coordinates, Dict[str, str]]]:
+    """Split a segment into ways with the attributes that apply to each part.
+
+    The cumulative length of the line is computed once, and all the split points
+    are located on it with a binary search. Neighbouring pieces that end up with
+    the same tags are joined back together, so the segment is only split where its
+    OSM tags actually change.
+
+    Args:
+        segment (SegmentProperties): The segment's properties.
+        coords (Sequence[Sequence[float]]): The segment's `LineString` coordinates.
+
+    Returns:
+        List[Tuple[Coordinates, Dict[str, str]]]: The coordinates and OSM tags of
+            each way, in order along the segment.
+    """
+    positions = split_positions(segment)
+    if not positions or len(coords) < 2:
+        return [([list(coord) for coord in coords], segment.to_osm())]
+
+    bounds = [0.0, *positions, 1.0]
+    pieces: List[Tuple[float, float, Dict[str, str]]] = []
+    for start, end in zip(bounds, bounds[1:]):
+        tags = piece_tags(segment, (start + end) / 2)
+        if pieces and pieces[-1][2] == tags:
+            pieces[-1] = (pieces[-1][0], end, tags)
+        else:
+            pieces.append((start, end, tags))
+
+    lengths = cumulative_lengths(coords)
+    if len(pieces) == 1 or not lengths[-1]:
+        return [([list(coord) for coord in coords], pieces[0][2])]
+    return [(cut(coords, lengths, start, end), tags) for start, end, tags in pieces]
+
+
+def split_geojson(geojson: dict) -> dict:
+    """Convert an Overture `segment` GeoJSON, splitting ways where attributes change.
+
+    This is like `overturetoosm.process_geojson` with
+    `overturetoosm.process_segment`, except that each segment becomes one feature
+    for each part of it with different OSM tags. When a feature with a top-level
+    `id` is split, its pieces get the ids `{id}:1`, `{id}:2`, and so on, so ids stay
+    unique.
+
+    Args:
+        geojson (dict): The dictionary representation of the Overture GeoJSON.
+
+    Returns:
+        dict: The dictionary representation of the GeoJSON that follows OSM's schema.
+    """
+    new_features = []
+    for feature in geojson["features"]:
+        segment = SegmentProperties(**feature["properties"])
+        geometry = feature["geometry"]
+        if geometry["type"] != "LineString":
+            new_features.append({**feature, "properties": segment.to_osm()})
+            continue
+        ways = split_segment(segment, geometry["coordinates"])
+        for number, (coords, tags) in enumerate(ways, 1):
+            new_feature = {
+                **feature,
+                "geometry": {"type": "LineString", "coordinates": coords},
+                "properties": tags,
+            }
+            if len(ways) > 1 and "id" in feature:
+                new_feature["id"] = f"{feature['id']}:{number}"
+            new_features.append(new_feature)
+    geojson["features"] = new_features
+    return geojson
@@ -0,0 +1,162 @@
+"""Merge consecutive transportation segments with the same tags into single ways.
+
+Overture splits roads at every connector, so converting each segment to its own
+way gives far more (and far shorter) ways than OSM would have. Where exactly two
+segments meet end to end at a connector and convert to the same tags, nothing
+distinguishes them in OSM, so they are joined into one way.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .graph import ConnectorGraph, GraphBuilder
+from .segments import process_segment
+
+Coordinates = List[List[float]]
+
+
+def is_directional(tags: Dict[str, str]) -> bool:
+    """Return whether a way's tags depend on the direction it is drawn in."""
+    return any(
+        "oneway" in key or "incline" in key or key.endswith((":forward", ":backward"))
+        for key in tags
+    )
+
+
+class _Chains:
+    """Find the chains of segments that can be joined in a connector graph."""
+
+    def __init__(
+        self, graph: ConnectorGraph, tag_ids: List[int], directional: List[bool]
+    ) -> None:
+        self.graph = graph
+        self.tag_ids = tag_ids
+        self.directional = directional
+
+    def end_connector(self, segment: int, end: int) -> Optional[int]:
+        """Return the connector at the start (0) or end (1) of a segment, if any."""
+        connectors = self.graph.connectors_of_index(segment)
+        positions = self.graph.positions_of_index(segment)
+        if not connectors:
+            return None
+        index = 0 if end == 0 else len(connectors) - 1
+        return connectors[index] if positions[index] == end else None
+
+    def next(self, segment: int, end: int) -> Optional[Tuple[int, int]]:
+        """Return the segment joinable to one end of another, and the end it joins at.
+
+        Segments are joinable when they are the only two at a connector, both end
+        there, and have the same tags. Ways with direction-dependent tags are only
+        joined head to tail.
+        """
+        connector = self.end_connector(segment, end)
+        if connector is None:
+            return None
+        segments = self.graph.segments_at_index(connector)
+        if len(segments) != 2 or segments[0] == segments[1]:
+            return None
+        other = segments[1] if segments[0] == segment else segments[0]
+        if self.tag_ids[other] < 0 or self.tag_ids[other] != self.tag_ids[segment]:
+            return None
+        at_start = self.end_connector(other, 0) == connector
+        at_end = self.end_connector(other, 1) == connector
+        if at_start == at_end:
+            return None
+        other_end = 0 if at_start else 1
+        if self.directional[segment] and other_end == end:
+            return None
+        return other, other_end
+
+    def chain(self, segment: int, visited: bytearray) -> List[Tuple[int, bool]]:
+        """Return the chain through a segment as segments and whether each is reversed.
+
+        The chain starts at its first segment, in the direction of `segment`.
+        """
+        visited[segment] = 1
+        chain = [(segment, False)]
+        for end, ahead in ((1, True), (0, False)):
+            current, exit_end = segment, end
+            while True:
+                found = self.next(current, exit_end)
+                if found is None or visited[found[0]]:
+                    break
+                current, entry_end = found
+                visited[current] = 1
+                exit_end = 1 - entry_end
+                # Going ahead, a segment entered at its end runs backwards, and
+                # going back, one entered at its start does.
+                reverse = entry_end == 1 if ahead else entry_end == 0
+                if ahead:
+                    chain.append((current, reverse))
+                else:
+                    chain.insert(0, (current, reverse))
+        return chain
+
+
+def join_lines(lines: List[Coordinates]) -> Coordinates:
+    """Join lines that each start where the previous one ends."""
+    joined = [list(coord) for coord in lines[0]]
+    for line in lines[1:]:
+        joined.extend(list(coord) for coord in line[1:])
+    return joined
+
+
+def merge_geojson(geojson: dict) -> dict:
+    """Convert an Overture `segment` GeoJSON, merging segments into longer ways.
+
+    Segments are converted with `overturetoosm.process_segment`, then consecutive
+    segments with the same tags that are the only two at the connector between
+    them are joined into one way. Merged ways follow the direction of their first
+    segment in the input, and are output in the order of their first segment, so
+    the result only depends on the input.
+
+    Args:
+        geojson (dict): The dictionary representation of the Overture GeoJSON.
+
+    Returns:
+        dict: The dictionary representation of the GeoJSON that follows OSM's schema.
+    """
+    builder = GraphBuilder()
+    tag_sets: Dict[Tuple[Tuple[str, str], ...], int] = {}
+    tag_ids: List[int] = []
+    directional: List[bool] = []
+    lines: List[Optional[Coordinates]] = []
+    for feature in geojson["features"]:
+        props = feature["properties"]
+        tags = process_segment(props)
+        geometry = feature["geometry"]
+        builder.add_properties(props)
+        if geometry["type"] == "LineString":
+            tag_ids.append(
+                tag_sets.setdefault(tuple(sorted(tags.items())), len(tag_sets))
+            )
+            lines.append(geometry["coordinates"])
+        else:
+            tag_ids.append(-1)
+            lines.append(None)
+        directional.append(is_directional(tags))
+        feature["properties"] = tags
+    if len(builder.segments) != len(lines):
+        raise ValueError("Segment ids must be unique to merge segments.")
+
+    chains = _Chains(builder.build(), tag_ids, directional)
+    visited = bytearray(len(lines))
+    new_features = []
+    for segment, feature in enumerate(geojson["features"]):
+        if visited[segment]:
+            continue
+        if lines[segment] is None:
+            new_features.append(feature)
+            continue
+        parts = []
+        for part, reverse in chains.chain(segment, visited):
+            line = lines[part] or []
+            parts.append(line[::-1] if reverse else line)
+        new_features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": join_lines(parts)},
+                "properties": feature["properties"],
+            }
+        )
+    geojson["features"] = new_features
+    return geojson
@@ -12,7 +12,9 @@ except ImportError:
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator
 
-from .resources import places_tags
+from .categories import CategoryIndex, default_index
+from .interning import tag_pool
+from .resources import name_variant_keys
 
 
 class OvertureBaseModel(BaseModel):
@@ -90,6 +92,23 @@ class Names(BaseModel):
     common: Optional[Dict[str, str]]
     rules: Optional[List[Rules]]
 
+    def to_osm(self) -> Dict[str, str]:
+        """Convert names to OSM tags.
+
+        Rules scoped to part of a feature with `between` are left out.
+        """
+        osm = {"name": self.primary}
+        for language, value in (self.common or {}).items():
+            osm[f"name:{language}"] = value
+        for rule in self.rules or []:
+            key = name_variant_keys.get(rule.variant.value)
+            if key is None or rule.between is not None:
+                continue
+            if rule.language:
+                key = f"{key}:{rule.language}"
+            osm.setdefault(key, rule.value)
+        return osm
+
 
 class PlaceAddress(BaseModel):
     """Overture addresses model."""
@@ -157,7 +176,11 @@ class PlaceProps(OvertureBaseModel):
     addresses: List[PlaceAddress]
 
     def to_osm(
-        self, confidence: float, region_tag: str, unmatched: str
+        self,
+        confidence: float,
+        region_tag: str,
+        unmatched: str,
+        category_index: Optional[CategoryIndex] = None,
     ) -> Dict[str, str]:
         """Convert Overture's place properties to OSM tags.
 
@@ -168,9 +191,10 @@ class PlaceProps(OvertureBaseModel):
             raise ConfidenceError(confidence, self.confidence)
 
         if self.categories:
-            prim = places_tags.get(self.categories.main)
+            index = category_index or default_index()
+            prim = index.resolve(self.categories.main, self.categories.alternate)
             if prim:
-                new_props = {**new_props, **prim}
+                new_props = dict(prim)
             elif unmatched == "force":
                 new_props["type"] = self.categories.main
             elif unmatched == "error":
@@ -206,7 +230,7 @@ class PlaceProps(OvertureBaseModel):
         if self.brand:
             new_props.update(self.brand.to_osm())
 
-        return new_props
+        return tag_pool.intern_tags(new_props)
 
 
 class ConfidenceError(Exception):
@@ -267,16 +291,10 @@ class UnmatchedError(Exception):
         return f"{self.message} {{category={self.category}}}"
 
 
-class BuildingProps(OvertureBaseModel):
-    """Overture building properties.
-
-    Use this model if you want to manipulate the `building` properties yourself.
-    """
+class BuildingShapeProps(OvertureBaseModel):
+    """The Overture properties shared by buildings and building parts."""
 
-    has_parts: bool
     sources: List[Sources]
-    class_: Optional[str] = Field(alias="class", default=None)
-    subtype: Optional[str] = None
     names: Optional[Names] = None
     level: Optional[int] = None
     height: Optional[float] = None
@@ -312,21 +330,22 @@ class BuildingProps(OvertureBaseModel):
         serialization_alias="roof:height", default=None
     )
 
-    def to_osm(self, confidence: float) -> Dict[str, str]:
-        """Convert properties to OSM tags.
-
-        Used internally by`overturetoosm.process_building` function.
-        """
+    def _shape_tags(self, key: str, value: str, confidence: float) -> Dict[str, str]:
+        """Convert the shared properties to OSM tags, starting with `key=value`."""
         new_props = {}
         confidences = {source.confidence for source in self.sources}
         if any(conf and conf < confidence for conf in confidences):
             raise ConfidenceError(confidence, max({i for i in confidences if i}))
 
-        new_props["building"] = self.class_ if self.class_ else "yes"
+        new_props[key] = value
 
         new_props["source"] = source_statement(self.sources)
 
-        prop_obj = self.model_dump(exclude_none=True, by_alias=True).items()
+        prop_obj = self.model_dump(
+            exclude_none=True,
+            by_alias=True,
+            include=set(BuildingShapeProps.model_fields),
+        ).items()
         new_props.update(
             {k: v for k, v in prop_obj if k.startswith(("roof", "building"))}
         )
@@ -336,7 +355,41 @@ class BuildingProps(OvertureBaseModel):
             new_props["location"] = "underground"
         if self.names:
             new_props["name"] = self.names.primary
-        return new_props
+        return tag_pool.intern_tags(new_props)
+
+
+class BuildingProps(BuildingShapeProps):
+    """Overture building properties.
+
+    Use this model if you want to manipulate the `building` properties yourself.
+    """
+
+    has_parts: bool
+    class_: Optional[str] = Field(alias="class", default=None)
+    subtype: Optional[str] = None
+
+    def to_osm(self, confidence: float) -> Dict[str, str]:
+        """Convert properties to OSM tags.
+
+        Used internally by`overturetoosm.process_building` function.
+        """
+        return self._shape_tags("building", self.class_ or "yes", confidence)
+
+
+class BuildingPartProps(BuildingShapeProps):
+    """Overture building part properties.
+
+    Use this model if you want to manipulate the `building_part` properties yourself.
+    """
+
+    building_id: str
+
+    def to_osm(self, confidence: float) -> Dict[str, str]:
+        """Convert properties to OSM tags.
+
+        Used internally by `overturetoosm.process_building_part`.
+        """
+        return self._shape_tags("building:part", "yes", confidence)
 
 
 class AddressLevel(BaseModel):
@@ -375,7 +428,7 @@ class AddressProps(OvertureBaseModel):
         if self.address_levels and len(self.address_levels) > 0 and style == "US":
             obj_dict["addr:state"] = str(self.address_levels[0].value)
 
-        return obj_dict
+        return tag_pool.intern_tags(obj_dict)
 
 
 def source_statement(source: List[Sources]) -> str:
@@ -0,0 +1,94 @@
+"""Relate building parts to the building they belong to.
+
+OSM maps a building with parts as a `building=*` outline and `building:part=*`
+ways for its parts, grouped by a `type=building` relation. Overture's parts name
+their building with `building_id`. Parts are indexed by that id as they are read,
+keeping only the building ids, packed by an `IdTable`, and an array of part way
+ids for each building. The buildings are then streamed past the index in any
+order, so the building theme is never held in memory for the join.
+"""
+
+# ruff: noqa: D415
+
+from array import array
+from typing import Any, Container, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .graph import IdTable
+
+
+class PartIndex:
+    """An index of building parts by the id of their building.
+
+    Example usage:
+    ```python
+    from overturetoosm.parts import PartIndex
+
+    parts = PartIndex()
+    for way_id, props in part_ways:
+        parts.add_properties(way_id, props)
+    relations = list(parts.relations(building_ways))
+    ```
+    """
+
+    def __init__(self) -> None:
+        """@private"""
+        self.buildings = IdTable()
+        self._parts: List[array] = []
+
+    def add(self, building_id: str, way_id: int) -> None:
+        """Add a part's way to a building."""
+        number = self.buildings.intern(building_id)
+        if number == len(self._parts):
+            self._parts.append(array("q"))
+        self._parts[number].append(way_id)
+
+    def add_properties(self, way_id: int, props: Dict[str, Any]) -> None:
+        """Add a part's way from the Overture properties of the part."""
+        building_id = props.get("building_id")
+        if building_id:
+            self.add(building_id, way_id)
+
+    def parts(self, building_id: str) -> array:
+        """Return the way ids of a building's parts."""
+        number = self.buildings.get(building_id)
+        return array("q") if number is None else self._parts[number]
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self._parts)
+
+    def relations(
+        self,
+        buildings: Iterable[Tuple[str, int]],
+        first_id: int = -1,
+        kept: Optional[Container[int]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield a `type=building` relation for each building with parts.
+
+        Args:
+            buildings (Iterable[Tuple[str, int]]): The Overture id and the OSM way id
+                of each building, in any order.
+            first_id (int, optional): The id of the first relation. Later ones count
+                down from it. Defaults to -1.
+            kept (Container[int], optional): The way ids of the buildings and parts
+                to include, like those that passed the confidence filter. Defaults
+                to all.
+        """
+        number = 0
+        for building_id, way_id in buildings:
+            if kept is not None and way_id not in kept:
+                continue
+            parts = [
+                ref for ref in self.parts(building_id) if kept is None or ref in kept
+            ]
+            if not parts:
+                continue
+            members = [{"type": "way", "ref": way_id, "role": "outline"}]
+            members.extend({"type": "way", "ref": ref, "role": "part"} for ref in parts)
+            yield {
+                "type": "relation",
+                "id": first_id - number,
+                "members": members,
+                "tags": {"type": "building"},
+            }
+            number += 1
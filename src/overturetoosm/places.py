@@ -1,7 +1,8 @@
 """Convert Overture's `places` features to OSM tags."""
 
-from typing import Dict, Literal
+from typing import Dict, Literal, Optional
 
+from .categories import CategoryIndex
 from .objects import PlaceProps
 
 
@@ -10,6 +11,7 @@ def process_place(
     confidence: float = 0.0,
     region_tag: str = "addr:state",
     unmatched: Literal["error", "force", "ignore"] = "ignore",
+    category_index: Optional[CategoryIndex] = None,
 ) -> Dict[str, str]:
     """Convert Overture's places properties to OSM tags.
 
@@ -36,6 +38,11 @@ def process_place(
             unmatched Overture categories. The "error" option raises an UnmatchedError
             exception, "force" puts the category into the `type` key, and "ignore"
             only returns other properties. Defaults to "ignore".
+        category_index (CategoryIndex, optional): The index used to look up the OSM
+            tags of the Overture category. Categories without tags of their own
+            fall back to their alternate categories and then to their nearest
+            tagged ancestor in the index's taxonomy. Defaults to an index over
+            `overturetoosm.resources.places_tags` without a taxonomy.
 
     Returns:
         dict[str, str]: The reshaped and converted properties in OSM's flat str:str
@@ -47,4 +54,4 @@ def process_place(
         `overturetoosm.objects.ConfidenceError`: Raised if the confidence level is set
             above a feature's confidence.
     """
-    return PlaceProps(**props).to_osm(confidence, region_tag, unmatched)
+    return PlaceProps(**props).to_osm(confidence, region_tag, unmatched, category_index)
@@ -0,0 +1,339 @@
+"""Convert Overture's prohibited transitions to OSM turn restriction relations.
+
+A prohibited transition on a segment lists the connectors and segments a vehicle
+may not follow from it. In OSM, that is a `type=restriction` relation with the
+segment as its `from` way, the connector (or the segments in between) as `via`,
+and the last segment as its `to` way.
+
+Relations refer to ways and nodes by id, so the segments and connectors are
+looked up in an `ElementIndex` of the converted ways, and the connectors used as
+`via` nodes are written as nodes by `via_nodes`. Restrictions are a small
+fraction of the data but each needs several lookups, so references that cannot
+be resolved are collected and reported together at the end.
+"""
+
+# ruff: noqa: D415
+
+from array import array
+from math import atan2, cos, degrees, isnan, radians
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from .graph import ConnectorGraph, GraphBuilder
+from .interning import tag_pool
+from .linear import cumulative_lengths, interpolate
+from .resources import travel_mode_keys
+from .segments import Heading, ProhibitedTransition, SegmentProperties
+
+Reference = Tuple[str, str, str]
+"""The id of the segment with the restriction, the kind of element that is
+missing (`segment`, `connector` or `geometry`), and the missing id."""
+
+
+class UnresolvedReferenceError(Exception):
+    """Unresolved reference error.
+
+    This exception is raised after converting every restriction when some of them
+    refer to segments or connectors that are not in the index. It lists all of
+    them at once.
+
+    Attributes:
+        references (List[Reference]): The unresolved references.
+        message (str): The error message.
+    """
+
+    def __init__(
+        self,
+        references: List[Reference],
+        message: str = "Restrictions refer to elements that are not in the index.",
+    ) -> None:
+        """@private"""
+        self.references = references
+        self.message = message
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        """@private"""
+        shown = ", ".join(
+            f"{kind} {ref} (from {seg})" for seg, kind, ref in self.references[:5]
+        )
+        more = len(self.references) - 5
+        return f"{self.message} {{count={len(self.references)}}} {shown}" + (
+            f", and {more} more" if more > 0 else ""
+        )
+
+
+def _bearing(start: Sequence[float], end: Sequence[float]) -> float:
+    """Return the compass bearing from one point to another, in degrees."""
+    scale = cos(radians((start[1] + end[1]) / 2))
+    return degrees(atan2((end[0] - start[0]) * scale, end[1] - start[1])) % 360
+
+
+class ElementIndex:
+    """The OSM ids of converted segments and connectors, and the segments' bearings.
+
+    Segments become ways and connectors become nodes with negative (new) ids
+    derived from their position in the connector graph, so the index takes no
+    memory beyond the graph itself and two bearings per segment.
+
+    Args:
+        graph (ConnectorGraph): The graph of the converted segments.
+        bearings (array, optional): The bearing at the start and end of each segment,
+            in the graph's segment order. `nan` where a segment has no geometry.
+    """
+
+    def __init__(self, graph: ConnectorGraph, bearings: Optional[array] = None) -> None:
+        """@private"""
+        self.graph = graph
+        self.bearings = bearings or array("d", [float("nan")] * 2 * len(graph.segments))
+
+    @classmethod
+    def from_geojson(cls, geojson: dict) -> "ElementIndex":
+        """Index the segments of an Overture `segment` GeoJSON."""
+        builder = GraphBuilder()
+        bearings = array("d")
+        for feature in geojson["features"]:
+            builder.add_properties(feature["properties"])
+            geometry = feature.get("geometry") or {}
+            coords = geometry.get("coordinates") or []
+            if geometry.get("type") == "LineString" and len(coords) >= 2:
+                bearings.append(_bearing(coords[0], coords[1]))
+                bearings.append(_bearing(coords[-2], coords[-1]))
+            else:
+                bearings.extend((float("nan"), float("nan")))
+        return cls(builder.build(), bearings)
+
+    def way_id(self, segment_id: str) -> Optional[int]:
+        """Return the OSM way id of a segment, or `None` if it is not indexed."""
+        index = self.graph.segments.get(segment_id)
+        return None if index is None else -(index + 1)
+
+    def node_id(self, connector_id: str) -> Optional[int]:
+        """Return the OSM node id of a connector, or `None` if it is not indexed."""
+        index = self.graph.connectors.get(connector_id)
+        return None if index is None else -(index + 1)
+
+    def _at_start(self, segment: int, connector: int) -> bool:
+        """Return whether a connector lies on the first half of a segment."""
+        connectors = self.graph.connectors_of_index(segment)
+        positions = self.graph.positions_of_index(segment)
+        for other, position in zip(connectors, positions):
+            if other == connector:
+                return position < 0.5
+        return False
+
+    def heading_from(self, segment: int, connector: int) -> Heading:
+        """Return the heading of travel along a segment index away from a connector."""
+        return (
+            Heading.forward if self._at_start(segment, connector) else Heading.backward
+        )
+
+    def turn_angle(self, from_: int, via: int, to: int) -> float:
+        """Return the angle turned from one segment index to another at a connector.
+
+        Positive angles turn right and negative ones turn left, from -180 to 180
+        degrees. The angle is `nan` if either segment has no geometry.
+        """
+        if self._at_start(from_, via):
+            arriving = (self.bearings[2 * from_] + 180) % 360
+        else:
+            arriving = self.bearings[2 * from_ + 1]
+        if self._at_start(to, via):
+            leaving = self.bearings[2 * to]
+        else:
+            leaving = (self.bearings[2 * to + 1] + 180) % 360
+        return (leaving - arriving + 180) % 360 - 180
+
+
+def turn_type(angle: float) -> str:
+    """Return the OSM name for a turn of a given angle."""
+    if abs(angle) <= 30:
+        return "straight_on"
+    if abs(angle) >= 150:
+        return "u_turn"
+    return "right_turn" if angle > 0 else "left_turn"
+
+
+def restriction_tags(
+    value: str, transition: ProhibitedTransition
+) -> Optional[Dict[str, str]]:
+    """Return the tags of a restriction relation, or `None` if OSM can't express it.
+
+    Travel modes become `restriction:<mode>` keys and time ranges become
+    `:conditional` values. Restrictions that depend on the purpose of travel,
+    recognized status or vehicle dimensions are not converted.
+    """
+    when = transition.when
+    if when.using or when.recognized or when.vehicle:
+        return None
+    if when.during is not None and not isinstance(when.during, str):
+        return None
+    keys = ["restriction"]
+    if when.mode:
+        keys = [f"restriction:{travel_mode_keys[mode.value]}" for mode in when.mode]
+    tags = {"type": "restriction"}
+    for key in keys:
+        if when.during is None:
+            tags[key] = value
+        else:
+            tags[f"{key}:conditional"] = f"{value} @ ({when.during})"
+    return tag_pool.intern_tags(tags)
+
+
+def segment_restrictions(
+    segment: SegmentProperties, index: ElementIndex, unresolved: List[Reference]
+) -> List[Dict[str, Any]]:
+    """Convert the prohibited transitions of a segment to restriction relations.
+
+    Relations are returned without an `id`. Transitions with references missing
+    from the index are skipped, and their references appended to `unresolved`.
+    OSM restrictions only apply to travel toward the `via` element along the
+    `from` way and away from it along the `to` way, so transitions whose
+    `when.heading` or `final_heading` is the other way are skipped too.
+    """
+    segment_id = segment.id.root
+    from_ = index.graph.segments.get(segment_id)
+    relations = []
+    for transition in segment.prohibited_transitions or []:
+        missing: List[Reference] = []
+        if from_ is None:
+            missing.append((segment_id, "segment", segment_id))
+        found: List[Optional[int]] = [from_]
+        found_connectors: List[Optional[int]] = []
+        for step in transition.sequence:
+            connector_id, to_id = step.connector_id.root, step.segment_id.root
+            connector = index.graph.connectors.get(connector_id)
+            to = index.graph.segments.get(to_id)
+            if connector is None:
+                missing.append((segment_id, "connector", connector_id))
+            if to is None:
+                missing.append((segment_id, "segment", to_id))
+            found_connectors.append(connector)
+            found.append(to)
+        if missing or not found_connectors:
+            unresolved.extend(missing)
+            continue
+        path, connectors = cast("List[int]", found), cast("List[int]", found_connectors)
+        # Travel along `from` has to arrive at the via connector, not leave it.
+        if transition.when.heading == index.heading_from(path[0], connectors[0]):
+            continue
+        if transition.final_heading != index.heading_from(path[-1], connectors[-1]):
+            continue
+
+        if len(path) == 2 and path[0] == path[1]:
+            value = "no_u_turn"
+        else:
+            angle = index.turn_angle(path[-2], connectors[-1], path[-1])
+            if isnan(angle):
+                unresolved.append((segment_id, "geometry", segment_id))
+                continue
+            value = f"no_{turn_type(angle)}"
+        tags = restriction_tags(value, transition)
+        if tags is None:
+            continue
+
+        members = [{"type": "way", "ref": -(path[0] + 1), "role": "from"}]
+        if len(connectors) == 1:
+            members.append({"type": "node", "ref": -(connectors[0] + 1), "role": "via"})
+        else:
+            members.extend(
+                {"type": "way", "ref": -(way + 1), "role": "via"} for way in path[1:-1]
+            )
+        members.append({"type": "way", "ref": -(path[-1] + 1), "role": "to"})
+        relations.append({"members": members, "tags": tags})
+    return relations
+
+
+def via_nodes(
+    geojson: dict, relations: List[Dict[str, Any]], index: ElementIndex
+) -> List[Dict[str, Any]]:
+    """Return the nodes of the connectors that restriction relations pass through.
+
+    Each node has the id the relations refer to and is placed where its connector
+    lies along the relation's `from` way, which has a geometry for every relation
+    `process_restrictions` returns.
+
+    Args:
+        geojson (dict): The Overture `segment` GeoJSON the relations came from.
+        relations (List[Dict[str, Any]]): The relations from `process_restrictions`.
+        index (ElementIndex): The index the relations were converted with.
+
+    Returns:
+        List[Dict[str, Any]]: The nodes in the OSM JSON format, in id order.
+    """
+    wanted: Dict[int, int] = {}
+    for relation in relations:
+        refs = {member["role"]: member["ref"] for member in relation["members"]}
+        if relation["members"][1]["type"] == "node":
+            wanted[-refs["via"] - 1] = -refs["from"] - 1
+    segments = {index.graph.segments[segment] for segment in wanted.values()}
+    geometries = {
+        feature["properties"]["id"]: feature["geometry"]["coordinates"]
+        for feature in geojson["features"]
+        if feature["properties"]["id"] in segments
+    }
+    nodes = []
+    for connector, segment in sorted(wanted.items(), reverse=True):
+        coords = geometries[index.graph.segments[segment]]
+        position = next(
+            at
+            for other, at in zip(
+                index.graph.connectors_of_index(segment),
+                index.graph.positions_of_index(segment),
+            )
+            if other == connector
+        )
+        lon, lat = interpolate(coords, cumulative_lengths(coords), position)
+        nodes.append(
+            {"type": "node", "id": -(connector + 1), "lat": lat, "lon": lon, "tags": {}}
+        )
+    return nodes
+
+
+def process_restrictions(
+    geojson: dict, index: Optional[ElementIndex] = None, unresolved: str = "error"
+) -> List[Dict[str, Any]]:
+    """Convert the prohibited transitions of an Overture `segment` GeoJSON.
+
+    Example usage:
+    ```python
+    import json
+    from overturetoosm.restrictions import ElementIndex, process_restrictions
+
+    with open("overture.geojson", "r", encoding="utf-8") as f:
+        contents: dict = json.load(f)
+        index = ElementIndex.from_geojson(contents)
+        relations = process_restrictions(contents, index)
+    ```
+    Args:
+        geojson (dict): The dictionary representation of the Overture GeoJSON.
+        index (ElementIndex, optional): The index of the converted ways. Defaults to
+            an index of `geojson` itself.
+        unresolved (str, optional): How to handle restrictions that refer to
+            segments or connectors missing from the index. The "error" option
+            raises an `UnresolvedReferenceError` listing every one of them after
+            all features are converted, and "ignore" skips those restrictions.
+            Defaults to "error".
+
+    Returns:
+        List[Dict[str, Any]]: The restriction relations in the OSM JSON format, with
+            new negative ids.
+
+    Raises:
+        UnresolvedReferenceError: Restrictions refer to elements missing from the
+            index, and `unresolved` is "error".
+    """
+    index = index or ElementIndex.from_geojson(geojson)
+    relations: List[Dict[str, Any]] = []
+    references: List[Reference] = []
+    for feature in geojson["features"]:
+        props = feature["properties"]
+        if not props.get("prohibited_transitions"):
+            continue
+        segment = SegmentProperties(**props)
+        relations.extend(segment_restrictions(segment, index, references))
+    if references and unresolved == "error":
+        raise UnresolvedReferenceError(references)
+    return [
+        {"type": "relation", "id": -number, **relation}
+        for number, relation in enumerate(relations, 1)
+    ]
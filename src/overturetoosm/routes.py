@@ -0,0 +1,104 @@
+"""Collect the routes of transportation segments into OSM route relations.
+
+Overture repeats a route's name, network, and ref on every segment along it. OSM
+tags a route once, on a `type=route` relation with the route's ways as members.
+The aggregator streams over the segments, keeping one entry per route in a hash
+index with the way ids of its members in a compact array, so its memory grows
+with the number of routes rather than the number of segments.
+"""
+
+# ruff: noqa: D415
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .interning import tag_pool
+from .resources import route_types
+
+RouteKey = Tuple[str, Optional[str], Optional[str], Optional[str]]
+"""The `route` type, network, ref, and name that identify a route."""
+
+
+class RouteAggregator:
+    """Group segments by route and build a relation for each route.
+
+    Example usage:
+    ```python
+    from overturetoosm.routes import RouteAggregator
+
+    routes = RouteAggregator()
+    for way_id, props in ways:
+        routes.add_properties(way_id, props)
+    relations = list(routes.relations())
+    ```
+    """
+
+    def __init__(self) -> None:
+        """@private"""
+        self._index: Dict[RouteKey, int] = {}
+        self._tags: List[Dict[str, str]] = []
+        self._members: List[array] = []
+
+    def add(
+        self, way_id: int, routes: Iterable[Mapping[str, Any]], subtype: str = "road"
+    ) -> None:
+        """Add a way to each of the routes it belongs to.
+
+        Args:
+            way_id (int): The OSM id of the way.
+            routes (Iterable[Mapping[str, Any]]): The segment's Overture `routes`.
+            subtype (str, optional): The segment's subtype. Defaults to "road".
+        """
+        route_type = route_types.get(subtype, subtype)
+        for route in routes:
+            network, ref, name = (
+                route.get("network"),
+                route.get("ref"),
+                route.get("name"),
+            )
+            if not (network or ref or name):
+                continue
+            key = (route_type, network, ref, name)
+            number = self._index.get(key)
+            if number is None:
+                number = self._index[key] = len(self._tags)
+                self._tags.append(self._route_tags(key, route.get("wikidata")))
+                self._members.append(array("q"))
+            members = self._members[number]
+            if not members or members[-1] != way_id:
+                members.append(way_id)
+
+    def add_properties(self, way_id: int, props: Mapping[str, Any]) -> None:
+        """Add a way from the Overture properties of its segment."""
+        self.add(way_id, props.get("routes") or [], props.get("subtype") or "road")
+
+    @staticmethod
+    def _route_tags(key: RouteKey, wikidata: Optional[str]) -> Dict[str, str]:
+        """Return the tags of a route relation."""
+        route_type, network, ref, name = key
+        tags = {"type": "route", "route": route_type}
+        for tag, value in (("network", network), ("ref", ref), ("name", name)):
+            if value:
+                tags[tag] = value
+        if wikidata:
+            tags["wikidata"] = wikidata
+        return tag_pool.intern_tags(tags)
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self._tags)
+
+    def relations(self, first_id: int = -1) -> Iterator[Dict[str, Any]]:
+        """Yield a route relation in the OSM JSON format for each route.
+
+        Args:
+            first_id (int, optional): The id of the first relation. Later ones count
+                down from it. Defaults to -1.
+        """
+        for number, (tags, members) in enumerate(zip(self._tags, self._members)):
+            yield {
+                "type": "relation",
+                "id": first_id - number,
+                "members": [{"type": "way", "ref": ref, "role": ""} for ref in members],
+                "tags": tags,
+            }
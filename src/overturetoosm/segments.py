@@ -3,17 +3,47 @@
 Partly autogenerated by datamodel-codegen.
 """
 
+# ruff: noqa: D415
+
 from enum import Enum
-from typing import Any, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 try:
     from typing import Annotated
 except ImportError:
     from typing_extensions import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field, RootModel
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    field_validator,
+)
+
+from .access import access_tags, add_access_tags, when_key
+from .interning import tag_pool
+from .objects import Names, Sources, Wikidata, source_statement
+from .resources import (
+    link_classes,
+    road_flag_tags,
+    road_surface_tags,
+    segment_class_tags,
+    segment_subclass_tags,
+)
+from .units import format_speed
+
+
+class SegmentBaseModel(BaseModel):
+    """Base model for transportation segment models.
+
+    The segment model graph is large, so its core schemas are built on first
+    validation rather than at import.
+    """
 
-from .objects import Names, Sources, Wikidata
+    model_config = ConfigDict(defer_build=True)
 
 
 class Subtype(str, Enum):
@@ -39,24 +69,32 @@ class Id(RootModel):
     (GERS) if—and-only-if the feature represents an entity that is part of GERS.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     root: str
 
 
 class Level(RootModel):
     """Model for transportation segment level."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: int = Field(default=0)
 
 
 class LinearlyReferencedPosition(RootModel):
     """Model for transportation segment linearly referenced position."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[float, Field(strict=True, ge=0.0, le=1.0)]
 
 
 class LinearlyReferencedRange(RootModel):
     """Model for transportation segment linearly referenced range."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[list, Field(float, min_length=2, max_length=2)]
 
 
@@ -100,7 +138,20 @@ class Subclass(str, Enum):
     cycle_crossing = "cycle_crossing"
 
 
-class TemporalScopeContainer(BaseModel):
+class RailClass(str, Enum):
+    """Model for transportation segment rail class."""
+
+    funicular = "funicular"
+    light_rail = "light_rail"
+    monorail = "monorail"
+    narrow_gauge = "narrow_gauge"
+    standard_gauge = "standard_gauge"
+    subway = "subway"
+    tram = "tram"
+    unknown = "unknown"
+
+
+class TemporalScopeContainer(SegmentBaseModel):
     """Model for transportation segment temporal scope container."""
 
     during: Optional[Any] = None
@@ -193,21 +244,21 @@ class WeightUnit(str, Enum):
     t = "t"
 
 
-class Connector(BaseModel):
+class Connector(SegmentBaseModel):
     """Model for transportation segment connector."""
 
     connector_id: Id
     at: LinearlyReferencedPosition
 
 
-class LevelRules(BaseModel):
+class LevelRules(SegmentBaseModel):
     """Model for transportation segment level rules container item."""
 
     value: Level
     between: Optional[LinearlyReferencedRange] = None
 
 
-class Route(BaseModel):
+class Route(SegmentBaseModel):
     """Model for transportation segment route."""
 
     name: Optional[str] = Field(description="Full name of the route")
@@ -222,28 +273,30 @@ class Route(BaseModel):
 class Routes(RootModel):
     """Model for transportation segment routes."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: List[Route] = Field(description="Routes this segment belongs to.")
 
 
-class HeadingScopeContainer(BaseModel):
+class HeadingScopeContainer(SegmentBaseModel):
     """Model for transportation segment heading scope container."""
 
     heading: Optional[Heading] = None
 
 
-class PurposeOfUseScopeContainer(BaseModel):
+class PurposeOfUseScopeContainer(SegmentBaseModel):
     """Model for transportation segment purpose of use scope container."""
 
     using: Optional[List[PurposeOfUse]] = Field(None, min_length=1)
 
 
-class RecognizedStatusScopeContainer(BaseModel):
+class RecognizedStatusScopeContainer(SegmentBaseModel):
     """Model for transportation segment recognized status scope container."""
 
     recognized: Optional[List[RecognizedStatus]] = Field(None, min_length=1)
 
 
-class TravelModeScopeContainer(BaseModel):
+class TravelModeScopeContainer(SegmentBaseModel):
     """Model for transportation segment travel mode scope container."""
 
     mode: Optional[List[TravelMode]] = Field(
@@ -254,12 +307,14 @@ class TravelModeScopeContainer(BaseModel):
 class VehicleScopeUnit(RootModel):
     """Model for transportation segment vehicle scope unit."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: Union[LengthUnit, WeightUnit] = Field(
         description="Parent enum of both length and width for use in vehicle scoping"
     )
 
 
-class VehicleItem(BaseModel):
+class VehicleItem(SegmentBaseModel):
     """Model for transportation segment vehicle item."""
 
     dimension: VehicleScopeDimension
@@ -268,7 +323,7 @@ class VehicleItem(BaseModel):
     unit: Optional[VehicleScopeUnit] = None
 
 
-class VehicleScopeContainer(BaseModel):
+class VehicleScopeContainer(SegmentBaseModel):
     """Model for transportation segment vehicle scope container."""
 
     vehicle: Optional[List[VehicleItem]] = Field(
@@ -287,11 +342,12 @@ class When(
     """Model for transportation segment when."""
 
 
-class AccessContainer(BaseModel):
+class AccessContainer(SegmentBaseModel):
     """Model for transportation segment access container item."""
 
     access_type: AccessType
     when: Optional[When] = None
+    between: Optional[LinearlyReferencedRange] = None
 
 
 class RoadFlagEnum(str, Enum):
@@ -305,7 +361,7 @@ class RoadFlagEnum(str, Enum):
     is_covered = "is_covered"
 
 
-class RoadFlag(BaseModel):
+class RoadFlag(SegmentBaseModel):
     """Overture road flag."""
 
     values: List[RoadFlagEnum]
@@ -324,7 +380,7 @@ class RoadSurfaceEnum(str, Enum):
     metal = "metal"
 
 
-class RoadSurface(BaseModel):
+class RoadSurface(SegmentBaseModel):
     """Overture road surface."""
 
     value: RoadSurfaceEnum
@@ -338,28 +394,35 @@ class SpeedUnit(str, Enum):
     mph = "mph"
 
 
-class Speed(BaseModel):
+class Speed(SegmentBaseModel):
     """Overture speed."""
 
     value: Annotated[int, Field(ge=1, le=350)]
     unit: Optional[SpeedUnit] = None
 
+    def to_osm(self) -> str:
+        """Format the speed as an OSM `maxspeed` value."""
+        return format_speed(self.value, self.unit.value if self.unit else None)
+
 
-class SpeedLimit(BaseModel):
+class SpeedLimit(SegmentBaseModel):
     """Overture speed limit."""
 
     min_speed: Optional[Speed] = None
     max_speed: Speed
+    is_max_speed_variable: Optional[bool] = None
+    when: Optional[When] = None
+    between: Optional[LinearlyReferencedRange] = None
 
 
-class Sequence(BaseModel):
+class Sequence(SegmentBaseModel):
     """Overture sequence."""
 
     connector_id: Id
     segment_id: Id
 
 
-class ProhibitedTransition(BaseModel):
+class ProhibitedTransition(SegmentBaseModel):
     """Overture prohibited transition."""
 
     sequence: List[Sequence]
@@ -368,7 +431,44 @@ class ProhibitedTransition(BaseModel):
     between: Optional[LinearlyReferencedRange] = None
 
 
-class SegmentProperties(BaseModel):
+def is_whole(between: Optional[LinearlyReferencedRange]) -> bool:
+    """Return whether a `between` range covers the whole segment."""
+    return between is None or list(between.root) == [0, 1]
+
+
+@lru_cache(maxsize=4096)
+def segment_tags(
+    subtype: str, class_: str, subclass: Optional[str], flags: FrozenSet[str]
+) -> Tuple[Tuple[str, str], ...]:
+    """Return the main OSM tags of a segment as a tuple of key-value pairs.
+
+    Every distinct combination of subtype, class, subclass and whole-segment road
+    flags is worked out once from the tables in `overturetoosm.resources`, then
+    served from the cache for the rest of the run.
+    """
+    classes = segment_class_tags.get(subtype, {})
+    tags = dict(classes.get(class_) or classes.get("unknown") or {})
+    if subclass is not None:
+        tags.update(segment_subclass_tags.get(subclass, {}))
+
+    main = next((k for k in ("highway", "railway") if k in tags), None)
+    if main is not None:
+        value = tags[main]
+        if (subclass == "link" or "is_link" in flags) and value in link_classes:
+            value = tags[main] = f"{value}_link"
+        if "is_under_construction" in flags:
+            tags[main] = "construction"
+            tags["construction"] = value
+        elif "is_abandoned" in flags:
+            del tags[main]
+            tags[f"abandoned:{main}"] = value
+
+    for flag in sorted(flags):
+        tags.update(road_flag_tags.get(flag, {}))
+    return tuple(tags.items())
+
+
+class SegmentProperties(SegmentBaseModel):
     """Model for transportation segment properties."""
 
     model_config = ConfigDict(extra="forbid")
@@ -381,7 +481,8 @@ class SegmentProperties(BaseModel):
     id: Id
     subtype: Subtype = Field(description="Broad category of transportation segment.")
     sources: Optional[List[Sources]] = None
-    class_: Optional[RoadClass] = Field(None, alias="class")
+    class_: Optional[Union[RoadClass, RailClass]] = Field(None, alias="class")
+    subclass: Optional[Subclass] = None
     access_restrictions: Optional[List[AccessContainer]] = Field(
         None, description="Rules governing access to this road segment or lane"
     )
@@ -405,3 +506,92 @@ class SegmentProperties(BaseModel):
     prohibited_transitions: Optional[List[ProhibitedTransition]] = None
     routes: Optional[Routes] = None
     names: Optional[Names] = None
+
+    @field_validator("class_", mode="before")
+    @classmethod
+    def class_for_subtype(cls, value: Any, info: ValidationInfo) -> Any:
+        """@private"""
+        subtype = info.data.get("subtype")
+        if value is None or subtype is None:
+            return value
+        classes = {Subtype.road: RoadClass, Subtype.rail: RailClass}.get(subtype)
+        if classes is None:
+            raise ValueError(f"{subtype.value} segments have no class")
+        return classes(value)
+
+    def to_osm(self) -> Dict[str, str]:
+        """Convert transportation segment properties to OSM tags.
+
+        Only values that cover the whole segment are converted. Values scoped to
+        part of it with `between` are left out.
+
+        Used internally by the `overturetoosm.segments.process_segment` function.
+        """
+        flags = frozenset(
+            flag.value
+            for road_flag in self.road_flags or []
+            if is_whole(road_flag.between)
+            for flag in road_flag.values
+        )
+        new_props = dict(
+            segment_tags(
+                self.subtype.value,
+                self.class_.value if self.class_ else "unknown",
+                self.subclass.value if self.subclass else None,
+                flags,
+            )
+        )
+
+        for surface in self.road_surface or []:
+            if is_whole(surface.between) and surface.value.value in road_surface_tags:
+                new_props["surface"] = road_surface_tags[surface.value.value]
+
+        level = self.level.root if self.level else 0
+        for rule in self.level_rules or []:
+            if is_whole(rule.between):
+                level = rule.value.root
+        if level:
+            new_props["layer"] = str(level)
+
+        for rule in self.access_restrictions or []:
+            key = when_key(rule.when)
+            if is_whole(rule.between) and key is not None:
+                add_access_tags(new_props, access_tags(rule.access_type.value, key))
+
+        for limit in self.speed_limits or []:
+            if is_whole(limit.between) and limit.when is None:
+                new_props["maxspeed"] = limit.max_speed.to_osm()
+                if limit.min_speed:
+                    new_props["minspeed"] = limit.min_speed.to_osm()
+
+        if self.names:
+            new_props.update(self.names.to_osm())
+
+        if self.sources:
+            new_props["source"] = source_statement(self.sources)
+
+        return tag_pool.intern_tags(new_props)
+
+
+def process_segment(props: dict) -> Dict[str, str]:
+    """Convert Overture's transportation segment properties to OSM tags.
+
+    Example usage:
+    ```python
+    import json
+    from overturetoosm import process_segment
+
+    with open("overture.geojson", "r", encoding="utf-8") as f:
+        contents: dict = json.load(f)
+
+        for feature in contents["features"]:
+            feature["properties"] = process_segment(feature["properties"])
+    ```
+    Args:
+        props (dict): The feature properties from the Overture GeoJSON.
+
+    Returns:
+        Dict[str, str]: The reshaped and converted properties in OSM's flat
+            str:str schema.
+    """
+    return SegmentProperties(**props).to_osm()
@@ -0,0 +1,422 @@
+"""Select features by bounding box or by a clipping polygon.
+
+Both filters look at each feature's envelope first: Overture's `bbox` column when
+the input has it, or the extent of the geometry otherwise. Features are filtered
+before their properties are validated, so the features that are skipped cost
+almost nothing.
+"""
+
+# ruff: noqa: D415
+
+from array import array
+from bisect import bisect_left
+from itertools import chain
+from math import ceil, floor, sqrt
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+Envelope = Tuple[float, float, float, float]
+"""The minimum x, minimum y, maximum x, and maximum y of a geometry."""
+
+OUTSIDE, INSIDE, BOUNDARY = 0, 1, 2
+
+
+def _positions(coords: list) -> Iterator[Sequence[float]]:
+    """Yield every position in a GeoJSON `coordinates` array."""
+    if coords and isinstance(coords[0], (int, float)):
+        yield coords
+    else:
+        for part in coords:
+            yield from _positions(part)
+
+
+def geometry_positions(geometry: Optional[dict]) -> Iterator[Sequence[float]]:
+    """Yield every position of a GeoJSON geometry."""
+    if not geometry:
+        return
+    if geometry.get("type") == "GeometryCollection":
+        for part in geometry.get("geometries", []):
+            yield from geometry_positions(part)
+    else:
+        yield from _positions(geometry.get("coordinates") or [])
+
+
+def feature_envelope(feature: dict) -> Optional[Envelope]:
+    """Return the envelope of a GeoJSON feature, or `None` if it has no geometry.
+
+    Uses the feature's GeoJSON `bbox` member or Overture `bbox` property when
+    present, and otherwise scans the geometry.
+    """
+    bbox = feature.get("bbox")
+    if bbox and len(bbox) == 4:
+        return bbox[0], bbox[1], bbox[2], bbox[3]
+    bbox = (feature.get("properties") or {}).get("bbox")
+    if isinstance(bbox, dict):
+        return bbox["xmin"], bbox["ymin"], bbox["xmax"], bbox["ymax"]
+    positions = list(geometry_positions(feature.get("geometry")))
+    if not positions:
+        return None
+    xs = [position[0] for position in positions]
+    ys = [position[1] for position in positions]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def envelopes_intersect(first: Envelope, second: Envelope) -> bool:
+    """Return whether two envelopes overlap or touch."""
+    return (
+        first[0] <= second[2]
+        and second[0] <= first[2]
+        and first[1] <= second[3]
+        and second[1] <= first[3]
+    )
+
+
+def ring_contains(ring: Sequence[Sequence[float]], x: float, y: float) -> bool:
+    """Return whether a point is inside a closed ring, by ray casting."""
+    inside = False
+    for i in range(len(ring) - 1):
+        x1, y1 = ring[i][0], ring[i][1]
+        x2, y2 = ring[i + 1][0], ring[i + 1][1]
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _lines(coords: list) -> Iterator[list]:
+    """Yield every line or ring in a GeoJSON `coordinates` array."""
+    if not coords or isinstance(coords[0], (int, float)):
+        return
+    if isinstance(coords[0][0], (int, float)):
+        yield coords
+    else:
+        for part in coords:
+            yield from _lines(part)
+
+
+def _geometry_lines(geometry: Optional[dict]) -> Iterator[list]:
+    """Yield every line or ring of a GeoJSON geometry."""
+    if not geometry:
+        return
+    if geometry.get("type") == "GeometryCollection":
+        for part in geometry.get("geometries", []):
+            yield from _geometry_lines(part)
+    else:
+        yield from _lines(geometry.get("coordinates") or [])
+
+
+def _polygons(geometry: Optional[dict]) -> Iterator[list]:
+    """Yield the rings of each polygon of a GeoJSON geometry."""
+    if not geometry:
+        return
+    if geometry.get("type") == "GeometryCollection":
+        for part in geometry.get("geometries", []):
+            yield from _polygons(part)
+    elif geometry.get("type") == "Polygon":
+        yield geometry["coordinates"]
+    elif geometry.get("type") == "MultiPolygon":
+        yield from geometry["coordinates"]
+
+
+def _side(x1: float, y1: float, x2: float, y2: float, x: float, y: float) -> int:
+    """Return which side of the line through two points a point is on, or 0."""
+    cross = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+    return (cross > 0) - (cross < 0)
+
+
+def segments_intersect(
+    first: Tuple[float, float, float, float], second: Tuple[float, float, float, float]
+) -> bool:
+    """Return whether two segments, each given as `(x1, y1, x2, y2)`, meet."""
+    ax, ay, bx, by = first
+    cx, cy, dx, dy = second
+    if not envelopes_intersect(
+        (min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)),
+        (min(cx, dx), min(cy, dy), max(cx, dx), max(cy, dy)),
+    ):
+        return False
+    side_c, side_d = _side(ax, ay, bx, by, cx, cy), _side(ax, ay, bx, by, dx, dy)
+    side_a, side_b = _side(cx, cy, dx, dy, ax, ay), _side(cx, cy, dx, dy, bx, by)
+    # Collinear segments with overlapping envelopes overlap.
+    return side_c * side_d <= 0 and side_a * side_b <= 0
+
+
+class PreparedPolygon:
+    """A polygon prepared for many point-in-polygon tests.
+
+    The polygon's envelope is divided into a grid. Each edge is listed in the rows
+    it spans, so a point's ray casting test only looks at the edges in its row, and
+    each cell is classified once as inside, outside, or on the boundary, so most
+    envelopes are classified without testing any points.
+
+    Args:
+        geometry (dict): A GeoJSON `Polygon` or `MultiPolygon` geometry.
+        size (int, optional): The number of rows and columns in the grid. Defaults
+            to one based on the number of edges.
+    """
+
+    def __init__(self, geometry: dict, size: Optional[int] = None) -> None:
+        """@private"""
+        polygons = geometry["coordinates"]
+        if geometry["type"] == "Polygon":
+            polygons = [polygons]
+        self.edges: List[Tuple[float, float, float, float]] = [
+            (ring[i][0], ring[i][1], ring[i + 1][0], ring[i + 1][1])
+            for ring in chain.from_iterable(polygons)
+            for i in range(len(ring) - 1)
+        ]
+        self._ring_starts = [
+            (ring[0][0], ring[0][1]) for ring in chain.from_iterable(polygons)
+        ]
+        xs = [x for edge in self.edges for x in (edge[0], edge[2])]
+        ys = [y for edge in self.edges for y in (edge[1], edge[3])]
+        self.envelope: Envelope = (min(xs), min(ys), max(xs), max(ys))
+        self.size = size or max(1, min(256, ceil(sqrt(len(self.edges)))))
+        self._width = (self.envelope[2] - self.envelope[0]) / self.size or 1.0
+        self._height = (self.envelope[3] - self.envelope[1]) / self.size or 1.0
+
+        self._rows: List[List[Tuple[float, float, float, float]]] = [
+            [] for _ in range(self.size)
+        ]
+        boundary = bytearray(self.size * self.size)
+        for edge in self.edges:
+            first_row, last_row = sorted((self._row(edge[1]), self._row(edge[3])))
+            first_col, last_col = sorted((self._col(edge[0]), self._col(edge[2])))
+            for row in range(first_row, last_row + 1):
+                self._rows[row].append(edge)
+                for col in range(first_col, last_col + 1):
+                    boundary[row * self.size + col] = 1
+
+        self._cells = bytearray(self.size * self.size)
+        for row in range(self.size):
+            y = self.envelope[1] + (row + 0.5) * self._height
+            for col in range(self.size):
+                cell = row * self.size + col
+                if boundary[cell]:
+                    self._cells[cell] = BOUNDARY
+                else:
+                    x = self.envelope[0] + (col + 0.5) * self._width
+                    self._cells[cell] = INSIDE if self.contains(x, y) else OUTSIDE
+
+    def _row(self, y: float) -> int:
+        """Return the grid row of a y coordinate, clamped to the grid."""
+        return min(self.size - 1, max(0, int((y - self.envelope[1]) / self._height)))
+
+    def _col(self, x: float) -> int:
+        """Return the grid column of an x coordinate, clamped to the grid."""
+        return min(self.size - 1, max(0, int((x - self.envelope[0]) / self._width)))
+
+    def contains(self, x: float, y: float) -> bool:
+        """Return whether a point is inside the polygon, by ray casting."""
+        envelope = self.envelope
+        if not (envelope[0] <= x <= envelope[2] and envelope[1] <= y <= envelope[3]):
+            return False
+        inside = False
+        for x1, y1, x2, y2 in self._rows[self._row(y)]:
+            if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+        return inside
+
+    def classify(self, envelope: Envelope) -> int:
+        """Return whether an envelope is `INSIDE`, `OUTSIDE`, or on the `BOUNDARY`."""
+        if not envelopes_intersect(envelope, self.envelope):
+            return OUTSIDE
+        outer = not (
+            self.envelope[0] <= envelope[0]
+            and envelope[2] <= self.envelope[2]
+            and self.envelope[1] <= envelope[1]
+            and envelope[3] <= self.envelope[3]
+        )
+        states = {
+            self._cells[row * self.size + col]
+            for row in range(self._row(envelope[1]), self._row(envelope[3]) + 1)
+            for col in range(self._col(envelope[0]), self._col(envelope[2]) + 1)
+        }
+        if outer:
+            states.add(OUTSIDE)
+        return states.pop() if len(states) == 1 else BOUNDARY
+
+    def crosses(self, edge: Tuple[float, float, float, float]) -> bool:
+        """Return whether a segment meets an edge of the polygon."""
+        first_row, last_row = sorted((self._row(edge[1]), self._row(edge[3])))
+        return any(
+            segments_intersect(edge, other)
+            for row in range(first_row, last_row + 1)
+            for other in self._rows[row]
+        )
+
+    def intersects(self, feature: dict) -> bool:
+        """Return whether a feature is in the polygon or overlaps it.
+
+        Features entirely inside or outside the polygon's grid cells are decided
+        by their envelope. Others are kept if any of their vertices is inside, if
+        any of their edges meets the polygon's, or if one of their polygons
+        covers the clipping polygon.
+        """
+        envelope = feature_envelope(feature)
+        if envelope is None:
+            return False
+        state = self.classify(envelope)
+        if state != BOUNDARY:
+            return state == INSIDE
+        geometry = feature.get("geometry")
+        if any(
+            self.contains(position[0], position[1])
+            for position in geometry_positions(geometry)
+        ):
+            return True
+        if any(
+            self.crosses((line[i][0], line[i][1], line[i + 1][0], line[i + 1][1]))
+            for line in _geometry_lines(geometry)
+            for i in range(len(line) - 1)
+        ):
+            return True
+        # With no vertex inside and no edges crossing, a polygon either covers each
+        # ring of the clipping polygon or misses it, so one vertex of each decides.
+        return any(
+            sum(ring_contains(ring, x, y) for ring in rings) % 2 == 1
+            for rings in _polygons(geometry)
+            for x, y in self._ring_starts
+        )
+
+
+class GridIndex:
+    """A uniform grid index of envelopes, for finding what is near a location.
+
+    Items are numbered in the order they are inserted. Their envelopes are kept in
+    arrays, and once all are inserted each (cell, item) pair is sorted into a
+    compressed layout: a sorted array of the occupied cells' keys with offsets
+    into one array of items. A query binary searches for each cell it covers, so
+    lookups stay fast with millions of items and no per-cell Python objects.
+
+    Args:
+        cell_size (float, optional): The width and height of the grid cells, in
+            degrees. Defaults to 0.01, about a kilometer.
+    """
+
+    def __init__(self, cell_size: float = 0.01) -> None:
+        """@private"""
+        self.cell_size = cell_size
+        self._bounds = array("d")
+        self._pending_keys = array("q")
+        self._pending_items = array("I")
+        self._keys = array("q")
+        self._offsets = array("I", [0])
+        self._items = array("I")
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Return the grid column and row of a location."""
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    @staticmethod
+    def _key(col: int, row: int) -> int:
+        """Return the sort key of a cell, ordered by row and then column."""
+        return (row << 32) + col
+
+    def insert(self, envelope: Envelope) -> int:
+        """Add an envelope to the index, and return its item number."""
+        item = len(self._bounds) // 4
+        self._bounds.extend(envelope)
+        first_col, first_row = self._cell(envelope[0], envelope[1])
+        last_col, last_row = self._cell(envelope[2], envelope[3])
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                self._pending_keys.append(self._key(col, row))
+                self._pending_items.append(item)
+        return item
+
+    def _build(self) -> None:
+        """Merge the pending items into the sorted layout."""
+        keys = [*self._pending_keys]
+        items = [*self._pending_items]
+        for i, key in enumerate(self._keys):
+            start, end = self._offsets[i], self._offsets[i + 1]
+            keys.extend([key] * (end - start))
+            items.extend(self._items[start:end])
+        self._keys, self._offsets, self._items = array("q"), array("I"), array("I")
+        for key, item in sorted(zip(keys, items)):
+            if not self._keys or self._keys[-1] != key:
+                self._keys.append(key)
+                self._offsets.append(len(self._items))
+            self._items.append(item)
+        self._offsets.append(len(self._items))
+        self._pending_keys, self._pending_items = array("q"), array("I")
+
+    def envelope(self, item: int) -> Envelope:
+        """Return the envelope of an item."""
+        bounds = self._bounds
+        return (
+            bounds[4 * item],
+            bounds[4 * item + 1],
+            bounds[4 * item + 2],
+            bounds[4 * item + 3],
+        )
+
+    def query(self, envelope: Envelope) -> List[int]:
+        """Return the items whose envelopes intersect an envelope, in item order."""
+        if self._pending_keys:
+            self._build()
+        first_col, first_row = self._cell(envelope[0], envelope[1])
+        last_col, last_row = self._cell(envelope[2], envelope[3])
+        found = set()
+        for row in range(first_row, last_row + 1):
+            low = bisect_left(self._keys, self._key(first_col, row))
+            high = bisect_left(self._keys, self._key(last_col + 1, row), lo=low)
+            for cell in range(low, high):
+                found.update(self._items[self._offsets[cell] : self._offsets[cell + 1]])
+        return sorted(
+            item for item in found if envelopes_intersect(self.envelope(item), envelope)
+        )
+
+    def __len__(self) -> int:
+        """@private"""
+        return len(self._bounds) // 4
+
+
+def clip_geometry(geojson: dict) -> dict:
+    """Return the polygons of a GeoJSON object as one `MultiPolygon` geometry.
+
+    Accepts a geometry, a feature, or a feature collection.
+    """
+    if geojson.get("type") == "FeatureCollection":
+        geometries = [feature["geometry"] for feature in geojson["features"]]
+    elif geojson.get("type") == "Feature":
+        geometries = [geojson["geometry"]]
+    else:
+        geometries = [geojson]
+    polygons = []
+    for geometry in geometries:
+        if geometry["type"] == "Polygon":
+            polygons.append(geometry["coordinates"])
+        elif geometry["type"] == "MultiPolygon":
+            polygons.extend(geometry["coordinates"])
+    if not polygons:
+        raise ValueError("The clipping GeoJSON has no polygons.")
+    return {"type": "MultiPolygon", "coordinates": polygons}
+
+
+def filter_geojson(
+    geojson: dict,
+    bbox: Optional[Envelope] = None,
+    clip: Optional[PreparedPolygon] = None,
+) -> dict:
+    """Keep only the features of a GeoJSON in a bounding box and a polygon.
+
+    Args:
+        geojson (dict): The dictionary representation of the GeoJSON.
+        bbox (Envelope, optional): Keep features whose envelope overlaps this one.
+        clip (PreparedPolygon, optional): Keep features in this polygon. See
+            `PreparedPolygon.intersects`.
+
+    Returns:
+        dict: The GeoJSON with only the matching features.
+    """
+    features = []
+    for feature in geojson["features"]:
+        if bbox is not None:
+            envelope = feature_envelope(feature)
+            if envelope is None or not envelopes_intersect(envelope, bbox):
+                continue
+        if clip is not None and not clip.intersects(feature):
+            continue
+        features.append(feature)
+    geojson["features"] = features
+    return geojson
@@ -0,0 +1,171 @@
+"""Split converted features into one GeoJSON file per map tile.
+
+Import projects divide their work into tiles of the web map grid, so each task
+can be reviewed on its own. Features are routed to their tile's file as they are
+written, with no sorting of the input. Only a limited number of files are kept
+open at once, and the least recently used one is closed when another is needed,
+so a large area with many tiles doesn't run out of file handles.
+"""
+
+# ruff: noqa: D415
+
+import json
+import os
+from collections import OrderedDict
+from math import asinh, floor, pi, radians, tan
+from typing import IO, Dict, List, Tuple
+
+from .spatial import feature_envelope
+
+MAX_LATITUDE = 85.0511287798
+"""float: The latitude where the web map grid ends."""
+
+
+def tile_of(lon: float, lat: float, zoom: int) -> Tuple[int, int]:
+    """Return the x and y of the web map tile a location is in at a zoom level."""
+    n = 1 << zoom
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    x = floor((lon + 180) / 360 * n)
+    y = floor((1 - asinh(tan(radians(lat))) / pi) / 2 * n)
+    return min(n - 1, max(0, x)), min(n - 1, max(0, y))
+
+
+def quadkey(x: int, y: int, zoom: int) -> str:
+    """Return the quadkey of a tile."""
+    digits = []
+    for level in range(zoom, 0, -1):
+        mask = 1 << (level - 1)
+        digits.append(str((1 if x & mask else 0) + (2 if y & mask else 0)))
+    return "".join(digits)
+
+
+class TileWriter:
+    """Write GeoJSON features to a file for each tile they are in.
+
+    A feature is in the tile of the center of its envelope. Each tile's file is a
+    GeoJSON feature collection, and a `manifest.json` listing the tiles and their
+    number of features is written when the writer is closed.
+
+    Example usage:
+    ```python
+    from overturetoosm.tiles import TileWriter
+
+    with TileWriter("tiles", zoom=14) as writer:
+        for feature in geojson["features"]:
+            writer.write(feature)
+    ```
+
+    Args:
+        directory (str): The directory to write the tiles to.
+        zoom (int): The zoom level of the tiles.
+        naming (str, optional): How to name the tiles' files. The "xyz" option
+            writes `{z}/{x}/{y}.geojson`, and "quadkey" writes `{quadkey}.geojson`.
+            Defaults to "xyz".
+        max_open (int, optional): The most files to keep open at once. Defaults
+            to 64.
+    """
+
+    def __init__(
+        self, directory: str, zoom: int, naming: str = "xyz", max_open: int = 64
+    ) -> None:
+        """@private"""
+        if naming not in ("xyz", "quadkey"):
+            raise ValueError(f"Unknown tile naming {naming!r}.")
+        self.directory = directory
+        self.zoom = zoom
+        self.naming = naming
+        self.max_open = max(1, max_open)
+        self.counts: Dict[Tuple[int, int], int] = {}
+        self.skipped = 0
+        self.closed = False
+        self._files: "OrderedDict[Tuple[int, int], IO[str]]" = OrderedDict()
+
+    def path(self, tile: Tuple[int, int]) -> str:
+        """Return the path of a tile's file."""
+        x, y = tile
+        if self.naming == "quadkey":
+            return os.path.join(self.directory, f"{quadkey(x, y, self.zoom)}.geojson")
+        return os.path.join(self.directory, str(self.zoom), str(x), f"{y}.geojson")
+
+    def _file(self, tile: Tuple[int, int]) -> IO[str]:
+        """Return the open file of a tile, opening it and closing another if needed."""
+        f = self._files.get(tile)
+        if f is not None:
+            self._files.move_to_end(tile)
+            return f
+        if len(self._files) >= self.max_open:
+            self._files.popitem(last=False)[1].close()
+        path = self.path(tile)
+        new = tile not in self.counts
+        if new:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # The pool closes files on eviction and in `close`, not with a context.
+        f = open(path, "w" if new else "a", encoding="utf-8")  # noqa: SIM115
+        if new:
+            f.write('{"type": "FeatureCollection", "features": [\n')
+            self.counts[tile] = 0
+        self._files[tile] = f
+        return f
+
+    def write(self, feature: dict) -> None:
+        """Write a feature to the file of its tile.
+
+        Features without a geometry aren't written, and are counted in `skipped`.
+        """
+        envelope = feature_envelope(feature)
+        if envelope is None:
+            self.skipped += 1
+            return
+        tile = tile_of(
+            (envelope[0] + envelope[2]) / 2, (envelope[1] + envelope[3]) / 2, self.zoom
+        )
+        f = self._file(tile)
+        if self.counts[tile]:
+            f.write(",\n")
+        f.write(json.dumps(feature))
+        self.counts[tile] += 1
+
+    def manifest(self) -> dict:
+        """Return the manifest of the tiles written so far."""
+        tiles: List[dict] = []
+        for (x, y), count in sorted(self.counts.items()):
+            tiles.append(
+                {
+                    "z": self.zoom,
+                    "x": x,
+                    "y": y,
+                    "quadkey": quadkey(x, y, self.zoom),
+                    "path": os.path.relpath(self.path((x, y)), self.directory),
+                    "features": count,
+                }
+            )
+        return {
+            "zoom": self.zoom,
+            "naming": self.naming,
+            "features": sum(self.counts.values()),
+            "tiles": tiles,
+        }
+
+    def close(self) -> None:
+        """Close the tiles' files, ending each collection, and write the manifest."""
+        if self.closed:
+            return
+        self.closed = True
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        for tile in self.counts:
+            with open(self.path(tile), "a", encoding="utf-8") as f:
+                f.write("\n]}\n")
+        with open(
+            os.path.join(self.directory, "manifest.json"), "w", encoding="utf-8"
+        ) as f:
+            json.dump(self.manifest(), f, indent=4)
+
+    def __enter__(self) -> "TileWriter":
+        """@private"""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """@private"""
+        self.close()
@@ -0,0 +1,127 @@
+"""Normalise Overture speeds and vehicle dimensions to OSM's unit conventions.
+
+OSM's `maxspeed` is in km/h unless it ends in ` mph`, lengths like `maxheight` are
+in meters unless written in feet and inches (`12'6"`), and `maxweight` is in
+tonnes unless it ends in ` lbs` or ` st`. Units OSM doesn't use are converted.
+
+The `format_*` functions convert one value, for the per-feature converters, and
+the `normalise_*` functions convert columns of values and units, like the columns
+of a GeoParquet file.
+"""
+
+from typing import List, Mapping, Optional, Sequence
+
+LENGTH_FACTORS: Mapping[str, float] = {
+    "in": 0.0254,
+    "ft": 0.3048,
+    "yd": 0.9144,
+    "mi": 1609.344,
+    "cm": 0.01,
+    "m": 1.0,
+    "km": 1000.0,
+}
+"""Mapping[str, float]: Meters in each Overture length unit."""
+
+WEIGHT_FACTORS: Mapping[str, float] = {
+    "oz": 0.028349523125e-3,
+    "lb": 0.45359237e-3,
+    "st": 0.90718474,
+    "lt": 1.0160469088,
+    "g": 1e-6,
+    "kg": 1e-3,
+    "t": 1.0,
+}
+"""Mapping[str, float]: Tonnes in each Overture weight unit."""
+
+WEIGHT_SUFFIXES: Mapping[str, str] = {"lb": "lbs", "st": "st"}
+"""Mapping[str, str]: Weight units that OSM keeps as signposted, and their suffix."""
+
+
+def format_number(value: float) -> str:
+    """Format a number with at most two decimal places."""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def format_speed(value: float, unit: Optional[str] = None) -> str:
+    """Format one speed as an OSM `maxspeed` value, km/h where `unit` is `None`."""
+    return f"{format_number(value)} mph" if unit == "mph" else format_number(value)
+
+
+def format_length(value: float, unit: Optional[str] = None) -> str:
+    """Format one length as an OSM value, meters where `unit` is `None`."""
+    if unit in ("ft", "in"):
+        feet, inches = divmod(
+            round(value * LENGTH_FACTORS[unit] / LENGTH_FACTORS["in"]), 12
+        )
+        return f"{feet}'{inches}\""
+    return format_number(value * LENGTH_FACTORS[unit or "m"])
+
+
+def format_weight(value: float, unit: Optional[str] = None) -> str:
+    """Format one weight as an OSM value, tonnes where `unit` is `None`."""
+    if unit in WEIGHT_SUFFIXES:
+        return f"{format_number(value)} {WEIGHT_SUFFIXES[unit]}"
+    return format_number(value * WEIGHT_FACTORS[unit or "t"])
+
+
+def normalise_speeds(
+    values: Sequence[float], units: Sequence[Optional[str]]
+) -> List[str]:
+    """Format a column of speeds as OSM `maxspeed` values.
+
+    Args:
+        values (Sequence[float]): The speeds.
+        units (Sequence[Optional[str]]): The unit of each speed, "km/h" or "mph".
+            Defaults to "km/h" where `None`.
+
+    Returns:
+        List[str]: The OSM values.
+    """
+    return list(map(format_speed, values, units))
+
+
+def normalise_lengths(
+    values: Sequence[float], units: Sequence[Optional[str]]
+) -> List[str]:
+    """Format a column of lengths as OSM `maxheight`, `maxwidth`, or `maxlength` values.
+
+    Feet and inches are kept in the `12'6"` form, and other units are converted to
+    meters.
+
+    Args:
+        values (Sequence[float]): The lengths.
+        units (Sequence[Optional[str]]): The Overture unit of each length. Defaults
+            to meters where `None`.
+
+    Returns:
+        List[str]: The OSM values.
+    """
+    return list(map(format_length, values, units))
+
+
+def normalise_weights(
+    values: Sequence[float], units: Sequence[Optional[str]]
+) -> List[str]:
+    """Format a column of weights as OSM `maxweight` values.
+
+    Pounds and short tons are kept with their unit, and other units are converted
+    to tonnes.
+
+    Args:
+        values (Sequence[float]): The weights.
+        units (Sequence[Optional[str]]): The Overture unit of each weight. Defaults
+            to tonnes where `None`.
+
+    Returns:
+        List[str]: The OSM values.
+    """
+    return list(map(format_weight, values, units))
+
+
+def normalise_dimension(dimension: str, value: float, unit: Optional[str]) -> str:
+    """Format a single vehicle dimension limit as an OSM value."""
+    if dimension == "weight":
+        return format_weight(value, unit)
+    if dimension == "axle_count":
+        return format_number(value)
+    return format_length(value, unit)
@@ -1,15 +1,71 @@
 """Useful functions for the project."""
 
-from typing import Callable, Optional
+from itertools import chain, repeat
+from operator import mul, truediv
+from typing import Any, Callable, List, Optional
 
+from .cache import ConversionCache, options_key
+from .interning import tag_pool
 from .objects import ConfidenceError, UnmatchedError
 
 
+def _quantize_points(points: List[List[float]], scale: float) -> List[List[float]]:
+    """Quantize a list of positions that all have the same number of dimensions."""
+    values = chain.from_iterable(points)
+    fixed = map(round, map(mul, values, repeat(scale)))
+    flat = iter(map(truediv, fixed, repeat(scale)))
+    return [list(point) for point in zip(*[flat] * len(points[0]))]
+
+
+def quantize_coordinates(coords: Any, precision: int = 7) -> Any:
+    """Round GeoJSON coordinates of any geometry type to a number of decimal places.
+
+    Each list of positions is flattened and every value becomes
+    `round(x * 10**precision) / 10**precision`, computed with `map` calls over the
+    whole list. This can differ from `round(x, precision)` by one unit in the last
+    place kept, for values that the multiplication itself rounds onto or across a
+    halfway point.
+
+    Args:
+        coords (Any): A GeoJSON `coordinates` array.
+        precision (int, optional): The number of decimal places to keep. Defaults
+            to 7, the precision of OSM's coordinates.
+
+    Returns:
+        Any: The rounded coordinates, in the same structure.
+    """
+    if not coords:
+        return coords
+    if isinstance(coords[0], (int, float)):
+        return _quantize_points([coords], 10.0**precision)[0]
+    if isinstance(coords[0][0], (int, float)):
+        if all(len(point) == len(coords[0]) for point in coords):
+            return _quantize_points(coords, 10.0**precision)
+        return [quantize_coordinates(point, precision) for point in coords]
+    return [quantize_coordinates(part, precision) for part in coords]
+
+
+def quantize_geometry(geometry: Optional[dict], precision: int = 7) -> Optional[dict]:
+    """Round the coordinates of a GeoJSON geometry in place, and return it."""
+    if geometry is None:
+        return geometry
+    if geometry.get("type") == "GeometryCollection":
+        for part in geometry.get("geometries", []):
+            quantize_geometry(part, precision)
+    elif "coordinates" in geometry:
+        geometry["coordinates"] = quantize_coordinates(
+            geometry["coordinates"], precision
+        )
+    return geometry
+
+
 def process_geojson(
     geojson: dict,
     fx: Callable,
     confidence: Optional[float] = None,
     options: Optional[dict] = None,
+    cache: Optional[ConversionCache] = None,
+    precision: Optional[int] = None,
 ) -> dict:
     """Convert an Overture `place` GeoJSON to one that follows OSM's schema.
 
@@ -31,21 +87,48 @@ def process_geojson(
         confidence (float, optional): The minimum confidence level. Defaults to 0.0.
         options (dict, optional): Function-specific options to pass as arguments to
             the `fx` function.
+        cache (ConversionCache, optional): A cache of converted features. Features
+            with an `id` and `version` found in the cache skip validation and
+            conversion, and new ones are added to it. Defaults to None.
+        precision (int, optional): The number of decimal places to round the
+            coordinates of converted features to. Defaults to None, which leaves
+            them unchanged.
 
     Returns:
         dict: The dictionary representation of the GeoJSON that follows OSM's schema.
     """
     options = options or {}
+    key = options_key(fx, confidence, options) if cache is not None else ""
     new_features = []
     for feature in geojson["features"]:
+        props = feature["properties"]
+        feature_id, version = props.get("id"), props.get("version")
+        cacheable = isinstance(feature_id, str) and version is not None
+        if cache is not None and cacheable:
+            hit, tags = cache.get(feature_id, version, key)
+            if hit:
+                if tags is not None:
+                    feature["properties"] = tag_pool.intern_tags(tags)
+                    if precision is not None:
+                        quantize_geometry(feature.get("geometry"), precision)
+                    new_features.append(feature)
+                continue
+
+        tags = None
         try:
             if confidence:
-                feature["properties"] = fx(feature["properties"], confidence, **options)
+                tags = fx(props, confidence, **options)
             else:
-                feature["properties"] = fx(feature["properties"], **options)
-            new_features.append(feature)
+                tags = fx(props, **options)
         except (ConfidenceError, UnmatchedError):
             pass
+        if cache is not None and cacheable:
+            cache.put(feature_id, version, key, tags)
+        if tags is not None:
+            feature["properties"] = tags
+            if precision is not None:
+                quantize_geometry(feature.get("geometry"), precision)
+            new_features.append(feature)
 
     geojson["features"] = new_features
     return geojson
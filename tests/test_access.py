@@ -0,0 +1,111 @@
+"""Test the access.py module."""
+
+from typing import Any, Dict
+
+import pytest
+
+from src.overturetoosm.access import access_tags, when_key
+from src.overturetoosm.segments import When, process_segment
+
+
+def tags(access_type: str, **when: Any) -> Dict[str, str]:
+    """Translate one access rule."""
+    key = when_key(When(**when))
+    assert key is not None
+    return dict(access_tags(access_type, key))
+
+
+def test_when_key_canonical() -> None:
+    """Test that rules differing only in order share a key."""
+    first = When(mode=["foot", "bicycle"])
+    second = When(mode=["bicycle", "foot", "bicycle"])
+    assert when_key(first) == when_key(second)
+    assert when_key(None) == when_key(When())
+    assert when_key(When(during={"not": "a string"})) is None
+
+
+@pytest.mark.parametrize(
+    "access_type, when, expected",
+    [
+        ("denied", {"mode": ["foot", "bicycle"]}, {"bicycle": "no", "foot": "no"}),
+        ("designated", {"mode": ["truck"]}, {"hgv": "designated"}),
+        ("denied", {"heading": "backward"}, {"oneway": "yes"}),
+        ("denied", {"heading": "forward"}, {"oneway": "-1"}),
+        (
+            "allowed",
+            {"heading": "backward", "mode": ["bicycle"]},
+            {"bicycle:backward": "yes"},
+        ),
+        ("allowed", {"using": ["at_destination"]}, {"access": "destination"}),
+        (
+            "allowed",
+            {"mode": ["car"], "recognized": ["as_private"]},
+            {"motorcar": "private"},
+        ),
+        ("denied", {"using": ["at_destination"]}, {}),
+        (
+            "denied",
+            {"mode": ["hgv"], "during": "Mo-Fr 07:00-09:00"},
+            {"hgv:conditional": "no @ (Mo-Fr 07:00-09:00)"},
+        ),
+        (
+            "denied",
+            {
+                "vehicle": [
+                    {
+                        "dimension": "weight",
+                        "comparison": "greater_than",
+                        "value": 7.5,
+                        "unit": "t",
+                    }
+                ]
+            },
+            {"maxweight": "7.5"},
+        ),
+        (
+            "denied",
+            {
+                "vehicle": [
+                    {"dimension": "height", "comparison": "less_than", "value": 3.0}
+                ]
+            },
+            {},
+        ),
+    ],
+)
+def test_access_tags(
+    access_type: str, when: Dict[str, Any], expected: Dict[str, str]
+) -> None:
+    """Test the translation of access rules."""
+    assert tags(access_type, **when) == expected
+
+
+def test_access_tags_cached() -> None:
+    """Test that repeated rules are served from the cache."""
+    access_tags.cache_clear()
+    for _ in range(3):
+        tags("denied", mode=["bicycle"])
+    info = access_tags.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_segment_access() -> None:
+    """Test access rules on a segment, with conditional values combined."""
+    rule = {"mode": ["hgv"], "during": "Mo-Fr 07:00-09:00"}
+    props = {
+        "id": "s1",
+        "version": 0,
+        "subtype": "road",
+        "class": "primary",
+        "access_restrictions": [
+            {"access_type": "denied", "when": {"heading": "backward"}},
+            {"access_type": "denied", "when": rule},
+            {"access_type": "denied", "when": {**rule, "during": "Sa 10:00-12:00"}},
+            {"access_type": "denied", "between": [0, 0.5]},
+        ],
+    }
+    assert process_segment(props) == {
+        "highway": "primary",
+        "oneway": "yes",
+        "hgv:conditional": "no @ (Mo-Fr 07:00-09:00); no @ (Sa 10:00-12:00)",
+    }
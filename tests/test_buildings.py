@@ -4,7 +4,7 @@ from typing import Any, Dict
 
 import pytest
 
-from src.overturetoosm.buildings import process_building
+from src.overturetoosm.buildings import process_building, process_building_part
 from src.overturetoosm.objects import ConfidenceError
 
 
@@ -94,3 +94,28 @@ def test_process_building_min_level(props_dict: dict, clean_dict: dict) -> None:
     props = process_building(props_dict)
     clean_dict["building:min_level"] = 2
     assert props == clean_dict
+
+
+def test_process_building_part(props_dict: dict) -> None:
+    """Test the process_building_part function."""
+    for key in ("has_parts", "subtype", "class", "num_floors_underground"):
+        props_dict.pop(key)
+    props_dict.update(
+        {
+            "type": "building_part",
+            "building_id": "b1",
+            "min_height": 3,
+            "roof_shape": "flat",
+        }
+    )
+    assert process_building_part(props_dict) == {
+        "building:part": "yes",
+        "building:levels": 4,
+        "height": 21.34,
+        "min_height": 3,
+        "roof:shape": "flat",
+        "source": "metaLidarExtractions, microsoftMLBuildings via overturetoosm",
+        "name": "Clarendon Family Dentistry",
+    }
+    with pytest.raises(ConfidenceError):
+        process_building_part(props_dict, confidence=0.9)
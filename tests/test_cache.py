@@ -0,0 +1,103 @@
+"""Test the cache.py module."""
+
+from copy import deepcopy
+from typing import Any, Dict
+
+import pytest
+
+from src.overturetoosm import cache as cache_module
+from src.overturetoosm import resources
+from src.overturetoosm.addresses import process_address
+from src.overturetoosm.cache import ConversionCache, options_key
+from src.overturetoosm.utils import process_geojson
+
+
+@pytest.fixture(name="geojson_dict")
+def geojson_fix() -> Dict[str, Any]:
+    """Fixture with a mock address geojson."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [-1, 1]},
+                "properties": {
+                    "id": "addr1",
+                    "version": 1,
+                    "country": "US",
+                    "postcode": "02459",
+                    "street": "COMMONWEALTH AVE",
+                    "number": "1000",
+                    "sources": [{"property": "", "dataset": "NAD", "confidence": None}],
+                },
+            }
+        ],
+    }
+
+
+def test_cache_roundtrip(tmp_path) -> None:
+    """Test that stored tags come back from a reopened cache."""
+    path = str(tmp_path / "cache.sqlite")
+    with ConversionCache(path) as cache:
+        cache.put("a", 1, "key", {"building": "yes"})
+        cache.put("b", 1, "key", None)
+    with ConversionCache(path) as cache:
+        assert cache.get("a", 1, "key") == (True, {"building": "yes"})
+        assert cache.get("b", 1, "key") == (True, None)
+        assert cache.get("a", 2, "key") == (False, None)
+        assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_eviction(tmp_path) -> None:
+    """Test that the least recently used entries are evicted first."""
+    with ConversionCache(str(tmp_path / "cache.sqlite"), max_bytes=50) as cache:
+        cache.put("a", 1, "key", {"building": "yes"})
+        cache.put("b", 1, "key", {"building": "yes"})
+        cache.get("a", 1, "key")
+        cache.put("c", 1, "key", {"building": "yes"})
+        assert cache.get("a", 1, "key")[0]
+        assert not cache.get("b", 1, "key")[0]
+        assert cache.get("c", 1, "key")[0]
+
+
+def test_cache_invalidated_by_mapping(tmp_path, monkeypatch) -> None:
+    """Test that a change to the tag mapping empties the cache."""
+    path = str(tmp_path / "cache.sqlite")
+    with ConversionCache(path) as cache:
+        cache.put("a", 1, "key", {"building": "yes"})
+    monkeypatch.setattr(cache_module, "mapping_hash", lambda: "changed")
+    with ConversionCache(path) as cache:
+        assert len(cache) == 0
+
+
+def test_mapping_hash(monkeypatch) -> None:
+    """Test that every resources table is part of the hash, not just places."""
+    before = cache_module.mapping_hash()
+    monkeypatch.setattr(
+        resources, "travel_mode_keys", {**resources.travel_mode_keys, "car": "car"}
+    )
+    assert cache_module.mapping_hash() != before
+
+
+def test_options_key() -> None:
+    """Test that the options are part of the key."""
+    assert options_key(process_address) == options_key(process_address, None, {})
+    assert options_key(process_address, options={"style": "US"}) != options_key(
+        process_address, options={"style": "CA"}
+    )
+
+
+def test_process_geojson_cache(tmp_path, geojson_dict: dict) -> None:
+    """Test that cached features skip conversion."""
+    with ConversionCache(str(tmp_path / "cache.sqlite")) as cache:
+        first = process_geojson(deepcopy(geojson_dict), process_address, cache=cache)
+        assert cache.misses == 1
+
+        def fail(props: dict, style: str = "US") -> Dict[str, str]:
+            raise AssertionError("cached feature was converted again")
+
+        fail.__qualname__ = process_address.__qualname__
+        fail.__module__ = process_address.__module__
+        second = process_geojson(deepcopy(geojson_dict), fail, cache=cache)
+        assert cache.hits == 1
+        assert first == second
@@ -0,0 +1,71 @@
+"""Test the categories.py module."""
+
+from typing import Dict
+
+import pytest
+
+from src.overturetoosm.categories import CategoryIndex, parse_taxonomy
+
+
+@pytest.fixture(name="taxonomy")
+def taxonomy_fix() -> Dict[str, str]:
+    """Fixture with a small parsed taxonomy."""
+    return parse_taxonomy(
+        [
+            "Category code; Overture Taxonomy",
+            "eat_and_drink; [eat_and_drink]",
+            "restaurant; [eat_and_drink,restaurant]",
+            "asian_restaurant; [eat_and_drink,restaurant,asian_restaurant]",
+            "szechuan_restaurant; [eat_and_drink,restaurant,asian_restaurant,"
+            "chinese_restaurant,szechuan_restaurant]",
+        ]
+    )
+
+
+@pytest.fixture(name="index")
+def index_fix(taxonomy: Dict[str, str]) -> CategoryIndex:
+    """Fixture with a category index over a small tag table."""
+    tags = {
+        "restaurant": {"amenity": "restaurant"},
+        "asian_restaurant": {"amenity": "restaurant", "cuisine": "asian"},
+        "cafe": {"amenity": "cafe"},
+    }
+    return CategoryIndex(tags, taxonomy)
+
+
+def test_parse_taxonomy(taxonomy: Dict[str, str]) -> None:
+    """Test that the taxonomy paths are turned into parent links."""
+    assert taxonomy == {
+        "restaurant": "eat_and_drink",
+        "asian_restaurant": "restaurant",
+        "chinese_restaurant": "asian_restaurant",
+        "szechuan_restaurant": "chinese_restaurant",
+    }
+
+
+def test_nearest(index: CategoryIndex) -> None:
+    """Test that categories resolve to their nearest tagged ancestor."""
+    assert index.nearest("asian_restaurant") == "asian_restaurant"
+    assert index.nearest("szechuan_restaurant") == "asian_restaurant"
+    assert index.nearest("eat_and_drink") is None
+    assert index.nearest("unknown") is None
+
+
+def test_resolve_prefers_exact_alternate(index: CategoryIndex) -> None:
+    """Test that an exact alternate match beats an ancestor of the main category."""
+    assert index.resolve("szechuan_restaurant", ["cafe"]) == {"amenity": "cafe"}
+
+
+def test_resolve_ancestor(index: CategoryIndex) -> None:
+    """Test that an ancestor is used when no category matches exactly."""
+    assert index.resolve("unknown", ["szechuan_restaurant"]) == {
+        "amenity": "restaurant",
+        "cuisine": "asian",
+    }
+    assert index.resolve("unknown", None) is None
+
+
+def test_cycle() -> None:
+    """Test that a cyclic taxonomy does not loop forever."""
+    index = CategoryIndex({}, {"a": "b", "b": "a"})
+    assert index.nearest("a") is None
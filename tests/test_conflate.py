@@ -0,0 +1,102 @@
+"""Test the conflate.py module."""
+
+from typing import Any, Dict
+
+import pytest
+
+from src.overturetoosm.conflate import (
+    OSMCandidates,
+    conflate_features,
+    names_match,
+    normalize_name,
+)
+
+OSM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="1" lat="42.35" lon="-71.06">
+    <tag k="amenity" v="cafe"/>
+    <tag k="name" v="Café Nero"/>
+  </node>
+  <node id="2" lat="42.3501" lon="-71.0601"/>
+  <node id="3" lat="42.3503" lon="-71.0601"/>
+  <node id="4" lat="42.3503" lon="-71.0603"/>
+  <way id="10">
+    <nd ref="2"/>
+    <nd ref="3"/>
+    <nd ref="4"/>
+    <tag k="shop" v="supermarket"/>
+    <tag k="brand:wikidata" v="Q1"/>
+  </way>
+  <relation id="20">
+    <member type="way" ref="10" role="outer"/>
+    <tag k="type" v="multipolygon"/>
+  </relation>
+  <node id="5" lat="42.36" lon="-71.06"/>
+</osm>
+"""
+
+
+def place(lon: float, lat: float, **tags: str) -> Dict[str, Any]:
+    """Return a converted place feature."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": tags,
+    }
+
+
+@pytest.fixture(name="candidates")
+def candidates_fix(tmp_path) -> OSMCandidates:
+    """Fixture with candidates loaded from an OSM XML file."""
+    path = tmp_path / "extract.osm"
+    path.write_text(OSM_XML, encoding="utf-8")
+    return OSMCandidates.load(str(path))
+
+
+def test_names() -> None:
+    """Test name normalization and matching."""
+    assert normalize_name("  Café  NERO! ") == "cafe nero"
+    assert names_match("cafe nero", "cafe nero boston")
+    assert names_match("the corner store", "corner store market")
+    assert not names_match("cafe nero", "starbucks")
+
+
+def test_load_xml(candidates: OSMCandidates) -> None:
+    """Test that tagged nodes and ways are loaded, at their nodes' average."""
+    assert candidates.ids == ["node/1", "way/10"]
+    assert candidates.kinds == ["amenity=cafe", "shop=supermarket"]
+    lon, lat, _, _ = candidates.index.envelope(1)
+    assert (lon, lat) == pytest.approx((-71.0601667, 42.3502333))
+
+
+def test_match(candidates: OSMCandidates) -> None:
+    """Test matching by name and kind, by brand, and rejecting distant places."""
+    assert candidates.match(-71.0605, 42.3502, {"name": "Cafe Nero", "amenity": "cafe"})
+    assert candidates.match(-71.0605, 42.3502, {"name": "Cafe Nero"}) is None
+    assert candidates.match(-71.0601, 42.3501, {"brand:wikidata": "Q1"}) == "way/10"
+    assert candidates.match(-71.07, 42.35, {"name": "Café Nero"}) is None
+
+
+def test_conflate_features(candidates: OSMCandidates) -> None:
+    """Test flagging and dropping duplicates."""
+    features = [
+        place(-71.06, 42.35, name="Cafe Nero", amenity="cafe"),
+        place(-71.061, 42.35, name="Other", amenity="cafe"),
+    ]
+    flagged = list(conflate_features([dict(f) for f in features], candidates))
+    assert flagged[0]["properties"]["fixme"] == "possible duplicate of node/1"
+    assert "fixme" not in flagged[1]["properties"]
+    kept = list(conflate_features(features[1:], candidates, duplicates="drop"))
+    assert len(kept) == 1
+
+
+def test_from_geojson() -> None:
+    """Test loading candidates from GeoJSON with ids in each supported place."""
+    geojson = {
+        "features": [
+            {"id": "node/1", **place(0, 0, name="A")},
+            {**place(0, 0, name="B", **{"@id": "way/2"})},
+            place(0, 0, highway="residential"),
+        ]
+    }
+    assert OSMCandidates.from_geojson(geojson).ids == ["node/1", "way/2"]
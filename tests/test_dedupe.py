@@ -0,0 +1,88 @@
+"""Test the dedupe.py module."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.overturetoosm.dedupe import (
+    bucket_precision,
+    dedupe_places,
+    geohash_cell,
+    name_key,
+)
+
+
+def place(
+    lon: float,
+    lat: float,
+    name: str,
+    confidence: float,
+    dataset: str = "meta",
+    phone: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Return an Overture place feature."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": {
+            "names": {"primary": name},
+            "confidence": confidence,
+            "phones": phone,
+            "sources": [{"dataset": dataset}],
+        },
+    }
+
+
+@pytest.fixture(name="places")
+def places_fix() -> Dict[str, Any]:
+    """Fixture with duplicates in one cell, across cells, and a distinct place."""
+    # 0.00137 degrees of longitude is one geohash cell at precision 7.
+    return {
+        "features": [
+            place(-71.0600, 42.35, "Starbucks", 0.6),
+            place(-71.0601, 42.35, "Starbucks Coffee", 0.9, "msft", ["+1 555"]),
+            place(-71.0599, 42.35, "Dunkin'", 0.5),
+            place(-71.05960, 42.35, "The Corner Deli", 0.4),
+            place(-71.05956, 42.35, "Corner Deli", 0.3, phone=["+1 556"]),
+            place(-71.0700, 42.35, "Starbucks", 0.7),
+            place(-71.06, 42.35, "", 0.9),
+        ]
+    }
+
+
+def test_keys() -> None:
+    """Test geohash cells and name keys."""
+    assert geohash_cell(0, 0, 1) == (4, 2)
+    assert geohash_cell(180, 90, 1) == (7, 3)
+    assert name_key("the corner deli") == "corner"
+    assert name_key("the") == "the"
+
+
+def test_dedupe_places(places: Dict[str, Any]) -> None:
+    """Test keeping the most confident of each group of duplicates."""
+    assert dedupe_places(places) == 2
+    names = [f["properties"]["names"]["primary"] for f in places["features"]]
+    assert names == ["Starbucks Coffee", "Dunkin'", "The Corner Deli", "Starbucks", ""]
+    assert places["features"][2]["properties"]["phones"] is None
+
+
+def test_dedupe_places_merge(places: Dict[str, Any]) -> None:
+    """Test filling the kept place's properties from its duplicates."""
+    dedupe_places(places, merge=True)
+    kept = places["features"][0]["properties"]
+    assert kept["sources"] == [{"dataset": "msft"}, {"dataset": "meta"}]
+    assert places["features"][2]["properties"]["phones"] == ["+1 556"]
+
+
+def test_dedupe_places_high_latitude() -> None:
+    """Test that cells are wide enough at the places' latitude."""
+    assert bucket_precision(60, 70) < bucket_precision(60)
+    # Both are at 70 degrees, 55 meters apart, and two cells apart at 60 degrees.
+    places = {
+        "features": [
+            place(20.0006, 70.0, "Cafe", 0.5),
+            place(20.00205, 70.0, "Cafe", 0.9),
+        ]
+    }
+    assert dedupe_places(places, radius=60) == 1
+    assert places["features"][0]["properties"]["confidence"] == 0.9
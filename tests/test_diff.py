@@ -0,0 +1,83 @@
+"""Test the diff.py module."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from src.overturetoosm.diff import ReleaseDiff, ReleaseIndex
+
+GERS = "08b2a100d2c9bfff0200a8e2a4d1bd0d"
+
+
+def release(*features: tuple) -> Dict[str, List[Dict[str, Any]]]:
+    """Return an Overture GeoJSON of `(id, version, name)` features."""
+    return {
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+                "properties": {"id": id_, "version": version, "name": name},
+            }
+            for id_, version, name in features
+        ]
+    }
+
+
+def convert(geojson: dict) -> dict:
+    """Stand in for `process_geojson`, keeping only the name."""
+    for feature in geojson["features"]:
+        feature["properties"] = {"name": feature["properties"]["name"]}
+    return geojson
+
+
+@pytest.fixture(name="previous")
+def previous_fix(tmp_path) -> ReleaseIndex:
+    """Fixture with the index of a first run, saved and loaded again."""
+    diff = ReleaseDiff(key="k")
+    contents = release((GERS, 1, "A"), ("b", 1, "B"), ("c", 1, "C"), ("d", 1, "D"))
+    assert diff.skip_unchanged(contents) == 0
+    changes = diff.compare(convert(contents))
+    assert len(changes["created"]) == 4
+    diff.index.save(str(tmp_path / "first.idx"))
+    return ReleaseIndex.load(str(tmp_path / "first.idx"))
+
+
+def test_release_index(previous: ReleaseIndex) -> None:
+    """Test that an index keeps its entries through a file."""
+    assert len(previous) == 4
+    assert previous.key == "k"
+    number = previous.ids.get(GERS)
+    assert number == 0
+    assert previous.versions[number] == 1
+    assert (previous.lons[number], previous.lats[number]) == (1.0, 2.0)
+
+
+def test_release_diff(previous: ReleaseIndex) -> None:
+    """Test finding the created, modified, and deleted features."""
+    diff = ReleaseDiff(previous, key="k")
+    contents = release(
+        (GERS, 1, "A"), ("b", 2, "B"), ("c", 2, "C2"), ("e", 1, "E"), (None, 1, "F")
+    )
+    assert diff.skip_unchanged(contents) == 1
+    changes = diff.compare(convert(contents))
+    assert [f["properties"]["name"] for f in changes["created"]] == ["E", "F"]
+    assert [f["id"] for f in changes["modified"]] == ["c"]
+    assert changes["deleted"] == [
+        {
+            "type": "Feature",
+            "id": "d",
+            "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+            "properties": {},
+        }
+    ]
+    assert len(diff.index) == 4
+    assert diff.index.versions[diff.index.ids.get("b")] == 2
+
+
+def test_release_diff_new_key(previous: ReleaseIndex) -> None:
+    """Test that nothing is skipped by version when the key changes."""
+    diff = ReleaseDiff(previous, key="other")
+    contents = release((GERS, 1, "A"), ("b", 1, "B"), ("c", 1, "C"), ("d", 1, "D"))
+    assert diff.skip_unchanged(contents) == 0
+    changes = diff.compare(convert(contents))
+    assert not any(changes.values())
@@ -0,0 +1,71 @@
+"""Test the geometry.py module."""
+
+from math import cos, hypot, pi, radians, sin
+from typing import List, Tuple
+
+from src.overturetoosm.geometry import METERS_PER_DEGREE, clean_geometry, clean_ring
+
+SQUARE = [[0.0, 0.0], [0.001, 0.0], [0.001, 0.001], [0.0, 0.001], [0.0, 0.0]]
+
+
+def test_clean_ring_duplicates_and_collinear() -> None:
+    """Test that repeated and collinear vertices are removed."""
+    ring = [
+        [0.0, 0.0],
+        [0.0005, 0.0],
+        [0.001, 0.0],
+        [0.001, 0.0],
+        [0.001, 0.001],
+        [0.0, 0.001],
+        [0.0, 0.0005000001],
+        [0.0, 0.0],
+    ]
+    assert clean_ring(ring) == SQUARE
+
+
+def test_clean_ring_closing_vertex() -> None:
+    """Test that a collinear first vertex is removed too."""
+    ring = [[0.0005, 0.0], *SQUARE[1:4], [0.0, 0.0], [0.0005, 0.0]]
+    assert clean_ring(ring) == [*SQUARE[1:4], [0.0, 0.0], [0.001, 0.0]]
+
+
+def test_clean_ring_unchanged() -> None:
+    """Test that clean and degenerate rings are left as they are."""
+    assert clean_ring(SQUARE) == SQUARE
+    sliver = [[0.0, 0.0], [0.001, 0.0], [0.002, 0.0], [0.0015, 0.0], [0.0, 0.0]]
+    assert clean_ring(sliver) == sliver
+
+
+def test_clean_geometry() -> None:
+    """Test cleaning a multipolygon in place and counting the vertices removed."""
+    ring = [SQUARE[0], SQUARE[0], *SQUARE[1:]]
+    geometry = {"type": "MultiPolygon", "coordinates": [[ring], [list(SQUARE)]]}
+    assert clean_geometry(geometry) == (1, 11)
+    assert geometry["coordinates"] == [[SQUARE], [SQUARE]]
+    assert clean_geometry({"type": "Point", "coordinates": [0, 0]}) == (0, 0)
+
+
+def test_clean_ring_curve() -> None:
+    """Test that no vertex of a curved ring moves more than the tolerance."""
+    scale = cos(radians(40.0)) * METERS_PER_DEGREE
+    arc = [
+        [10 * cos(pi * i / 200) / scale, 40.0 + 10 * sin(pi * i / 200) / 111_320]
+        for i in range(201)
+    ]
+    ring = [*arc, arc[0]]
+    cleaned = clean_ring(ring, 0.1)
+    assert 4 < len(cleaned) < len(ring)
+
+    def meters(point: List[float]) -> Tuple[float, float]:
+        return point[0] * scale, (point[1] - 40.0) * METERS_PER_DEGREE
+
+    def offset(point: List[float], start: List[float], end: List[float]) -> float:
+        (px, py), (ax, ay), (bx, by) = meters(point), meters(start), meters(end)
+        dx, dy = bx - ax, by - ay
+        t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)))
+        return hypot(px - ax - t * dx, py - ay - t * dy)
+
+    deviation = max(
+        min(offset(point, a, b) for a, b in zip(cleaned, cleaned[1:])) for point in arc
+    )
+    assert deviation <= 0.1 + 1e-9
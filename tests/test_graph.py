@@ -0,0 +1,95 @@
+"""Test the graph.py module."""
+
+import pytest
+
+from src.overturetoosm.graph import ConnectorGraph, GraphBuilder, IdTable
+
+A = "08f2aa87b35152b0043d58306bb3a4df"
+B = "08f2aa87b0c91a0a047f7b5dc588f541"
+
+
+@pytest.fixture(name="graph")
+def graph_fix() -> ConnectorGraph:
+    """Fixture with three segments meeting at connector `c2`."""
+    geojson = {
+        "features": [
+            {
+                "properties": {
+                    "id": "s1",
+                    "connectors": [
+                        {"connector_id": "c2", "at": 1},
+                        {"connector_id": "c1", "at": 0},
+                    ],
+                }
+            },
+            {"properties": {"id": "s2", "connector_ids": ["c2", "c3"]}},
+            {
+                "properties": {
+                    "id": "s3",
+                    "connectors": [
+                        {"connector_id": "c2", "at": 0},
+                        {"connector_id": "c4", "at": 0.5},
+                        {"connector_id": "c5", "at": 1},
+                    ],
+                }
+            },
+            {"properties": {"id": "s4", "connector_ids": ["c5", "c6"]}},
+        ]
+    }
+    return ConnectorGraph.from_geojson(geojson)
+
+
+def test_id_table() -> None:
+    """Test that GERS and other ids round trip through the table."""
+    table = IdTable()
+    assert [table.intern(i) for i in (A, "other", A, B)] == [0, 1, 0, 2]
+    assert table._packed[:16] == bytes.fromhex(A)
+    assert [table[i] for i in range(len(table))] == [A, "other", B]
+    assert table.get(B) == 2
+    assert table.get("missing") is None
+    assert "other" in table
+
+
+def test_id_table_mixed_case() -> None:
+    """Test that ids that don't round trip through bytes are kept as given."""
+    table = IdTable()
+    upper = A.upper()
+    assert [table.intern(i) for i in (upper, A, upper)] == [0, 1, 0]
+    assert [table[0], table[1]] == [upper, A]
+    assert table.get(upper) == 0
+    assert upper in table
+
+
+def test_id_table_growth() -> None:
+    """Test interning enough GERS ids to grow the hash table several times."""
+    table = IdTable()
+    ids = [f"{number:032x}" for number in range(1000)]
+    assert [table.intern(i) for i in ids] == list(range(1000))
+    assert [table.get(i) for i in ids] == list(range(1000))
+    assert table[999] == ids[999]
+    assert len(table) == 1000
+    assert table.get(f"{1000:032x}") is None
+
+
+def test_graph_lookups(graph: ConnectorGraph) -> None:
+    """Test the segments at a connector and the connectors of a segment."""
+    assert graph.connectors_of("s1") == ["c1", "c2"]
+    assert list(graph.positions_of_index(0)) == [0, 1]
+    assert graph.segments_at("c2") == ["s1", "s2", "s3"]
+    assert graph.segments_at("c5") == ["s3", "s4"]
+    assert graph.degree("c4") == 1
+    assert graph.segments_at("missing") == []
+
+
+def test_graph_neighbours(graph: ConnectorGraph) -> None:
+    """Test that neighbours are listed once, without the segment itself."""
+    assert graph.neighbours("s3") == ["s1", "s2", "s4"]
+    assert graph.neighbours("s4") == ["s3"]
+    assert graph.neighbours("missing") == []
+
+
+def test_builder_empty() -> None:
+    """Test building a graph with no segments."""
+    graph = GraphBuilder().build()
+    assert len(graph.segments) == 0
+    assert graph.neighbours("s1") == []
@@ -0,0 +1,77 @@
+"""Test the interning.py module."""
+
+import pytest
+
+from src.overturetoosm.buildings import process_building
+from src.overturetoosm.interning import StringPool, tag_pool
+from src.overturetoosm.utils import process_geojson
+
+
+@pytest.fixture(name="pool")
+def pool_fix() -> StringPool:
+    """Fixture with a small string pool."""
+    return StringPool(max_size=2, max_length=10)
+
+
+def test_intern_shares_copies(pool: StringPool) -> None:
+    """Test that equal strings built separately come back as one object."""
+    first = "".join(["re", "staurant"])
+    second = "".join(["rest", "aurant"])
+    assert first is not second
+    assert pool.intern(first) is first
+    assert pool.intern(second) is first
+    assert (pool.hits, pool.misses) == (1, 1)
+
+
+def test_intern_size_limit(pool: StringPool) -> None:
+    """Test that the pool stops growing once full."""
+    for value in ["a", "b", "c"]:
+        pool.intern(value)
+    assert len(pool) == 2
+    assert pool.intern("c") == "c"
+    assert pool.hits == 0
+
+
+def test_intern_length_limit(pool: StringPool) -> None:
+    """Test that long strings are never pooled."""
+    pool.intern("a" * 11)
+    assert len(pool) == 0
+
+
+def test_intern_tags(pool: StringPool) -> None:
+    """Test that high-cardinality values and non-strings are left alone."""
+    pool.max_size = 10
+    name = "".join(["Nam", "e"])
+    tags = pool.intern_tags({"name": name, "building": "yes", "height": 2.5})
+    assert tags == {"name": "Name", "building": "yes", "height": 2.5}
+    assert tags["name"] is name
+    assert len(pool) == 4
+
+
+def test_clear(pool: StringPool) -> None:
+    """Test that clearing resets the pool and its statistics."""
+    pool.intern("a")
+    pool.intern("a")
+    pool.clear()
+    assert (len(pool), pool.hits, pool.misses) == (0, 0, 0)
+
+
+def test_pool_shared_across_runs() -> None:
+    """Test that separate conversions in a run share the pooled strings."""
+    tag_pool.clear()
+    features = []
+    for _ in range(2):
+        props = {
+            "theme": "buildings",
+            "type": "building",
+            "version": 0,
+            "has_parts": False,
+            "sources": [{"property": "", "dataset": "OpenStreetMap", "confidence": 1}],
+        }
+        feature = {"type": "Feature", "geometry": None, "properties": props}
+        features += process_geojson({"features": [feature]}, process_building)[
+            "features"
+        ]
+    first, second = (feature["properties"] for feature in features)
+    assert first["source"] is second["source"]
+    assert tag_pool.hits > 0
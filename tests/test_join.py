@@ -0,0 +1,139 @@
+"""Test the join.py module."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from src.overturetoosm.join import (
+    BuildingIndex,
+    merge_addresses,
+    merge_points,
+    site_relations,
+)
+
+
+def square(x: float, y: float, size: float, **tags: str) -> Dict[str, Any]:
+    """Return a square building feature."""
+    ring = [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+        "properties": {"building": "yes", **tags},
+    }
+
+
+def point(x: float, y: float, **tags: str) -> Dict[str, Any]:
+    """Return a point feature."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [x, y]},
+        "properties": tags,
+    }
+
+
+@pytest.fixture(name="buildings")
+def buildings_fix() -> Dict[str, List[Dict[str, Any]]]:
+    """Fixture with a large building, a small one in it, and one with a hole."""
+    courtyard = square(0.01, 0.0, 0.003)
+    courtyard["geometry"]["coordinates"].append(
+        [[0.011, 0.001], [0.012, 0.001], [0.012, 0.002], [0.011, 0.002], [0.011, 0.001]]
+    )
+    return {
+        "features": [
+            square(0.0, 0.0, 0.004, name="Mall"),
+            square(0.001, 0.001, 0.001),
+            courtyard,
+        ]
+    }
+
+
+def test_building_at(buildings: Dict[str, Any]) -> None:
+    """Test finding the smallest building a point is in."""
+    index = BuildingIndex(buildings["features"])
+    assert index.building_at(0.0035, 0.0035) == 0
+    assert index.building_at(0.0015, 0.0015) == 1
+    assert index.building_at(0.0105, 0.0005) == 2
+    assert index.building_at(0.0115, 0.0015) is None
+    assert index.building_at(0.02, 0.02) is None
+
+
+def test_merge_points(buildings: Dict[str, Any]) -> None:
+    """Test merging only the points alone in their building."""
+    places = {
+        "features": [
+            point(0.0015, 0.0015, name="Cafe", amenity="cafe"),
+            point(0.0105, 0.0005, name="Shop", shop="books"),
+            point(0.0115, 0.0015, name="Kiosk"),
+            point(0.003, 0.003, name="Other", building="retail"),
+            point(0.0035, 0.0035, name="Another"),
+        ]
+    }
+    assert merge_points(places, buildings) == 2
+    assert [f["properties"]["name"] for f in places["features"]] == [
+        "Kiosk",
+        "Other",
+        "Another",
+    ]
+    assert buildings["features"][0]["properties"] == {"building": "yes", "name": "Mall"}
+    assert buildings["features"][1]["properties"] == {
+        "building": "yes",
+        "name": "Cafe",
+        "amenity": "cafe",
+    }
+
+
+def test_site_relations(buildings: Dict[str, Any]) -> None:
+    """Test relating each building to the points in it."""
+    buildings["features"][2]["id"] = 7
+    places = {
+        "features": [
+            point(0.0035, 0.0035),
+            point(0.0105, 0.0005),
+            point(0.003, 0.003),
+            point(0.05, 0.05),
+        ]
+    }
+    relations = site_relations(places, buildings, first_id=-5)
+    assert [f["id"] for f in places["features"]] == [-1, -2, -3, -4]
+    assert [r["id"] for r in relations] == [-5, -6]
+    assert [(m["type"], m["ref"]) for m in relations[0]["members"]] == [
+        ("way", -1),
+        ("node", -1),
+        ("node", -3),
+    ]
+    assert relations[1]["members"][0]["ref"] == 7
+    assert relations[1]["tags"] == {"type": "site"}
+
+    elements = {("node", f["id"]) for f in places["features"]}
+    elements.update(("way", f["id"]) for f in buildings["features"])
+    for relation in relations:
+        for member in relation["members"]:
+            assert (member["type"], member["ref"]) in elements
+
+
+def test_merge_addresses(buildings: Dict[str, Any]) -> None:
+    """Test the one-address, many-address, and no-building cases."""
+    main = {"addr:housenumber": "1", "addr:street": "Main St", "source": "x"}
+    addresses = {
+        "features": [
+            point(0.0015, 0.0015, **main),
+            point(0.0016, 0.0016, **main),
+            point(0.0035, 0.0035, **{"addr:housenumber": "2"}),
+            point(0.0036, 0.0036, **{"addr:housenumber": "3"}),
+            point(0.0105, 0.0005, **{"addr:housenumber": "4"}),
+            point(0.05, 0.05, **{"addr:housenumber": "5"}),
+        ]
+    }
+    buildings["features"][2]["properties"]["addr:housenumber"] = "6"
+    assert merge_addresses(addresses, buildings) == (2, 3, 1)
+    assert buildings["features"][1]["properties"] == {
+        "building": "yes",
+        "addr:housenumber": "1",
+        "addr:street": "Main St",
+    }
+    assert [f["properties"]["addr:housenumber"] for f in addresses["features"]] == [
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
@@ -0,0 +1,124 @@
+"""Test the linear.py module."""
+
+from typing import Any, Dict
+
+import pytest
+
+from src.overturetoosm.linear import (
+    cumulative_lengths,
+    cut,
+    split_geojson,
+    split_segment,
+)
+from src.overturetoosm.segments import SegmentProperties
+
+
+def rounded(line: list) -> list:
+    """Round a line's coordinates for comparison."""
+    return [[round(c, 9) for c in point] for point in line]
+
+
+@pytest.fixture(name="props_dict")
+def props_fix() -> Dict[str, Any]:
+    """Fixture with segment properties scoped to parts of the segment."""
+    return {
+        "id": "a",
+        "version": 0,
+        "subtype": "road",
+        "class": "primary",
+        "road_surface": [{"value": "paved"}],
+        "road_flags": [{"values": ["is_bridge"], "between": [0.25, 0.5]}],
+        "level_rules": [{"value": 1, "between": [0.25, 0.5]}],
+    }
+
+
+@pytest.fixture(name="coords")
+def coords_fix() -> list:
+    """Fixture with a straight line along the equator."""
+    return [[0.0, 0.0], [0.5, 0.0], [1.0, 0.0]]
+
+
+def test_cumulative_lengths(coords: list) -> None:
+    """Test the distance along the line at each vertex."""
+    lengths = cumulative_lengths(coords)
+    assert list(lengths) == pytest.approx([0, 55_660, 111_320])
+
+
+def test_cut(coords: list) -> None:
+    """Test that a line is cut at fractions of its length."""
+    lengths = cumulative_lengths(coords)
+    assert rounded(cut(coords, lengths, 0.25, 0.75)) == [
+        [0.25, 0.0],
+        [0.5, 0.0],
+        [0.75, 0.0],
+    ]
+    assert rounded(cut(coords, lengths, 0.0, 0.5)) == [[0.0, 0.0], [0.5, 0.0]]
+
+
+def test_split_segment(props_dict: dict, coords: list) -> None:
+    """Test that a segment is split where its tags change."""
+    ways = split_segment(SegmentProperties(**props_dict), coords)
+    assert [tags for _, tags in ways] == [
+        {"highway": "primary", "surface": "paved"},
+        {"highway": "primary", "bridge": "yes", "surface": "paved", "layer": "1"},
+        {"highway": "primary", "surface": "paved"},
+    ]
+    assert [rounded(way) for way, _ in ways] == [
+        [[0.0, 0.0], [0.25, 0.0]],
+        [[0.25, 0.0], [0.5, 0.0]],
+        [[0.5, 0.0], [1.0, 0.0]],
+    ]
+
+
+def test_split_segment_joins_equal_tags(props_dict: dict, coords: list) -> None:
+    """Test that pieces with the same tags are not split."""
+    props_dict["road_flags"] = [{"values": ["is_link"], "between": [0.25, 0.5]}]
+    props_dict["class"] = "residential"
+    props_dict.pop("level_rules")
+    ways = split_segment(SegmentProperties(**props_dict), coords)
+    assert ways == [(coords, {"highway": "residential", "surface": "paved"})]
+
+
+def test_split_geojson(props_dict: dict, coords: list) -> None:
+    """Test that a GeoJSON feature becomes one feature per way."""
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": coords},
+                "properties": props_dict,
+            }
+        ],
+    }
+    features = split_geojson(geojson)["features"]
+    assert len(features) == 3
+    assert features[1]["properties"]["bridge"] == "yes"
+
+
+def test_split_geojson_ids(props_dict: dict, coords: list) -> None:
+    """Test that the pieces of a split feature get their own ids."""
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "id": "a",
+                "geometry": {"type": "LineString", "coordinates": coords},
+                "properties": props_dict,
+            },
+            {
+                "type": "Feature",
+                "id": "b",
+                "geometry": {"type": "LineString", "coordinates": coords},
+                "properties": {
+                    **props_dict,
+                    "id": "b",
+                    "road_flags": None,
+                    "level_rules": None,
+                },
+            },
+        ],
+    }
+    features = split_geojson(geojson)["features"]
+    assert [feature["id"] for feature in features] == ["a:1", "a:2", "a:3", "b"]
@@ -0,0 +1,68 @@
+"""Test the merge.py module."""
+
+from copy import deepcopy
+from typing import Any, Dict, List
+
+import pytest
+
+from src.overturetoosm.merge import is_directional, merge_geojson
+
+
+def segment(
+    id_: str, coords: List[List[float]], connectors: List[str], road: str = "primary"
+) -> Dict[str, Any]:
+    """Return a segment feature running between two connectors."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "LineString", "coordinates": coords},
+        "properties": {
+            "id": id_,
+            "version": 0,
+            "subtype": "road",
+            "class": road,
+            "connectors": [
+                {"connector_id": connectors[0], "at": 0},
+                {"connector_id": connectors[1], "at": 1},
+            ],
+        },
+    }
+
+
+@pytest.fixture(name="geojson")
+def geojson_fix() -> Dict[str, Any]:
+    """Fixture with a chain of roads, one drawn backwards, and a junction."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            segment("b", [[1, 0], [2, 0]], ["c2", "c3"]),
+            segment("a", [[0, 0], [1, 0]], ["c1", "c2"]),
+            segment("c", [[3, 0], [2, 0]], ["c4", "c3"]),
+            segment("d", [[3, 0], [4, 0]], ["c4", "c5"], road="secondary"),
+            segment("e", [[4, 0], [5, 0]], ["c5", "c6"], road="secondary"),
+            segment("f", [[4, 0], [4, 1]], ["c5", "c7"], road="secondary"),
+        ],
+    }
+
+
+def test_merge(geojson: Dict[str, Any]) -> None:
+    """Test that only degree-2 connectors with the same tags on both sides join."""
+    merged = merge_geojson(geojson)
+    assert [f["geometry"]["coordinates"] for f in merged["features"]] == [
+        [[0, 0], [1, 0], [2, 0], [3, 0]],
+        [[3, 0], [4, 0]],
+        [[4, 0], [5, 0]],
+        [[4, 0], [4, 1]],
+    ]
+    assert merged["features"][0]["properties"] == {"highway": "primary"}
+
+
+def test_merge_deterministic(geojson: Dict[str, Any]) -> None:
+    """Test that merging the same input twice gives the same output."""
+    assert merge_geojson(deepcopy(geojson)) == merge_geojson(deepcopy(geojson))
+
+
+def test_is_directional() -> None:
+    """Test which tags prevent reversing a way."""
+    assert is_directional({"highway": "primary", "oneway": "yes"})
+    assert is_directional({"maxspeed:forward": "50"})
+    assert not is_directional({"highway": "primary", "maxspeed": "50"})
@@ -1,8 +1,11 @@
 """Test miscelaneous functions in the project."""
 
 import json
+import subprocess
+import sys
 import pytest
 from src.overturetoosm import objects, segments
+from src.overturetoosm.utils import quantize_coordinates, quantize_geometry
 
 
 @pytest.fixture(name="props_dict")
@@ -61,3 +64,48 @@ def test_objects(type) -> None:
 
         for feature in data["features"]:
             type[1](**feature["properties"])
+
+
+def test_lazy_import() -> None:
+    """Test that importing the package doesn't build the submodules' models."""
+    code = (
+        "import sys, src.overturetoosm as o; "
+        "assert 'src.overturetoosm.segments' not in sys.modules; "
+        "o.process_address; "
+        "assert 'src.overturetoosm.segments' not in sys.modules; "
+        "assert o.segments.SegmentProperties"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_quantize_coordinates() -> None:
+    """Test rounding coordinates of each nesting depth."""
+    assert quantize_coordinates([-71.123456789, 42.5]) == [-71.1234568, 42.5]
+    assert quantize_coordinates([[1.23456, 2.5], [3.0, 4.04]], 1) == [
+        [1.2, 2.5],
+        [3.0, 4.0],
+    ]
+    assert quantize_coordinates([[[[0.123, 0.456, 10.789]]]], 2) == [
+        [[[0.12, 0.46, 10.79]]]
+    ]
+    assert quantize_coordinates([[0.123, 0.456, 1], [0.789, 0.1]], 1) == [
+        [0.1, 0.5, 1.0],
+        [0.8, 0.1],
+    ]
+
+
+def test_quantize_coordinates_fixed_point() -> None:
+    """Test that values are rounded after scaling them to fixed point."""
+    assert quantize_coordinates([2.675, -96.88804505], 2) == [2.68, -96.89]
+    assert quantize_coordinates([-96.88804505, 0.0]) == [-96.888045, 0.0]
+
+
+def test_quantize_geometry() -> None:
+    """Test rounding a geometry collection in place."""
+    geometry = {
+        "type": "GeometryCollection",
+        "geometries": [{"type": "Point", "coordinates": [0.123456789, 1]}],
+    }
+    assert quantize_geometry(geometry, 3) is geometry
+    assert geometry["geometries"][0]["coordinates"] == [0.123, 1.0]
+    assert quantize_geometry(None) is None
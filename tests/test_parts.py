@@ -0,0 +1,38 @@
+"""Test the parts.py module."""
+
+from src.overturetoosm.parts import PartIndex
+
+GERS = "08b2a100d2c9bfff0200a8e2a4d1bd0d"
+
+
+def test_part_index() -> None:
+    """Test relating buildings, streamed in any order, to their parts."""
+    parts = PartIndex()
+    parts.add_properties(-10, {"building_id": GERS})
+    parts.add_properties(-11, {"building_id": "b2"})
+    parts.add_properties(-12, {"building_id": GERS})
+    parts.add_properties(-13, {"building_id": None})
+    assert len(parts) == 2
+    assert list(parts.parts(GERS)) == [-10, -12]
+    assert list(parts.parts("b3")) == []
+
+    buildings = [("b3", -3), ("b2", -2), (GERS, -1)]
+    relations = list(parts.relations(buildings, first_id=-5))
+    assert [r["id"] for r in relations] == [-5, -6]
+    assert relations[1]["members"] == [
+        {"type": "way", "ref": -1, "role": "outline"},
+        {"type": "way", "ref": -10, "role": "part"},
+        {"type": "way", "ref": -12, "role": "part"},
+    ]
+    assert relations[0]["tags"] == {"type": "building"}
+
+
+def test_part_index_kept() -> None:
+    """Test leaving out the ways that weren't kept."""
+    parts = PartIndex()
+    parts.add("b1", -10)
+    parts.add("b1", -11)
+    parts.add("b2", -12)
+    relations = list(parts.relations([("b1", -1), ("b2", -2)], kept={-1, -2, -11}))
+    assert len(relations) == 1
+    assert [m["ref"] for m in relations[0]["members"]] == [-1, -11]
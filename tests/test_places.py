@@ -8,6 +8,7 @@ import pytest
 
 from src.overturetoosm.objects import ConfidenceError, UnmatchedError
 from src.overturetoosm.places import process_place
+from src.overturetoosm.resources import places_tags
 from src.overturetoosm.utils import process_geojson
 
 
@@ -269,3 +270,24 @@ def test_place_geojson_ignore(geojson_dict, clean_dict: dict) -> None:
             }
         ],
     }
+
+
+def test_unmatched_alternate(props_dict, clean_dict: dict) -> None:
+    """Test that a matching alternate category is used for an unmatched category."""
+    props_dict["categories"] = {"main": "invalid_category", "alternate": ["cafe"]}
+    for i in ["office", "lawyer"]:
+        clean_dict.pop(i, None)
+    clean_dict["amenity"] = "cafe"
+    assert process_place(props_dict, unmatched="error") == clean_dict
+
+
+def test_places_tags_read_only(props_dict) -> None:
+    """Test that the shared tag table can't be changed through a converted place."""
+    with pytest.raises(TypeError):
+        places_tags["notary_public"]["office"] = "notary"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        places_tags["notary_public"] = {}  # type: ignore[index]
+
+    new_props = process_place(props_dict)
+    new_props["office"] = "notary"
+    assert places_tags["notary_public"]["office"] == "lawyer"
@@ -0,0 +1,51 @@
+"""Test the resources.py module."""
+
+import json
+
+import pytest
+
+from src.overturetoosm.resources import TagTable, places_tags
+
+
+@pytest.fixture(name="table")
+def table_fix(tmp_path) -> TagTable:
+    """Fixture with a small tag table."""
+    path = tmp_path / "tags.tsv"
+    path.write_text(
+        "bar\tamenity=bar\ncafe\tamenity=cafe\ncocktail_bar\tamenity=bar\t"
+        "drink:cocktail=yes",
+        encoding="utf-8",
+    )
+    return TagTable(str(path))
+
+
+def test_table_lazy(table: TagTable) -> None:
+    """Test that nothing is read before the first lookup."""
+    assert table._data is None
+    assert table["cafe"] == {"amenity": "cafe"}
+    assert table._data is not None
+
+
+def test_table_lookup(table: TagTable) -> None:
+    """Test lookups of present and missing categories."""
+    assert table["cocktail_bar"] == {"amenity": "bar", "drink:cocktail": "yes"}
+    assert table.get("bar") == {"amenity": "bar"}
+    assert table.get("aaa") is None
+    assert "zzz" not in table
+    with pytest.raises(KeyError):
+        table["beer_bar"]
+
+
+def test_table_mapping(table: TagTable) -> None:
+    """Test the rest of the mapping interface."""
+    assert list(table) == ["bar", "cafe", "cocktail_bar"]
+    assert len(table) == 3
+    assert dict(table.items())["bar"] == {"amenity": "bar"}
+
+
+def test_places_tags_match_json() -> None:
+    """Test that the packaged table matches `scripts/tags.json`."""
+    with open("scripts/tags.json", "r", encoding="utf-8") as f:
+        tags = {k: v for k, v in json.load(f).items() if v}
+    assert len(places_tags) == len(tags)
+    assert {k: dict(v) for k, v in places_tags.items()} == tags
@@ -0,0 +1,172 @@
+"""Test the restrictions.py module."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.overturetoosm.restrictions import (
+    ElementIndex,
+    UnresolvedReferenceError,
+    process_restrictions,
+    turn_type,
+    via_nodes,
+)
+
+
+def segment(
+    id_: str,
+    coords: List[List[float]],
+    connectors: List[str],
+    transitions: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Return a segment feature running between two connectors."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "LineString", "coordinates": coords},
+        "properties": {
+            "id": id_,
+            "version": 0,
+            "subtype": "road",
+            "class": "residential",
+            "connectors": [
+                {"connector_id": connectors[0], "at": 0},
+                {"connector_id": connectors[1], "at": 1},
+            ],
+            "prohibited_transitions": transitions,
+        },
+    }
+
+
+def transition(
+    *steps: str, final_heading: str = "forward", **when: Any
+) -> Dict[str, Any]:
+    """Return a prohibited transition through pairs of connector and segment ids."""
+    sequence = [
+        {"connector_id": c, "segment_id": s} for c, s in zip(steps[::2], steps[1::2])
+    ]
+    return {"sequence": sequence, "final_heading": final_heading, "when": when}
+
+
+@pytest.fixture(name="geojson")
+def geojson_fix() -> Dict[str, Any]:
+    """Fixture with a road heading east, then roads heading north and south."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            segment("east", [[0, 0], [1, 0]], ["c1", "c2"]),
+            segment("north", [[1, 0], [1, 1]], ["c2", "c3"]),
+            segment("south", [[1, -1], [1, 0]], ["c4", "c2"]),
+            segment("beyond", [[1, 1], [1, 2]], ["c3", "c5"]),
+        ],
+    }
+
+
+def test_turn_type() -> None:
+    """Test the names of turns."""
+    assert [turn_type(a) for a in (0, 90, -90, 180, -170)] == [
+        "straight_on",
+        "right_turn",
+        "left_turn",
+        "u_turn",
+        "u_turn",
+    ]
+
+
+def test_via_node(geojson: Dict[str, Any]) -> None:
+    """Test restrictions through a connector, including a reversed `to` way."""
+    geojson["features"][0]["properties"]["prohibited_transitions"] = [
+        transition("c2", "north", heading="forward"),
+        transition(
+            "c2",
+            "south",
+            final_heading="backward",
+            mode=["truck"],
+            during="Mo-Fr 07:00-09:00",
+        ),
+        transition("c2", "east", final_heading="backward"),
+    ]
+    relations = process_restrictions(geojson)
+    assert [r["id"] for r in relations] == [-1, -2, -3]
+    assert relations[0]["members"] == [
+        {"type": "way", "ref": -1, "role": "from"},
+        {"type": "node", "ref": -2, "role": "via"},
+        {"type": "way", "ref": -2, "role": "to"},
+    ]
+    assert [r["tags"] for r in relations] == [
+        {"type": "restriction", "restriction": "no_left_turn"},
+        {
+            "type": "restriction",
+            "restriction:hgv:conditional": "no_right_turn @ (Mo-Fr 07:00-09:00)",
+        },
+        {"type": "restriction", "restriction": "no_u_turn"},
+    ]
+
+
+def test_headings(geojson: Dict[str, Any]) -> None:
+    """Test that transitions heading away from the via element are skipped."""
+    geojson["features"][0]["properties"]["prohibited_transitions"] = [
+        transition("c2", "north", heading="backward"),
+        transition("c2", "south"),
+        transition("c2", "north", heading="forward"),
+    ]
+    (relation,) = process_restrictions(geojson)
+    assert relation["members"][-1]["ref"] == -2
+
+
+def test_via_nodes(geojson: Dict[str, Any]) -> None:
+    """Test that every node a relation refers to is written where it lies."""
+    geojson["features"][0]["properties"]["prohibited_transitions"] = [
+        transition("c2", "north"),
+        transition("c2", "north", "c3", "beyond"),
+    ]
+    geojson["features"][1]["properties"]["prohibited_transitions"] = [
+        transition("c3", "beyond", heading="forward")
+    ]
+    index = ElementIndex.from_geojson(geojson)
+    relations = process_restrictions(geojson, index)
+    nodes = via_nodes(geojson, relations, index)
+    assert [(n["id"], n["lon"], n["lat"]) for n in nodes] == [
+        (-3, 1.0, 1.0),
+        (-2, 1.0, 0.0),
+    ]
+    ids = {("node", n["id"]) for n in nodes}
+    assert all(
+        (m["type"], m["ref"]) in ids
+        for relation in relations
+        for m in relation["members"]
+        if m["type"] == "node"
+    )
+
+
+def test_via_way(geojson: Dict[str, Any]) -> None:
+    """Test a restriction through an intermediate segment."""
+    geojson["features"][0]["properties"]["prohibited_transitions"] = [
+        transition("c2", "north", "c3", "beyond")
+    ]
+    (relation,) = process_restrictions(geojson)
+    assert relation["members"] == [
+        {"type": "way", "ref": -1, "role": "from"},
+        {"type": "way", "ref": -2, "role": "via"},
+        {"type": "way", "ref": -4, "role": "to"},
+    ]
+    assert relation["tags"]["restriction"] == "no_straight_on"
+
+
+def test_unresolved(geojson: Dict[str, Any]) -> None:
+    """Test that every unresolved reference is reported together."""
+    geojson["features"][0]["properties"]["prohibited_transitions"] = [
+        transition("c2", "north"),
+        transition("c9", "missing"),
+    ]
+    geojson["features"][1]["properties"]["prohibited_transitions"] = [
+        transition("c2", "gone")
+    ]
+    index = ElementIndex.from_geojson(geojson)
+    with pytest.raises(UnresolvedReferenceError) as err:
+        process_restrictions(geojson, index)
+    assert err.value.references == [
+        ("east", "connector", "c9"),
+        ("east", "segment", "missing"),
+        ("north", "segment", "gone"),
+    ]
+    assert len(process_restrictions(geojson, index, unresolved="ignore")) == 1
@@ -0,0 +1,36 @@
+"""Test the routes.py module."""
+
+from src.overturetoosm.routes import RouteAggregator
+
+I95 = {"name": None, "network": "US:I", "ref": "95", "wikidata": "Q400"}
+US1 = {"name": None, "network": "US:US", "ref": "1"}
+
+
+def test_route_aggregator() -> None:
+    """Test that ways are grouped into one relation per route."""
+    routes = RouteAggregator()
+    routes.add_properties(-1, {"subtype": "road", "routes": [I95, US1, I95]})
+    routes.add_properties(-2, {"subtype": "road", "routes": [I95]})
+    routes.add_properties(-3, {"subtype": "road", "routes": None})
+    routes.add_properties(-4, {"subtype": "rail", "routes": [{"ref": "95"}]})
+    assert len(routes) == 3
+
+    relations = list(routes.relations(first_id=-10))
+    assert [r["id"] for r in relations] == [-10, -11, -12]
+    assert relations[0]["tags"] == {
+        "type": "route",
+        "route": "road",
+        "network": "US:I",
+        "ref": "95",
+        "wikidata": "Q400",
+    }
+    assert [m["ref"] for m in relations[0]["members"]] == [-1, -2]
+    assert [m["ref"] for m in relations[1]["members"]] == [-1]
+    assert relations[2]["tags"] == {"type": "route", "route": "railway", "ref": "95"}
+
+
+def test_route_aggregator_skips_blank() -> None:
+    """Test that routes without a name, network, or ref are skipped."""
+    routes = RouteAggregator()
+    routes.add(-1, [{"name": None, "network": None, "ref": ""}])
+    assert list(routes.relations()) == []
@@ -1,14 +1,29 @@
 """Test the segments.py module."""
 
+import subprocess
+import sys
 from typing import Any, Dict
 
 import pytest
 from pydantic import ValidationError
 
-from src.overturetoosm.segments import SegmentProperties
+from src.overturetoosm.segments import SegmentProperties, process_segment
 from src.overturetoosm.objects import ConfidenceError
 
 
+@pytest.fixture(name="clean_dict")
+def clean_fix() -> Dict[str, Any]:
+    """Fixture with the converted segment properties."""
+    return {
+        "highway": "secondary",
+        "surface": "paved",
+        "layer": "3",
+        "maxspeed": "25 mph",
+        "name": "South Arlington Ridge Road",
+        "source": "OpenStreetMap via overturetoosm",
+    }
+
+
 @pytest.fixture(name="props_dict")
 def props_fix() -> Dict[str, Any]:
     """Fixture with the clean segment properties."""
@@ -80,3 +95,82 @@ def test_segment_props_no_id(props_dict: dict, remove_key: str) -> None:
 #     props_dict.pop("class", None)
 #     new_props = SegmentProperties(**props_dict).model_dump(exclude_none=True)
 #     assert isinstance(new_props, dict)
+
+
+@pytest.mark.parametrize(
+    "subtype, class_", [("road", "subway"), ("rail", "motorway"), ("water", "path")]
+)
+def test_segment_class_subtype(props_dict: dict, subtype: str, class_: str) -> None:
+    """Test that a segment's class must belong to its subtype."""
+    props_dict.update({"subtype": subtype, "class": class_})
+    with pytest.raises(ValidationError):
+        SegmentProperties(**props_dict)
+
+
+def test_segment_schema_deferred() -> None:
+    """Test that the segment schemas are built on first validation, not import."""
+    code = (
+        "from src.overturetoosm.segments import SegmentProperties, When; "
+        "assert not SegmentProperties.__pydantic_complete__; "
+        "assert not When.__pydantic_complete__; "
+        "SegmentProperties(id='a', version=0, subtype='road'); "
+        "assert SegmentProperties.__pydantic_complete__"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_process_segment(props_dict: dict, clean_dict: dict) -> None:
+    """Test that a segment is converted to OSM tags."""
+    assert process_segment(props_dict) == clean_dict
+
+
+def test_process_segment_flags(props_dict: dict, clean_dict: dict) -> None:
+    """Test that whole-segment road flags are converted and partial ones skipped."""
+    props_dict["road_flags"] = [
+        {"values": ["is_link", "is_bridge"], "between": [0, 1]},
+        {"values": ["is_tunnel"], "between": [0.2, 0.4]},
+    ]
+    clean_dict.update({"highway": "secondary_link", "bridge": "yes"})
+    assert process_segment(props_dict) == clean_dict
+
+
+def test_process_segment_speeds(props_dict: dict, clean_dict: dict) -> None:
+    """Test that the whole-segment minimum and maximum speeds are converted."""
+    props_dict["speed_limits"].append(
+        {
+            "min_speed": {"value": 40, "unit": "km/h"},
+            "max_speed": {"value": 90},
+            "between": [0, 1],
+        }
+    )
+    props_dict["speed_limits"].append(
+        {"max_speed": {"value": 50, "unit": "km/h"}, "between": [0.5, 1]}
+    )
+    clean_dict.update({"maxspeed": "90", "minspeed": "40"})
+    assert process_segment(props_dict) == clean_dict
+
+
+def test_process_segment_construction(props_dict: dict, clean_dict: dict) -> None:
+    """Test that segments under construction keep their class."""
+    props_dict["road_flags"] = [{"values": ["is_under_construction"]}]
+    clean_dict.update({"highway": "construction", "construction": "secondary"})
+    assert process_segment(props_dict) == clean_dict
+
+
+@pytest.mark.parametrize(
+    "subtype, class_, subclass, tags",
+    [
+        ("road", "footway", "sidewalk", {"highway": "footway", "footway": "sidewalk"}),
+        ("road", "motorway", "link", {"highway": "motorway_link"}),
+        ("road", None, None, {"highway": "road"}),
+        ("rail", "subway", None, {"railway": "subway"}),
+        ("rail", None, None, {"railway": "rail"}),
+        ("water", None, None, {"route": "ferry"}),
+    ],
+)
+def test_process_segment_class(subtype, class_, subclass, tags) -> None:
+    """Test the subtype, class and subclass lookup tables."""
+    props = {"id": "a", "version": 0, "subtype": subtype, "class": class_}
+    if subclass:
+        props["subclass"] = subclass
+    assert process_segment(props) == tags
@@ -0,0 +1,124 @@
+"""Test the spatial.py module."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from src.overturetoosm.spatial import (
+    BOUNDARY,
+    GridIndex,
+    INSIDE,
+    OUTSIDE,
+    PreparedPolygon,
+    clip_geometry,
+    feature_envelope,
+    filter_geojson,
+)
+
+
+def point(x: float, y: float, **extra: Any) -> Dict[str, Any]:
+    """Return a point feature."""
+    return {"geometry": {"type": "Point", "coordinates": [x, y]}, **extra}
+
+
+@pytest.fixture(name="polygon")
+def polygon_fix() -> PreparedPolygon:
+    """Fixture with a U-shaped polygon with a square hole in its base."""
+    outer = [
+        [0, 0],
+        [10, 0],
+        [10, 10],
+        [7, 10],
+        [7, 3],
+        [3, 3],
+        [3, 10],
+        [0, 10],
+        [0, 0],
+    ]
+    hole = [[4, 1], [6, 1], [6, 2], [4, 2], [4, 1]]
+    return PreparedPolygon({"type": "Polygon", "coordinates": [outer, hole]}, size=10)
+
+
+def test_contains(polygon: PreparedPolygon) -> None:
+    """Test points inside, outside, and in the hole and the notch."""
+    assert polygon.contains(1, 9)
+    assert polygon.contains(8.5, 0.5)
+    assert not polygon.contains(5, 1.5)
+    assert not polygon.contains(5, 8)
+    assert not polygon.contains(11, 5)
+
+
+def test_classify(polygon: PreparedPolygon) -> None:
+    """Test classifying envelopes with the grid."""
+    assert polygon.classify((1.1, 5.1, 1.9, 8.9)) == INSIDE
+    assert polygon.classify((4.1, 5.1, 5.9, 8.9)) == OUTSIDE
+    assert polygon.classify((20, 20, 30, 30)) == OUTSIDE
+    assert polygon.classify((2, 5, 4, 6)) == BOUNDARY
+    assert polygon.classify((-1, 5, 0.5, 6)) == BOUNDARY
+
+
+def test_feature_envelope() -> None:
+    """Test each source of a feature's envelope."""
+    line = {"type": "LineString", "coordinates": [[1, 5], [3, 2]]}
+    assert feature_envelope({"geometry": line}) == (1, 2, 3, 5)
+    assert feature_envelope({"bbox": [0, 0, 1, 1], "geometry": line}) == (0, 0, 1, 1)
+    bbox = {"xmin": 0, "xmax": 2, "ymin": 1, "ymax": 3}
+    assert feature_envelope({"properties": {"bbox": bbox}}) == (0, 1, 2, 3)
+    assert feature_envelope({"geometry": None}) is None
+
+
+def test_filter_geojson(polygon: PreparedPolygon) -> None:
+    """Test filtering by bounding box and polygon together."""
+    features: List[Dict[str, Any]] = [
+        point(1, 1, id=1),
+        point(5, 1.5, id=2),
+        point(8, 8, id=3),
+        point(1, 9, id=4),
+        {"id": 5, "geometry": {"type": "LineString", "coordinates": [[5, 5], [8, 5]]}},
+    ]
+    geojson = filter_geojson({"features": features}, bbox=(0, 0, 9, 6), clip=polygon)
+    assert [f["id"] for f in geojson["features"]] == [1, 5]
+
+
+def test_intersects_without_vertices_inside() -> None:
+    """Test features on the boundary with none of their vertices inside."""
+    square = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+    clip = PreparedPolygon({"type": "Polygon", "coordinates": [square]}, size=4)
+    crossing = {"type": "LineString", "coordinates": [[-1, 2], [5, 2]]}
+    passing = {"type": "LineString", "coordinates": [[-1, 3.5], [0.5, 5]]}
+    cover = [[-1, -1], [5, -1], [5, 5], [-1, 5], [-1, -1]]
+    holed = [cover, [[-0.5, -0.5], [4.5, -0.5], [4.5, 4.5], [-0.5, 4.5], [-0.5, -0.5]]]
+    assert clip.intersects({"geometry": crossing})
+    assert not clip.intersects({"geometry": passing})
+    assert clip.intersects({"geometry": {"type": "Polygon", "coordinates": [cover]}})
+    assert not clip.intersects({"geometry": {"type": "Polygon", "coordinates": holed}})
+
+
+def test_clip_geometry() -> None:
+    """Test collecting the polygons of a feature collection."""
+    square = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": square}},
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0, 0]}},
+        ],
+    }
+    assert clip_geometry(geojson) == {"type": "MultiPolygon", "coordinates": [square]}
+    with pytest.raises(ValueError):
+        clip_geometry({"type": "Point", "coordinates": [0, 0]})
+
+
+def test_grid_index() -> None:
+    """Test querying a grid index before and after more items are inserted."""
+    index = GridIndex(cell_size=1.0)
+    assert index.insert((0.5, 0.5, 0.5, 0.5)) == 0
+    index.insert((-1.5, -1.5, 2.5, 0.2))
+    index.insert((5, 5, 5, 5))
+    assert index.query((0, 0, 1, 1)) == [0, 1]
+    assert index.query((4, 4, 6, 6)) == [2]
+    assert index.query((2.6, 2.6, 3, 3)) == []
+    index.insert((0.9, 0.9, 1.1, 1.1))
+    assert index.query((0, 0, 1, 1)) == [0, 1, 3]
+    assert index.envelope(2) == (5, 5, 5, 5)
+    assert len(index) == 4
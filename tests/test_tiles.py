@@ -0,0 +1,53 @@
+"""Test the tiles.py module."""
+
+import json
+from typing import Any, Dict
+
+from src.overturetoosm.tiles import TileWriter, quadkey, tile_of
+
+
+def point(lon: float, lat: float, number: int) -> Dict[str, Any]:
+    """Return a point feature."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": {"ref": str(number)},
+    }
+
+
+def test_tile_of() -> None:
+    """Test finding tiles and their quadkeys."""
+    assert tile_of(0, 0, 0) == (0, 0)
+    assert tile_of(-71.05, 42.35, 14) == (4958, 6060)
+    assert tile_of(180, -90, 2) == (3, 3)
+    assert quadkey(3, 5, 3) == "213"
+    assert quadkey(0, 0, 0) == ""
+
+
+def test_tile_writer(tmp_path) -> None:
+    """Test writing tiles with fewer open files than tiles."""
+    locations = [(-100, 40), (100, 40), (-100, -40), (-100, 41), (100, -40)]
+    with TileWriter(str(tmp_path), zoom=1, max_open=2) as writer:
+        for number, (lon, lat) in enumerate(locations):
+            writer.write(point(lon, lat, number))
+        writer.write({"type": "Feature", "geometry": None, "properties": {}})
+    assert writer.skipped == 1
+
+    tile = json.loads((tmp_path / "1" / "0" / "0.geojson").read_text())
+    assert [f["properties"]["ref"] for f in tile["features"]] == ["0", "3"]
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["features"] == 5
+    assert [(t["x"], t["y"], t["features"]) for t in manifest["tiles"]] == [
+        (0, 0, 2),
+        (0, 1, 1),
+        (1, 0, 1),
+        (1, 1, 1),
+    ]
+    assert manifest["tiles"][1]["quadkey"] == "2"
+
+
+def test_tile_writer_quadkey(tmp_path) -> None:
+    """Test naming tiles by quadkey."""
+    with TileWriter(str(tmp_path), zoom=2, naming="quadkey") as writer:
+        writer.write(point(-100, 40, 0))
+    assert json.loads((tmp_path / "02.geojson").read_text())["features"]
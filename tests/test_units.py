@@ -0,0 +1,54 @@
+"""Test the units.py module."""
+
+from src.overturetoosm.units import (
+    format_length,
+    format_speed,
+    format_weight,
+    normalise_dimension,
+    normalise_lengths,
+    normalise_speeds,
+    normalise_weights,
+)
+
+
+def test_normalise_speeds() -> None:
+    """Test that only miles per hour get a unit."""
+    assert normalise_speeds([25, 50, 30, 25], ["mph", "km/h", None, "mph"]) == [
+        "25 mph",
+        "50",
+        "30",
+        "25 mph",
+    ]
+
+
+def test_normalise_lengths() -> None:
+    """Test that feet and inches keep their form and the rest become meters."""
+    assert normalise_lengths(
+        [12.5, 150, 3.5, 0.5, 250], ["ft", "in", None, "km", "cm"]
+    ) == ["12'6\"", "12'6\"", "3.5", "500", "2.5"]
+
+
+def test_normalise_weights() -> None:
+    """Test that pounds and short tons keep their unit and the rest become tonnes."""
+    assert normalise_weights([8000, 10, 7500, 3], ["lb", "st", "kg", "lt"]) == [
+        "8000 lbs",
+        "10 st",
+        "7.5",
+        "3.05",
+    ]
+
+
+def test_normalise_dimension() -> None:
+    """Test formatting a single vehicle dimension."""
+    assert normalise_dimension("axle_count", 3, None) == "3"
+    assert normalise_dimension("height", 13, "ft") == "13'0\""
+    assert normalise_dimension("weight", 2000, "kg") == "2"
+
+
+def test_format_matches_columns() -> None:
+    """Test that the single-value formatters agree with the column functions."""
+    assert format_speed(25, "mph") == "25 mph"
+    assert format_speed(30) == "30"
+    assert format_length(150, "in") == "12'6\""
+    assert format_length(0.5, "km") == "500"
+    assert format_weight(7500, "kg") == normalise_weights([7500], ["kg"])[0]